@@ -0,0 +1,333 @@
+"""
+Benchmarks of the client hot paths, against the in-process emulator (``testrail_api.testing``).
+
+Usage::
+
+    python benchmarks/suite.py                   # run and print the results
+    python benchmarks/suite.py -k bulk --quick   # only the matching benchmarks, a single round
+    python benchmarks/suite.py --save            # store benchmarks/results/<version>.json
+    python benchmarks/suite.py --compare         # exit 1 on a regression from benchmarks/results/baseline.json
+    python benchmarks/suite.py --compare benchmarks/results/1.0.0.json  # or from another stored run
+
+Every benchmark is run ``--rounds`` times and its median is kept.
+The stored results of the releases show the regressions between them. The timings depend on the machine:
+to compare on another one, first store its own baseline with ``--save benchmarks/results/baseline.json``
+on the commit to compare with.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import requests
+
+import testrail_api
+from testrail_api import ResultStatus, TestRailAPI
+from testrail_api._convert import convert_json
+from testrail_api._session import Session
+from testrail_api.testing import Emulator
+
+RESULTS = Path(__file__).parent / "results"
+BASELINE = RESULTS / "baseline.json"
+
+CASES = 5000
+RESULTS_COUNT = 10_000
+ATTACHMENT_SIZE = 8 * 2**20
+PAGE_LATENCY = 0.01
+
+GET_PARAMS = {
+    "suite_id": 1,
+    "section_id": 2,
+    "type_id": [1, 2, 3],
+    "priority_id": {4, 3},
+    "created_after": datetime(2024, 1, 1, tzinfo=timezone.utc),
+    "is_completed": True,
+    "milestone_id": None,
+}
+
+
+class Measure(NamedTuple):
+    """A benchmark result, ``higher`` when a higher value is better (throughputs)."""
+
+    value: float
+    unit: str
+    higher: bool = False
+
+
+BENCHMARKS: dict[str, Callable[[argparse.Namespace], dict[str, Measure]]] = {}
+
+
+def benchmark(func: Callable[[argparse.Namespace], dict[str, Measure]]) -> Callable[..., Any]:
+    """Register a benchmark, it returns its measures by name."""
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+def per_call(func: Callable[[], Any], number: int) -> float:
+    """Microseconds per call of ``func``."""
+    start = time.perf_counter()
+    for _ in range(number):
+        func()
+    return (time.perf_counter() - start) / number * 1e6
+
+
+@contextmanager
+def emulated(emulator: Emulator, **kwargs: Any) -> Iterator[TestRailAPI]:
+    """Serve the emulator and yield a client connected to it."""
+    with (
+        emulator.serve() as url,
+        TestRailAPI(url, emulator.email, emulator.password, warn_ignore=True, **kwargs) as api,
+    ):
+        yield api
+
+
+def populate(emulator: Emulator, cases: int) -> dict[str, Any]:
+    """Add a project with ``cases`` cases, return the project."""
+    project = emulator.add("projects", name="Benchmark")
+    suite = emulator.add("suites", project_id=project["id"], name="Suite")
+    section = emulator.add("sections", project_id=project["id"], suite_id=suite["id"], name="Section")
+    for number in range(cases):
+        emulator.add(
+            "cases",
+            project_id=project["id"],
+            suite_id=suite["id"],
+            section_id=section["id"],
+            title=f"Case {number}",
+            type_id=3,
+            priority_id=2,
+            refs=f"JIRA-{number}",
+        )
+    return project
+
+
+@benchmark
+def convert_params(options: argparse.Namespace) -> dict[str, Measure]:
+    """Convert the parameters of a GET and encode the JSON body of a POST."""
+    session = Session("https://example.testrail.com", "example@mail.com", "password")
+    results = [
+        {"case_id": case_id, "status_id": ResultStatus.PASSED, "comment": "ok", "elapsed": "1s", "version": "1.0"}
+        for case_id in range(100)
+    ]
+    number = 2000 if options.quick else 20000
+    return {
+        "get": Measure(per_call(lambda: session._prepare("get_cases/1", {"params": dict(GET_PARAMS)}), number), "us"),
+        "post_100_results": Measure(
+            per_call(lambda: session._prepare("add_results_for_cases/1", {"json": {"results": results}}), number // 20),
+            "us",
+        ),
+    }
+
+
+def legacy_convert_json(value: Any) -> Any:
+    """Baseline of ``convert_body``: the recursive ``isinstance`` converter replaced by the dispatch table."""
+    if isinstance(value, Enum):
+        return legacy_convert_json(value.value)
+    if isinstance(value, datetime):
+        return round(value.timestamp())
+    if isinstance(value, dict):
+        return {key: legacy_convert_json(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [legacy_convert_json(item) for item in value]
+    return value
+
+
+@benchmark
+def convert_body(options: argparse.Namespace) -> dict[str, Measure]:
+    """
+    Convert a body of 10k results: plain values only, with enums and datetimes, and with timedeltas too.
+
+    The ``*_baseline`` measures run the former recursive converter on the same bodies;
+    it has no timedelta support, so ``timedelta`` has no baseline.
+    """
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    plain = {"results": [{"case_id": i, "status_id": 1, "comment": "ok", "elapsed": "1m"} for i in range(10_000)]}
+    mixed = {
+        "results": [
+            {"case_id": i, "status_id": ResultStatus.PASSED, "elapsed": "1m", "custom_on": now} for i in range(10_000)
+        ]
+    }
+    durations = {
+        "results": [
+            {"case_id": i, "status_id": ResultStatus.PASSED, "elapsed": timedelta(minutes=1), "custom_on": now}
+            for i in range(10_000)
+        ]
+    }
+    number = 5 if options.quick else 50
+    return {
+        "plain": Measure(per_call(lambda: convert_json(plain), number) / 1000, "ms"),
+        "plain_baseline": Measure(per_call(lambda: legacy_convert_json(plain), number) / 1000, "ms"),
+        "mixed": Measure(per_call(lambda: convert_json(mixed), number) / 1000, "ms"),
+        "mixed_baseline": Measure(per_call(lambda: legacy_convert_json(mixed), number) / 1000, "ms"),
+        "timedelta": Measure(per_call(lambda: convert_json(durations), number) / 1000, "ms"),
+    }
+
+
+@benchmark
+def decode_response(options: argparse.Namespace) -> dict[str, Measure]:
+    """Decode a full page of 250 cases with the default response handler."""
+    measures = {}
+    body = json.dumps(
+        {
+            "offset": 0,
+            "limit": 250,
+            "size": 250,
+            "_links": {"next": None, "prev": None},
+            "cases": [{"id": i, "title": f"Case {i}", "custom_steps": "step " * 20, "refs": None} for i in range(250)],
+        }
+    ).encode()
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    number = 200 if options.quick else 2000
+    for backend in ("json", "orjson"):
+        try:
+            session = Session("https://example.testrail.com", "example@mail.com", "password", json_backend=backend)
+        except testrail_api.TestRailError:
+            continue
+        measures[backend] = Measure(
+            per_call(lambda session=session: session._handle(response, raw=False), number), "us"
+        )
+    return measures
+
+
+@benchmark
+def bulk_pagination(options: argparse.Namespace) -> dict[str, Measure]:
+    """Fetch 5000 cases (20 pages) with ``get_cases_bulk``, 10 ms server latency, sequential and concurrent."""
+    emulator = Emulator(latency=PAGE_LATENCY)
+    project = populate(emulator, CASES // 5 if options.quick else CASES)
+    measures = {}
+    with emulated(emulator) as api:
+        for concurrency in (1, 4):
+            start = time.perf_counter()
+            api.cases.get_cases_bulk(project["id"], concurrency=concurrency)
+            measures[f"concurrency_{concurrency}"] = Measure(time.perf_counter() - start, "s")
+    return measures
+
+
+@benchmark
+def add_results_for_cases(options: argparse.Namespace) -> dict[str, Measure]:
+    """Add 10k results with ``add_results_for_cases`` to a run of 10k cases."""
+    count = RESULTS_COUNT // 10 if options.quick else RESULTS_COUNT
+    emulator = Emulator()
+    project = populate(emulator, count)
+    results = [{"case_id": case_id, "status_id": 1, "comment": "ok"} for case_id in range(1, count + 1)]
+    with emulated(emulator) as api:
+        run = api.runs.add_run(project["id"], suite_id=1)
+        start = time.perf_counter()
+        api.results.add_results_for_cases(run["id"], results)
+        seconds = time.perf_counter() - start
+    return {"seconds": Measure(seconds, "s"), "throughput": Measure(count / seconds, "results/s", higher=True)}
+
+
+@benchmark
+def attachments(options: argparse.Namespace) -> dict[str, Measure]:
+    """Upload and download an 8 MiB attachment."""
+    size = ATTACHMENT_SIZE // 8 if options.quick else ATTACHMENT_SIZE
+    emulator = Emulator()
+    project = populate(emulator, 0)
+    with tempfile.TemporaryDirectory() as tmp, emulated(emulator) as api:
+        path = Path(tmp, "attachment.bin")
+        path.write_bytes(bytes(range(256)) * (size // 256))
+        run = api.runs.add_run(project["id"], suite_id=1)
+        start = time.perf_counter()
+        attachment = api.attachments.add_attachment_to_run(run["id"], path)
+        upload = time.perf_counter() - start
+        start = time.perf_counter()
+        api.attachments.get_attachment(attachment["attachment_id"], Path(tmp, "download.bin"))
+        download = time.perf_counter() - start
+    return {
+        "upload": Measure(size / upload / 2**20, "MiB/s", higher=True),
+        "download": Measure(size / download / 2**20, "MiB/s", higher=True),
+    }
+
+
+@benchmark
+def import_time(options: argparse.Namespace) -> dict[str, Measure]:  # noqa: ARG001
+    """Import ``testrail_api`` in a new interpreter."""
+    code = "import time; start = time.perf_counter(); import testrail_api; print(time.perf_counter() - start)"
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return {"import": Measure(float(output) * 1000, "ms")}
+
+
+def run(options: argparse.Namespace) -> dict[str, Any]:
+    """Run the selected benchmarks, keep the median of the rounds."""
+    results: dict[str, Any] = {}
+    for name, func in BENCHMARKS.items():
+        if options.k and options.k not in name:
+            continue
+        rounds = [func(options) for _ in range(1 if options.quick else options.rounds)]
+        for measure in rounds[0]:
+            values = [measures[measure].value for measures in rounds]
+            first = rounds[0][measure]
+            results[f"{name}.{measure}"] = {
+                "value": statistics.median(values),
+                "unit": first.unit,
+                "higher_is_better": first.higher,
+                "rounds": values,
+            }
+            print(f"{name + '.' + measure:<40} {statistics.median(values):11.3f} {first.unit}")
+    return {
+        "version": testrail_api.__version__,
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "benchmarks": results,
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> bool:
+    """Print the changes from the baseline, return False when a benchmark regressed more than ``threshold``."""
+    print(f"\nCompared with {baseline['version']} ({baseline['date']}, Python {baseline['python']}):")
+    ok = True
+    for name, result in current["benchmarks"].items():
+        if (previous := baseline["benchmarks"].get(name)) is None or not previous["value"]:
+            continue
+        change = result["value"] / previous["value"] - 1
+        regression = -change if result["higher_is_better"] else change
+        flag = "REGRESSION" if regression > threshold else ""
+        ok = ok and not flag
+        values = f"{previous['value']:11.3f} -> {result['value']:11.3f} {result['unit']:<10}"
+        print(f"{name:<40} {values} {change:+7.1%} {flag}")
+    return ok
+
+
+def main() -> None:
+    """Parse the arguments, run, store and compare."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", help="run the benchmarks whose name contains this string")
+    parser.add_argument("--rounds", type=int, default=5, help="rounds of every benchmark (default: 5)")
+    parser.add_argument("--quick", action="store_true", help="a single round on smaller data")
+    parser.add_argument("--save", nargs="?", const="", help="store the results (default: results/<version>.json)")
+    parser.add_argument(
+        "--compare",
+        nargs="?",
+        const=BASELINE,
+        type=Path,
+        help="results of a previous run to compare with (default: results/baseline.json)",
+    )
+    parser.add_argument("--threshold", type=float, default=0.2, help="relative change reported as a regression")
+    options = parser.parse_args()
+    results = run(options)
+    if options.save is not None:
+        path = Path(options.save) if options.save else RESULTS / f"{results['version']}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(results, indent=2) + "\n")
+        print(f"\nSaved to {path}")
+    if options.compare is not None and not compare(results, json.loads(options.compare.read_text()), options.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Per-call overhead of the sync transports against a local HTTP server.
+
+Usage: python benchmarks/transport.py [calls]
+"""
+
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from testrail_api import RequestsTransport, TestRailAPI, Transport, Urllib3Transport
+
+BODY = b'{"id": 1, "title": "Case", "section_id": 1, "custom_steps": null}'
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Answers every GET with the same small JSON body over keep-alive connections."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *_: object) -> None:
+        """Silence the access log."""
+
+    def do_GET(self) -> None:
+        """Send ``BODY``."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+
+def measure(url: str, transport: Transport, calls: int) -> float:
+    """Microseconds per ``get_case`` call, after a warm-up call opening the connection."""
+    with TestRailAPI(url, "example@mail.com", "password", warn_ignore=True, transport=transport) as api:
+        api.cases.get_case(1)
+        start = time.perf_counter()
+        for _ in range(calls):
+            api.cases.get_case(1)
+        return (time.perf_counter() - start) / calls * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        results = {
+            "requests": measure(url, RequestsTransport(), calls),
+            "urllib3": measure(url, Urllib3Transport(), calls),
+        }
+    finally:
+        server.shutdown()
+    baseline = results["requests"]
+    for name, value in results.items():
+        print(f"{name:<10} {value:8.1f} us/call  {value / baseline:6.1%}")
+
+
+if __name__ == "__main__":
+    main()
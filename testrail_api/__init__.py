@@ -46,11 +46,14 @@ try:
 except ImportError:  # pragma: no cover
     __version__ = "unknown"
 
+import importlib
 import logging
+from typing import TYPE_CHECKING, Any
 
 from ._enums import ResultStatus, SuiteMode
 from ._exception import (
     AuthError,
+    ChunkedUploadError,
     NotFoundError,
     RateLimitError,
     ServerError,
@@ -58,20 +61,103 @@ from ._exception import (
     TestRailAPIError,
     TestRailError,
 )
-from ._testrail_api import TestRailAPI
+
+if TYPE_CHECKING:
+    from ._async_testrail_api import AsyncTestRailAPI
+    from ._cache import ResponseCache
+    from ._cassette import RecordingTransport, ReplayTransport
+    from ._collector import RemoteReporter, ResultsCollector
+    from ._convert import register_converter
+    from ._journal import Journal
+    from ._json import JSONBackend
+    from ._metrics import Metrics
+    from ._pagination import Page
+    from ._reporter import ResultsReporter
+    from ._retry import RetryPolicy
+    from ._testrail_api import TestRailAPI
+    from ._throttle import ConcurrencyLimiter, FileRateLimiter, RateLimiter
+    from ._tracing import RecordedSpan, SpanRecorder, Tracer
+    from ._transport import HttpxTransport, RequestsTransport, Transport, Urllib3Transport
+
+# Loaded on first access (PEP 562): ``requests``, ``asyncio`` and the categories
+# are only imported by the code that uses them, which keeps ``import testrail_api`` fast.
+_LAZY: dict[str, str] = {
+    "AsyncTestRailAPI": "_async_testrail_api",
+    "ConcurrencyLimiter": "_throttle",
+    "FileRateLimiter": "_throttle",
+    "HttpxTransport": "_transport",
+    "JSONBackend": "_json",
+    "Journal": "_journal",
+    "Metrics": "_metrics",
+    "Page": "_pagination",
+    "RateLimiter": "_throttle",
+    "RecordedSpan": "_tracing",
+    "RecordingTransport": "_cassette",
+    "RemoteReporter": "_collector",
+    "ReplayTransport": "_cassette",
+    "RequestsTransport": "_transport",
+    "ResponseCache": "_cache",
+    "ResultsCollector": "_collector",
+    "ResultsReporter": "_reporter",
+    "RetryPolicy": "_retry",
+    "SpanRecorder": "_tracing",
+    "TestRailAPI": "_testrail_api",
+    "Tracer": "_tracing",
+    "Transport": "_transport",
+    "Urllib3Transport": "_transport",
+    "register_converter": "_convert",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 logging.getLogger(__package__).addHandler(logging.NullHandler())
 
 __all__ = [
+    "AsyncTestRailAPI",
     "AuthError",
+    "ChunkedUploadError",
+    "ConcurrencyLimiter",
+    "FileRateLimiter",
+    "HttpxTransport",
+    "JSONBackend",
+    "Journal",
+    "Metrics",
     "NotFoundError",
+    "Page",
     "RateLimitError",
+    "RateLimiter",
+    "RecordedSpan",
+    "RecordingTransport",
+    "RemoteReporter",
+    "ReplayTransport",
+    "RequestsTransport",
+    "ResponseCache",
     "ResultStatus",
+    "ResultsCollector",
+    "ResultsReporter",
+    "RetryPolicy",
     "ServerError",
+    "SpanRecorder",
     "StatusCodeError",
     "SuiteMode",
     "TestRailAPI",
     "TestRailAPIError",
     "TestRailError",
+    "Tracer",
+    "Transport",
+    "Urllib3Transport",
     "__version__",
+    "register_converter",
 ]
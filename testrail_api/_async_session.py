@@ -0,0 +1,271 @@
+"""Asyncio session."""
+
+import asyncio
+import logging
+import ssl
+import time
+from collections.abc import Callable
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, TypeVar
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ._cache import ResponseCache
+from ._enums import METHODS
+from ._exception import TestRailError
+from ._json import JSONBackend
+from ._metrics import Metrics
+from ._retry import RetryPolicy
+from ._session import DOWNLOAD_CHUNK_SIZE, _BaseSession
+from ._throttle import ConcurrencyLimiter, RateLimiter
+from ._tracing import Tracer
+from ._transport import require_h2
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__package__)
+
+_AS = TypeVar("_AS", bound="AsyncSession")
+
+
+def _to_requests_response(response: "httpx.Response") -> requests.Response:
+    """
+    Copy a read ``httpx.Response`` into a ``requests.Response``.
+
+    Response handlers and :class:`StatusCodeError` keep working with the same
+    response type for the blocking and the asyncio clients.
+    """
+    result = requests.Response()
+    result.status_code = response.status_code
+    result.reason = response.reason_phrase
+    result.url = str(response.url)
+    result.headers = CaseInsensitiveDict(response.headers.multi_items())
+    result.encoding = response.encoding
+    result._content = response.content  # noqa: SLF001
+    return result
+
+
+class AsyncSession(_BaseSession):
+    """
+    Asyncio session based on ``httpx.AsyncClient``.
+
+    Accepts the same settings as :class:`Session`; every request method is a coroutine.
+    Requires the ``async`` extra: ``pip install testrail-api[async]``.
+    """
+
+    _is_async = True
+
+    def __init__(  # noqa: PLR0913
+        self,
+        url: str | None = None,
+        email: str | None = None,
+        password: str | None = None,
+        *,
+        timeout: float | tuple[float, float] = 30,
+        verify: bool | str = True,
+        headers: dict[str, str] | None = None,
+        retry: float = 3,
+        exc_iterations: int = 3,
+        raise_on_error: bool | None = None,
+        exc: bool | None = None,
+        rate_limit: bool = True,
+        warn_ignore: bool = False,
+        retry_exceptions: tuple[type[BaseException], ...] = (),
+        response_handler: Callable[[requests.Response], Any] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_limiter: ConcurrencyLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        cache: ResponseCache | None = None,
+        json_backend: str | JSONBackend = "json",
+        metrics: bool | Metrics = False,
+        tracer: Tracer | None = None,
+        coalesce: bool = False,
+        client: "httpx.AsyncClient | None" = None,
+        pool_maxsize: int = 100,
+        max_retries: int = 0,
+        keepalive_expiry: float = 5.0,
+        http2: bool = False,
+    ) -> None:
+        """
+        Async session constructor.
+
+        See :class:`Session` for the common arguments.
+
+        :param client:
+            A given ``httpx.AsyncClient`` will be used instead of a new one.
+        :param pool_maxsize:
+            Maximum number of connections in the pool, idle ones included (default: 100).
+        :param max_retries:
+            Transport-level retries of failed connections (default: 0).
+        :param keepalive_expiry:
+            Seconds an idle connection is kept in the pool (default: 5).
+        :param http2:
+            Use HTTP/2 when the server supports it, concurrent requests are then multiplexed
+            over a single connection per host (default: False). Requires the ``http2`` extra.
+
+        The pool and HTTP/2 options only apply when no ``client`` is given.
+        """
+        try:
+            import httpx  # noqa: PLC0415
+        except ImportError as e:
+            raise TestRailError("AsyncSession requires httpx, install it with: pip install testrail-api[async]") from e
+        super().__init__(
+            url,
+            email,
+            password,
+            timeout=timeout,
+            verify=verify,
+            headers=headers,
+            retry=retry,
+            exc_iterations=exc_iterations,
+            raise_on_error=raise_on_error,
+            exc=exc,
+            rate_limit=rate_limit,
+            warn_ignore=warn_ignore,
+            retry_exceptions=retry_exceptions,
+            response_handler=response_handler,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+            retry_policy=retry_policy,
+            cache=cache,
+            json_backend=json_backend,
+            metrics=metrics,
+            tracer=tracer,
+            coalesce=coalesce,
+        )
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            self.__timeout = httpx.Timeout(read, connect=connect)
+        else:
+            self.__timeout = httpx.Timeout(timeout)
+        if client is None:
+            if http2:
+                require_h2()
+            # httpx deprecates CA bundle paths in ``verify``, build the context explicitly
+            _verify = ssl.create_default_context(cafile=verify) if isinstance(verify, str) else verify
+            limits = httpx.Limits(
+                max_connections=pool_maxsize,
+                max_keepalive_connections=pool_maxsize,
+                keepalive_expiry=keepalive_expiry,
+            )
+            client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(verify=_verify, http2=http2, limits=limits, retries=max_retries),
+            )
+        self.__client = client
+        self.__client.headers.update(self._headers)
+        self.__client.auth = httpx.BasicAuth(*self._auth)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and release pooled connections."""
+        await self.__client.aclose()
+
+    async def __aenter__(self: _AS) -> _AS:
+        """Enter the runtime context and return the session."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the session when leaving the runtime context."""
+        await self.aclose()
+
+    async def _sleep(self, seconds: float, reason: str) -> None:
+        with self._span("sleep", {"testrail.sleep.reason": reason, "testrail.sleep.seconds": seconds}):
+            await asyncio.sleep(seconds)
+
+    async def request(self, method: METHODS, endpoint: str, *, raw: bool = False, **kwargs: Any) -> Any:
+        """
+        Send request method.
+
+        With ``raw=True`` the ``httpx.Response`` is returned as is; pass
+        ``stream=True`` to leave its body unread.
+        """
+        with self._request_span(method, endpoint) as span:
+            with self._span("prepare"):
+                url = self._prepare(endpoint, kwargs)
+                stream = kwargs.pop("stream", False)
+                if "data" in kwargs:
+                    # an encoded JSON body
+                    kwargs["content"] = kwargs.pop("data")
+                if params := {key: value for key, value in kwargs.pop("params", {}).items() if value is not None}:
+                    # httpx would replace the "?/api/v2/..." query, so params are appended the way requests does it
+                    url = f"{url}&{urlencode(params)}"
+                query = {"params": params}
+                cache_key = self._cache_key(method, endpoint, query, raw=raw)
+                hit, cached = self._cache_lookup(cache_key)
+            if hit:
+                span.set_attribute("testrail.cache_hit", value=True)
+                return cached
+            if self._singleflight is not None and (
+                key := self._coalesce_key(method, endpoint, {"params": params}, raw=raw)
+            ):
+                return await self._singleflight.do_async(
+                    key, lambda: self._send(method, url, kwargs, raw=raw, stream=stream, cache_key=cache_key)
+                )
+            return await self._send(method, url, kwargs, raw=raw, stream=stream, cache_key=cache_key)
+
+    async def _send(  # noqa: PLR0913
+        self, method: METHODS, url: str, kwargs: dict[str, Any], *, raw: bool, stream: bool, cache_key: Any
+    ) -> Any:
+        """Send the prepared request, retrying it as configured, and handle the response."""
+        for count in range(self._exc_iterations):
+            if wait := self._throttle():
+                await self._sleep(wait, "throttle")
+            ticket = None if self._concurrency_limiter is None else await self._concurrency_limiter.acquire_async()
+            started = time.perf_counter()
+            try:
+                with self._span("send", {"testrail.attempt": count + 1}) as attempt:
+                    request = self.__client.build_request(str(method.value), url, timeout=self.__timeout, **kwargs)
+                    response = await self.__client.send(request, stream=stream)
+                    attempt.set_attribute("http.response.status_code", response.status_code)
+            except self._retry_exceptions as exc:
+                self._release(ticket, url, started, error=exc)
+                if (delay := self._retry_exception(method, url, exc, count)) is not None:
+                    await self._sleep(delay, "retry")
+                    continue
+                raise
+            except asyncio.CancelledError:
+                self._release(ticket, url, started)
+                raise
+            except Exception as exc:
+                self._release(ticket, url, started, error=exc)
+                logger.exception("Request error")
+                raise
+            self._release(ticket, url, started, response=response, streamed=stream)
+            delay = self._retry_delay(method, url, response.status_code, response.headers, count)
+            if delay is not None:
+                await response.aclose()
+                await self._sleep(delay, "retry")
+                continue
+            if raw:
+                return response
+            return self._handle(_to_requests_response(response), raw=False, cache_key=cache_key)
+        return None
+
+    async def attachment_request(self, method: METHODS, src: str, file: Path | str, **kwargs: Any) -> Any:
+        """Send attach."""
+        file = self._path(file)
+        with file.open("rb") as attachment:
+            return await self.request(method, src, files={"attachment": attachment}, **kwargs)
+
+    async def get_attachment(self, method: METHODS, src: str, file: Path | str, **kwargs: Any) -> Any:
+        """Download attach."""
+        file = self._path(file)
+        response = await self.request(method, src, raw=True, stream=True, **kwargs)
+        try:
+            if response.is_success:
+                with file.open("wb") as attachment:
+                    async for chunk in response.aiter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        attachment.write(chunk)
+                return file
+            await response.aread()
+            return self._response_handler(_to_requests_response(response))
+        finally:
+            await response.aclose()
@@ -0,0 +1,14 @@
+"""Asyncio TestRail API client."""
+
+from ._async_session import AsyncSession
+from ._testrail_api import _Categories
+
+
+class AsyncTestRailAPI(_Categories, AsyncSession):
+    """
+    Asyncio TestRail API client.
+
+    Exposes the same categories as :class:`TestRailAPI`, every category method
+    returns an awaitable: ``case = await api.cases.get_case(1)``.
+    Requires the ``async`` extra: ``pip install testrail-api[async]``.
+    """
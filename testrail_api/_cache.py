@@ -0,0 +1,103 @@
+"""In-memory cache of GET responses."""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from typing import Any, Final
+
+DEFAULT_TTL: Final[float] = 300.0
+
+
+class ResponseCache:
+    """
+    TTL and LRU bounded cache of parsed GET responses, shared by the sessions using it.
+
+    Only the endpoints listed in ``ttls`` are cached, by default the metadata
+    that almost never changes: statuses, priorities, case/result fields, case types and templates.
+    The cached objects are copied, so the callers may modify the returned values.
+    """
+
+    DEFAULT_TTLS: Final[Mapping[str, float]] = {
+        "get_statuses": DEFAULT_TTL,
+        "get_case_statuses": DEFAULT_TTL,
+        "get_priorities": DEFAULT_TTL,
+        "get_case_fields": DEFAULT_TTL,
+        "get_case_types": DEFAULT_TTL,
+        "get_result_fields": DEFAULT_TTL,
+        "get_templates": DEFAULT_TTL,
+    }
+
+    def __init__(self, ttls: Mapping[str, float] | None = None, maxsize: int = 256) -> None:
+        """
+        Response cache constructor.
+
+        :param ttls:
+            Seconds to keep the responses of each endpoint, by endpoint name
+            without the object id, e.g. ``{"get_templates": 600}`` (default: :attr:`DEFAULT_TTLS`).
+        :param maxsize:
+            Maximum number of cached responses, the least recently used one is evicted first (default: 256).
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self.ttls = dict(self.DEFAULT_TTLS if ttls is None else ttls)
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.__data: OrderedDict[Hashable, tuple[float, str, Any]] = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+    @staticmethod
+    def _name(endpoint: str) -> str:
+        return endpoint.split("/", 1)[0]
+
+    def ttl(self, endpoint: str) -> float | None:
+        """Seconds to keep the responses of the endpoint, None when it is not cached."""
+        return self.ttls.get(self._name(endpoint))
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """Return ``(True, value)`` for a fresh cached response, ``(False, None)`` otherwise."""
+        with self.__lock:
+            entry = self.__data.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self.__data[key]
+                self.misses += 1
+                return False, None
+            self.__data.move_to_end(key)
+            self.hits += 1
+        return True, copy.deepcopy(entry[2])
+
+    def put(self, key: Hashable, endpoint: str, value: Any) -> None:
+        """Cache the response of the endpoint for its TTL."""
+        if (ttl := self.ttl(endpoint)) is None:
+            return
+        value = copy.deepcopy(value)
+        with self.__lock:
+            self.__data[key] = (time.monotonic() + ttl, self._name(endpoint), value)
+            self.__data.move_to_end(key)
+            while len(self.__data) > self.maxsize:
+                self.__data.popitem(last=False)
+
+    def invalidate(self, endpoint: str | None = None) -> None:
+        """
+        Drop cached responses.
+
+        :param endpoint:
+            Endpoint name, e.g. ``"get_case_fields"``; all the responses are dropped when omitted.
+        """
+        with self.__lock:
+            if endpoint is None:
+                self.__data.clear()
+                return
+            name = self._name(endpoint)
+            for key in [key for key, entry in self.__data.items() if entry[1] == name]:
+                del self.__data[key]
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters and the number of cached responses."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.__data)}
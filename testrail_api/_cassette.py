@@ -0,0 +1,197 @@
+"""Recording of request/response pairs and their replay."""
+
+import base64
+import io
+import json
+import os
+import threading
+import time
+from collections.abc import Callable, Mapping
+from itertools import cycle
+from pathlib import Path
+from typing import IO, Any, Literal
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ._exception import TestRailError
+from ._transport import Transport, _prepared_request
+
+
+def _interaction_key(method: str, url: str) -> tuple[str, str, tuple[tuple[str, str], ...]]:
+    """Match requests by method, endpoint and parameters, whatever the host and the parameters order."""
+    endpoint, _, params = urlsplit(url).query.partition("&")
+    return method, endpoint, tuple(sorted(parse_qsl(params, keep_blank_values=True)))
+
+
+def _encode_body(body: bytes | None) -> dict[str, str] | None:
+    if body is None:
+        return None
+    try:
+        return {"text": body.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"base64": base64.b64encode(body).decode("ascii")}
+
+
+def _decode_body(body: dict[str, str] | None) -> bytes:
+    if body is None:
+        return b""
+    if "base64" in body:
+        return base64.b64decode(body["base64"])
+    return body["text"].encode("utf-8")
+
+
+class RecordingTransport(Transport):
+    """
+    Transport appending every request/response pair sent through another transport to a cassette.
+
+    The cassette is a JSON Lines file, one interaction per line, with the sensitive headers redacted.
+    Created by ``Session(record=...)``; replayed by :class:`ReplayTransport`.
+    """
+
+    def __init__(
+        self,
+        transport: Transport,
+        path: Path | str,
+        *,
+        redact: Callable[[Mapping[str, Any]], dict[str, Any]],
+    ) -> None:
+        """
+        Create a transport recording another one.
+
+        :param transport:
+            Transport sending the requests.
+        :param path:
+            Cassette file, appended to.
+        :param redact:
+            Replaces the values of the sensitive headers.
+        """
+        self.transport = transport
+        self.path = Path(path)
+        self.__redact = redact
+        self.__file: IO[str] = self.path.open("a", encoding="utf-8")
+        self.__lock = threading.Lock()
+
+    def setup(self, *, headers: Mapping[str, str], auth: tuple[str, str], verify: bool | str) -> None:
+        """Set up the recorded transport."""
+        self.transport.setup(headers=headers, auth=auth, verify=verify)
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request with the recorded transport and record it with its response."""
+        started = time.perf_counter()
+        response = self.transport.request(method, url, **kwargs)
+        latency = time.perf_counter() - started
+        request = response.request
+        files = kwargs.get("files")
+        interaction = {
+            "method": method,
+            "url": request.url or url,
+            "latency": round(latency, 6),
+            "request": {
+                "headers": self.__redact(request.headers),
+                "body": _encode_body(kwargs.get("data")),
+                "files": {name: os.path.basename(file.name) for name, file in files.items()} if files else None,  # noqa: PTH119
+            },
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": self.__redact(response.headers),
+            # reading a streamed body keeps it available to ``iter_content``
+            "body": _encode_body(response.content),
+        }
+        line = json.dumps(interaction, separators=(",", ":"))
+        with self.__lock:
+            self.__file.write(line + "\n")
+            self.__file.flush()
+        return response
+
+    def close(self) -> None:
+        """Close the cassette and the recorded transport."""
+        with self.__lock:
+            self.__file.close()
+        self.transport.close()
+
+
+class ReplayTransport(Transport):
+    """
+    Transport serving the responses of a cassette written by :class:`RecordingTransport`, without network.
+
+    Requests are matched by method, endpoint and parameters; the responses recorded for the same request
+    are served in turn, starting over once they are all served, so a short recording can drive a long benchmark.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        *,
+        latency: float | Callable[[], float] | Literal["recorded"] | None = None,
+    ) -> None:
+        """
+        Replay transport constructor.
+
+        :param path:
+            Cassette file.
+        :param latency:
+            Delay before every response: ``"recorded"`` for the recorded one, seconds,
+            or a function returning seconds for a synthetic distribution (default: no delay).
+        """
+        self.path = Path(path)
+        self.latency = latency
+        interactions: dict[Any, list[dict[str, Any]]] = {}
+        with self.path.open(encoding="utf-8") as file:
+            for line in file:
+                if line.strip():
+                    interaction = json.loads(line)
+                    interactions.setdefault(_interaction_key(interaction["method"], interaction["url"]), []).append(
+                        interaction
+                    )
+        self.__interactions = {key: cycle(values) for key, values in interactions.items()}
+        self.__headers: Mapping[str, str] = {}
+        self.__lock = threading.Lock()
+
+    def setup(self, *, headers: Mapping[str, str], auth: tuple[str, str], verify: bool | str) -> None:  # noqa: ARG002
+        """Keep the session headers for the replayed requests."""
+        self.__headers = headers
+
+    def request(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        *,
+        timeout: float | tuple[float, float],  # noqa: ARG002
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        data: bytes | None = None,
+        files: Mapping[str, IO[bytes]] | None = None,  # noqa: ARG002
+        stream: bool = False,
+    ) -> requests.Response:
+        """Serve the next response recorded for the request."""
+        if params and (query := urlencode([(k, v) for k, v in params.items() if v is not None], doseq=True)):
+            url = f"{url}&{query}"
+        key = _interaction_key(method, url)
+        with self.__lock:
+            interactions = self.__interactions.get(key)
+            if interactions is None:
+                raise TestRailError(f"No recorded response for {method} {key[1]} in {self.path}")
+            interaction = next(interactions)
+        if self.latency == "recorded":
+            time.sleep(interaction["latency"])
+        elif callable(self.latency):
+            time.sleep(self.latency())
+        elif self.latency:
+            time.sleep(self.latency)
+        body = _decode_body(interaction["body"])
+        response = requests.Response()
+        response.status_code = interaction["status"]
+        response.reason = interaction["reason"]
+        response.headers = CaseInsensitiveDict(interaction["headers"])
+        response.url = url
+        response.request = _prepared_request(method, url, {**self.__headers, **(headers or {})}, data)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.raw = io.BytesIO(body)
+        if not stream:
+            response._content = body  # noqa: SLF001
+        return response
+
+    def close(self) -> None:
+        """Nothing to release."""
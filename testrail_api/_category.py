@@ -1,50 +1,44 @@
 """TestRail API categories."""
 
-import itertools
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
 
+from ._chunking import _async_chunked_api_method, _chunked_api_method
 from ._enums import METHODS
-from ._exception import TestRailAPIError
-from ._session import Session
-
-LIMIT_MAX = 250
-
-
-def _bulk_api_method(func: Callable, resp_key: str, *args, **kwargs) -> list:
-    """
-    Get all the objects handling the pagination via offset.
-
-    Stops when the API returns a page shorter than the page size.
-    """
-    if "limit" in kwargs or "offset" in kwargs:
-        raise TypeError("limit and offset are managed automatically by *_bulk methods, use the regular method instead")
-    _response_objects: list = []
-    for offset in itertools.count(0, LIMIT_MAX):
-        _resp = func(*args, **kwargs, offset=offset, limit=LIMIT_MAX)
-        if not isinstance(_resp, dict) or resp_key not in _resp:
-            raise TestRailAPIError(
-                f"Expected a paginated response with the {resp_key!r} key, got {type(_resp).__name__}. "
-                "Bulk methods require TestRail 6.7+ pagination and a response handler returning the parsed JSON."
-            )
-        _page = _resp[resp_key] or []
-        _response_objects.extend(_page)
-        if len(_page) < LIMIT_MAX:
-            break
-    return _response_objects
+from ._pagination import _async_bulk_api_method, _async_iter_api_method, _bulk_api_method, _iter_api_method
+from ._session import _BaseSession
 
 
 class _MetaCategory:
     """Meta Category."""
 
-    def __init__(self, session: Session) -> None:
+    def __init__(self, session: _BaseSession) -> None:
         self._session = session
 
     @property
-    def s(self) -> Session:
+    def s(self) -> _BaseSession:
         return self._session
 
+    def _bulk(self, func: Callable, resp_key: str, *args, **kwargs) -> Any:
+        """Fetch all pages, as a coroutine when bound to an :class:`AsyncSession`."""
+        if self._session._is_async:  # noqa: SLF001
+            return _async_bulk_api_method(func, resp_key, *args, **kwargs)
+        return _bulk_api_method(func, resp_key, *args, **kwargs)
+
+    def _iter(self, func: Callable, resp_key: str, *args, **kwargs) -> Any:
+        """Iterate over all pages lazily, as an async iterator when bound to an :class:`AsyncSession`."""
+        if self._session._is_async:  # noqa: SLF001
+            return _async_iter_api_method(func, resp_key, *args, **kwargs)
+        return _iter_api_method(func, resp_key, *args, **kwargs)
+
+    def _chunked(self, func: Callable, results: list[Any], **kwargs) -> Any:
+        """Send the results in chunks, as a coroutine when bound to an :class:`AsyncSession`."""
+        kwargs.setdefault("retry_policy", self._session._retry_policy)  # noqa: SLF001
+        if self._session._is_async:  # noqa: SLF001
+            return _async_chunked_api_method(func, results, **kwargs)
+        return _chunked_api_method(func, results, **kwargs)
+
     @staticmethod
     def _opt(params: dict[Any, Any]) -> dict[Any, Any]:
         return {k: v for k, v in params.items() if v is not None}
@@ -262,7 +256,7 @@ class Attachments(_MetaCategory):
         """
         return self.s.post(endpoint=f"delete_attachment/{attachment_id}")
 
-    def get_attachments_for_case_bulk(self, case_id: int) -> list[dict]:
+    def get_attachments_for_case_bulk(self, case_id: int, **kwargs) -> list[dict]:
         """
         Return the list of attachments from the case handling pagination.
 
@@ -270,12 +264,39 @@ class Attachments(_MetaCategory):
 
         :param case_id:
             The ID of the test case to retrieve attachments from
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
         :return: List of attachments
         :returns: list[dict]
         """
-        return _bulk_api_method(self.get_attachments_for_case, "attachments", case_id)
+        return self._bulk(self.get_attachments_for_case, "attachments", case_id, **kwargs)
 
-    def get_attachments_for_plan_bulk(self, plan_id: int) -> list[dict]:
+    def iter_attachments_for_case(self, case_id: int, **kwargs) -> Iterator[dict]:
+        """
+        Same as ``get_attachments_for_case_bulk``, but lazily yields the objects page by page.
+
+        Requires TestRail 5.7 or later
+
+        :param case_id:
+            The ID of the test case to retrieve attachments from
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key prefetch: bool
+            Request the next page in the background while the current one is consumed (default: False)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
+        :return: Iterator of attachments
+        :returns: Iterator[dict]
+        """
+        return self._iter(self.get_attachments_for_case, "attachments", case_id, **kwargs)
+
+    def get_attachments_for_plan_bulk(self, plan_id: int, **kwargs) -> list[dict]:
         """
         Return the list of attachments from the plan handling pagination.
 
@@ -283,12 +304,39 @@ class Attachments(_MetaCategory):
 
         :param plan_id:
             The ID of the test plan to retrieve attachments from
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
         :return: List of attachments
         :returns: list[dict]
         """
-        return _bulk_api_method(self.get_attachments_for_plan, "attachments", plan_id)
+        return self._bulk(self.get_attachments_for_plan, "attachments", plan_id, **kwargs)
 
-    def get_attachments_for_run_bulk(self, run_id: int) -> list[dict]:
+    def iter_attachments_for_plan(self, plan_id: int, **kwargs) -> Iterator[dict]:
+        """
+        Same as ``get_attachments_for_plan_bulk``, but lazily yields the objects page by page.
+
+        Requires TestRail 6.3 or later
+
+        :param plan_id:
+            The ID of the test plan to retrieve attachments from
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key prefetch: bool
+            Request the next page in the background while the current one is consumed (default: False)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
+        :return: Iterator of attachments
+        :returns: Iterator[dict]
+        """
+        return self._iter(self.get_attachments_for_plan, "attachments", plan_id, **kwargs)
+
+    def get_attachments_for_run_bulk(self, run_id: int, **kwargs) -> list[dict]:
         """
         Return the list of attachments from the run handling pagination.
 
@@ -296,12 +344,39 @@ class Attachments(_MetaCategory):
 
         :param run_id:
             The ID of the test run to retrieve attachments from
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
         :return: List of attachments
         :returns: list[dict]
         """
-        return _bulk_api_method(self.get_attachments_for_run, "attachments", run_id)
+        return self._bulk(self.get_attachments_for_run, "attachments", run_id, **kwargs)
+
+    def iter_attachments_for_run(self, run_id: int, **kwargs) -> Iterator[dict]:
+        """
+        Same as ``get_attachments_for_run_bulk``, but lazily yields the objects page by page.
+
+        Requires TestRail 6.3 or later
+
+        :param run_id:
+            The ID of the test run to retrieve attachments from
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key prefetch: bool
+            Request the next page in the background while the current one is consumed (default: False)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
+        :return: Iterator of attachments
+        :returns: Iterator[dict]
+        """
+        return self._iter(self.get_attachments_for_run, "attachments", run_id, **kwargs)
 
-    def get_attachments_for_plan_entry_bulk(self, plan_id: int, entry_id: int) -> list[dict]:
+    def get_attachments_for_plan_entry_bulk(self, plan_id: int, entry_id: int, **kwargs) -> list[dict]:
         """
         Returns the list of attachments for the plan entry handling pagination.
 
@@ -311,12 +386,41 @@ class Attachments(_MetaCategory):
             The ID of the test plan containing the entry
         :param entry_id:
             The ID of the test plan entry to retrieve attachments from
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
         :return: List of attachments
         :returns: list[dict]
         """
-        return _bulk_api_method(self.get_attachments_for_plan_entry, "attachments", plan_id, entry_id)
+        return self._bulk(self.get_attachments_for_plan_entry, "attachments", plan_id, entry_id, **kwargs)
 
-    def get_attachments_for_test_bulk(self, test_id: int) -> list[dict]:
+    def iter_attachments_for_plan_entry(self, plan_id: int, entry_id: int, **kwargs) -> Iterator[dict]:
+        """
+        Same as ``get_attachments_for_plan_entry_bulk``, but lazily yields the objects page by page.
+
+        Requires TestRail 6.3 or later
+
+        :param plan_id:
+            The ID of the test plan containing the entry
+        :param entry_id:
+            The ID of the test plan entry to retrieve attachments from
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key prefetch: bool
+            Request the next page in the background while the current one is consumed (default: False)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
+        :return: Iterator of attachments
+        :returns: Iterator[dict]
+        """
+        return self._iter(self.get_attachments_for_plan_entry, "attachments", plan_id, entry_id, **kwargs)
+
+    def get_attachments_for_test_bulk(self, test_id: int, **kwargs) -> list[dict]:
         """
         Return the list of attachments from the test handling pagination.
 
@@ -324,10 +428,37 @@ class Attachments(_MetaCategory):
 
         :param test_id:
             The ID of the test to retrieve attachments from
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
         :return: List of attachments
         :returns: list[dict]
         """
-        return _bulk_api_method(self.get_attachments_for_test, "attachments", test_id)
+        return self._bulk(self.get_attachments_for_test, "attachments", test_id, **kwargs)
+
+    def iter_attachments_for_test(self, test_id: int, **kwargs) -> Iterator[dict]:
+        """
+        Same as ``get_attachments_for_test_bulk``, but lazily yields the objects page by page.
+
+        Requires TestRail 6.3 or later
+
+        :param test_id:
+            The ID of the test to retrieve attachments from
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key prefetch: bool
+            Request the next page in the background while the current one is consumed (default: False)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
+        :return: Iterator of attachments
+        :returns: Iterator[dict]
+        """
+        return self._iter(self.get_attachments_for_test, "attachments", test_id, **kwargs)
 
 
 class Bdds(_MetaCategory):
@@ -657,10 +788,38 @@ class Cases(_MetaCategory):
 
         :param project_id:
             The ID of the project
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
         :return: List of test cases
         :returns: list[dict]
         """
-        return _bulk_api_method(self.get_cases, "cases", project_id, **kwargs)
+        return self._bulk(self.get_cases, "cases", project_id, **kwargs)
+
+    def iter_cases(self, project_id: int, **kwargs) -> Iterator[dict]:
+        """
+        Same as ``get_cases_bulk``, but lazily yields the objects page by page.
+
+        Accepts the same filters as ``get_cases`` except ``limit``/``offset``,
+        which are managed automatically.
+
+        :param project_id:
+            The ID of the project
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key prefetch: bool
+            Request the next page in the background while the current one is consumed (default: False)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
+        :return: Iterator of test cases
+        :returns: Iterator[dict]
+        """
+        return self._iter(self.get_cases, "cases", project_id, **kwargs)
 
 
 class CaseFields(_MetaCategory):
@@ -940,10 +1099,38 @@ class Milestones(_MetaCategory):
 
         :param project_id:
             The ID of the project
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
         :return: List of milestones
         :returns: list[dict]
         """
-        return _bulk_api_method(self.get_milestones, "milestones", project_id, **kwargs)
+        return self._bulk(self.get_milestones, "milestones", project_id, **kwargs)
+
+    def iter_milestones(self, project_id: int, **kwargs) -> Iterator[dict]:
+        """
+        Same as ``get_milestones_bulk``, but lazily yields the objects page by page.
+
+        Accepts the same filters as ``get_milestones`` except ``limit``/``offset``,
+        which are managed automatically.
+
+        :param project_id:
+            The ID of the project
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key prefetch: bool
+            Request the next page in the background while the current one is consumed (default: False)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
+        :return: Iterator of milestones
+        :returns: Iterator[dict]
+        """
+        return self._iter(self.get_milestones, "milestones", project_id, **kwargs)
 
 
 class Plans(_MetaCategory):
@@ -1230,10 +1417,38 @@ class Plans(_MetaCategory):
 
         :param project_id:
             The ID of the project
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
         :return: List of test plans
         :returns: list[dict]
         """
-        return _bulk_api_method(self.get_plans, "plans", project_id, **kwargs)
+        return self._bulk(self.get_plans, "plans", project_id, **kwargs)
+
+    def iter_plans(self, project_id: int, **kwargs) -> Iterator[dict]:
+        """
+        Same as ``get_plans_bulk``, but lazily yields the objects page by page.
+
+        Accepts the same filters as ``get_plans`` except ``limit``/``offset``,
+        which are managed automatically.
+
+        :param project_id:
+            The ID of the project
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key prefetch: bool
+            Request the next page in the background while the current one is consumed (default: False)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
+        :return: Iterator of test plans
+        :returns: Iterator[dict]
+        """
+        return self._iter(self.get_plans, "plans", project_id, **kwargs)
 
 
 class Priorities(_MetaCategory):
@@ -1631,6 +1846,64 @@ class Results(_MetaCategory):
             json={"results": results},
         )
 
+    def add_results_chunked(self, run_id: int, results: list[dict], **kwargs) -> list[dict]:
+        """
+        Same as ``add_results``, split into several requests for large lists of results.
+
+        The chunks may be added in any order with ``concurrency``: keep the results of a test
+        in one call when their order matters.
+
+        :param run_id:
+            The ID of the test run the results should be added to
+        :param results: list[dict]
+            The test results, each one specifies the test ID
+        :key chunk_size: int
+            Maximum number of results per request (default: 1000)
+        :key max_bytes: int | None
+            Maximum size of the JSON body of a request, None to only split by count (default: 8 MiB)
+        :key concurrency: int
+            Number of chunks sent in parallel (default: 1)
+        :key retries: int
+            Times a chunk failing with a rate-limit or connection error is sent again, with a backoff (default: 2)
+        :key retry_policy: RetryPolicy | None
+            Policy of the retries (default: the policy of the session); with POST in its ``methods``
+            the chunks failing with a server error or a timeout are also retried, within its budget:
+            such a chunk may have been added, its results may be duplicated
+        :return: The added results, in the order of ``results``
+        :returns: list[dict]
+        :raises ChunkedUploadError: when chunks still fail after their retries, the other chunks are added
+        """
+        return self._chunked(lambda chunk: self.add_results(run_id, chunk), results, **kwargs)
+
+    def add_results_for_cases_chunked(self, run_id: int, results: list[dict], **kwargs) -> list[dict]:
+        """
+        Same as ``add_results_for_cases``, split into several requests for large lists of results.
+
+        The chunks may be added in any order with ``concurrency``: keep the results of a case
+        in one call when their order matters.
+
+        :param run_id:
+            The ID of the test run the results should be added to
+        :param results: list[dict]
+            The test results, each one specifies the test case ID
+        :key chunk_size: int
+            Maximum number of results per request (default: 1000)
+        :key max_bytes: int | None
+            Maximum size of the JSON body of a request, None to only split by count (default: 8 MiB)
+        :key concurrency: int
+            Number of chunks sent in parallel (default: 1)
+        :key retries: int
+            Times a chunk failing with a rate-limit or connection error is sent again, with a backoff (default: 2)
+        :key retry_policy: RetryPolicy | None
+            Policy of the retries (default: the policy of the session); with POST in its ``methods``
+            the chunks failing with a server error or a timeout are also retried, within its budget:
+            such a chunk may have been added, its results may be duplicated
+        :return: The added results, in the order of ``results``
+        :returns: list[dict]
+        :raises ChunkedUploadError: when chunks still fail after their retries, the other chunks are added
+        """
+        return self._chunked(lambda chunk: self.add_results_for_cases(run_id, chunk), results, **kwargs)
+
     def edit_result(self, result_id: int, **kwargs) -> dict:
         """
         Updates an existing test result.
@@ -1676,10 +1949,38 @@ class Results(_MetaCategory):
 
         :param test_id:
             The ID of the test
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
         :return: List of results
         :returns: list[dict]
         """
-        return _bulk_api_method(self.get_results, "results", test_id, **kwargs)
+        return self._bulk(self.get_results, "results", test_id, **kwargs)
+
+    def iter_results(self, test_id: int, **kwargs) -> Iterator[dict]:
+        """
+        Same as ``get_results_bulk``, but lazily yields the objects page by page.
+
+        Accepts the same filters as ``get_results`` except ``limit``/``offset``,
+        which are managed automatically.
+
+        :param test_id:
+            The ID of the test
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key prefetch: bool
+            Request the next page in the background while the current one is consumed (default: False)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
+        :return: Iterator of results
+        :returns: Iterator[dict]
+        """
+        return self._iter(self.get_results, "results", test_id, **kwargs)
 
     def get_results_for_case_bulk(self, run_id: int, case_id: int, **kwargs) -> list[dict]:
         """
@@ -1692,10 +1993,40 @@ class Results(_MetaCategory):
             The ID of the test run
         :param case_id:
             The ID of the test case
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
         :return: List of results
         :returns: list[dict]
         """
-        return _bulk_api_method(self.get_results_for_case, "results", run_id, case_id, **kwargs)
+        return self._bulk(self.get_results_for_case, "results", run_id, case_id, **kwargs)
+
+    def iter_results_for_case(self, run_id: int, case_id: int, **kwargs) -> Iterator[dict]:
+        """
+        Same as ``get_results_for_case_bulk``, but lazily yields the objects page by page.
+
+        Accepts the same filters as ``get_results_for_case`` except ``limit``/``offset``,
+        which are managed automatically.
+
+        :param run_id:
+            The ID of the test run
+        :param case_id:
+            The ID of the test case
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key prefetch: bool
+            Request the next page in the background while the current one is consumed (default: False)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
+        :return: Iterator of results
+        :returns: Iterator[dict]
+        """
+        return self._iter(self.get_results_for_case, "results", run_id, case_id, **kwargs)
 
     def get_results_for_run_bulk(self, run_id: int, **kwargs) -> list[dict]:
         """
@@ -1706,10 +2037,38 @@ class Results(_MetaCategory):
 
         :param run_id:
             The ID of the test run
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
         :return: List of results
         :returns: list[dict]
         """
-        return _bulk_api_method(self.get_results_for_run, "results", run_id, **kwargs)
+        return self._bulk(self.get_results_for_run, "results", run_id, **kwargs)
+
+    def iter_results_for_run(self, run_id: int, **kwargs) -> Iterator[dict]:
+        """
+        Same as ``get_results_for_run_bulk``, but lazily yields the objects page by page.
+
+        Accepts the same filters as ``get_results_for_run`` except ``limit``/``offset``,
+        which are managed automatically.
+
+        :param run_id:
+            The ID of the test run
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key prefetch: bool
+            Request the next page in the background while the current one is consumed (default: False)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
+        :return: Iterator of results
+        :returns: Iterator[dict]
+        """
+        return self._iter(self.get_results_for_run, "results", run_id, **kwargs)
 
 
 class ResultFields(_MetaCategory):
@@ -1887,10 +2246,39 @@ class Runs(_MetaCategory):
 
         :param project_id: int
             The ID of the project
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
         :return: List of runs
         :returns: list[dict]
         """
-        return _bulk_api_method(self.get_runs, "runs", project_id, **kwargs)
+        return self._bulk(self.get_runs, "runs", project_id, **kwargs)
+
+    def iter_runs(self, project_id: int, **kwargs) -> Iterator[dict]:
+        """
+        Same as ``get_runs_bulk``, but lazily yields the objects page by page.
+
+        Only returns those test runs that are not part of a test plan (please see get_plans/get_plan for this).
+        Accepts the same filters as ``get_runs`` except ``limit``/``offset``,
+        which are managed automatically.
+
+        :param project_id: int
+            The ID of the project
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key prefetch: bool
+            Request the next page in the background while the current one is consumed (default: False)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
+        :return: Iterator of runs
+        :returns: Iterator[dict]
+        """
+        return self._iter(self.get_runs, "runs", project_id, **kwargs)
 
 
 class Sections(_MetaCategory):
@@ -2010,10 +2398,38 @@ class Sections(_MetaCategory):
 
         :param project_id:
             The ID of the project
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
         :return: List of sections
         :returns: list[dict]
         """
-        return _bulk_api_method(self.get_sections, "sections", project_id, **kwargs)
+        return self._bulk(self.get_sections, "sections", project_id, **kwargs)
+
+    def iter_sections(self, project_id: int, **kwargs) -> Iterator[dict]:
+        """
+        Same as ``get_sections_bulk``, but lazily yields the objects page by page.
+
+        Accepts the same arguments as ``get_sections`` except ``limit``/``offset``,
+        which are managed automatically.
+
+        :param project_id:
+            The ID of the project
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key prefetch: bool
+            Request the next page in the background while the current one is consumed (default: False)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
+        :return: Iterator of sections
+        :returns: Iterator[dict]
+        """
+        return self._iter(self.get_sections, "sections", project_id, **kwargs)
 
 
 class Statuses(_MetaCategory):
@@ -2071,10 +2487,37 @@ class Suites(_MetaCategory):
 
         :param project_id:
             The ID of the project
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
         :return: List of test suites
         :returns: list[dict]
         """
-        return _bulk_api_method(self.get_suites, "suites", project_id, **kwargs)
+        return self._bulk(self.get_suites, "suites", project_id, **kwargs)
+
+    def iter_suites(self, project_id: int, **kwargs) -> Iterator[dict]:
+        """
+        Same as ``get_suites_bulk``, but lazily yields the objects page by page.
+
+        ``limit``/``offset`` are managed automatically.
+
+        :param project_id:
+            The ID of the project
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key prefetch: bool
+            Request the next page in the background while the current one is consumed (default: False)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
+        :return: Iterator of test suites
+        :returns: Iterator[dict]
+        """
+        return self._iter(self.get_suites, "suites", project_id, **kwargs)
 
     def add_suite(self, project_id: int, name: str, **kwargs) -> dict:
         """
@@ -2216,10 +2659,38 @@ class Tests(_MetaCategory):
 
         :param run_id:
             The ID of the test run
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
         :return: List of tests
         :returns: list[dict]
         """
-        return _bulk_api_method(self.get_tests, "tests", run_id, **kwargs)
+        return self._bulk(self.get_tests, "tests", run_id, **kwargs)
+
+    def iter_tests(self, run_id: int, **kwargs) -> Iterator[dict]:
+        """
+        Same as ``get_tests_bulk``, but lazily yields the objects page by page.
+
+        Accepts the same filters as ``get_tests`` except ``limit``/``offset``,
+        which are managed automatically.
+
+        :param run_id:
+            The ID of the test run
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key prefetch: bool
+            Request the next page in the background while the current one is consumed (default: False)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
+        :return: Iterator of tests
+        :returns: Iterator[dict]
+        """
+        return self._iter(self.get_tests, "tests", run_id, **kwargs)
 
 
 class Users(_MetaCategory):
@@ -2344,10 +2815,38 @@ class Users(_MetaCategory):
         :param project_id:
             The ID of the project for which you would like to retrieve user information.
             (Required for non-administrators. Requires TestRail 6.6 or later.)
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
         :return: List of users
         :returns: list[dict]
         """
-        return _bulk_api_method(self.get_users, "users", project_id, **kwargs)
+        return self._bulk(self.get_users, "users", project_id, **kwargs)
+
+    def iter_users(self, project_id: int | None = None, **kwargs) -> Iterator[dict]:
+        """
+        Same as ``get_users_bulk``, but lazily yields the objects page by page.
+
+        ``limit``/``offset`` are managed automatically.
+
+        :param project_id:
+            The ID of the project for which you would like to retrieve user information.
+            (Required for non-administrators. Requires TestRail 6.6 or later.)
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key prefetch: bool
+            Request the next page in the background while the current one is consumed (default: False)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
+        :return: Iterator of users
+        :returns: Iterator[dict]
+        """
+        return self._iter(self.get_users, "users", project_id, **kwargs)
 
 
 class SharedSteps(_MetaCategory):
@@ -2464,10 +2963,38 @@ class SharedSteps(_MetaCategory):
 
         :param project_id: int
             The ID of the project.
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
         :return: List of shared steps
         :returns: list[dict]
         """
-        return _bulk_api_method(self.get_shared_steps, "shared_steps", project_id, **kwargs)
+        return self._bulk(self.get_shared_steps, "shared_steps", project_id, **kwargs)
+
+    def iter_shared_steps(self, project_id: int, **kwargs) -> Iterator[dict]:
+        """
+        Same as ``get_shared_steps_bulk``, but lazily yields the objects page by page.
+
+        Accepts the same filters as ``get_shared_steps`` except ``limit``/``offset``,
+        which are managed automatically.
+
+        :param project_id: int
+            The ID of the project.
+        :key concurrency: int
+            Number of pages requested in parallel (default: 1)
+        :key prefetch: bool
+            Request the next page in the background while the current one is consumed (default: False)
+        :key page_size: int
+            Number of objects per request, up to 250 (default: 250)
+        :key on_page: Callable[[Page], Any]
+            Called for every page in offset order, e.g. to report progress
+        :return: Iterator of shared steps
+        :returns: Iterator[dict]
+        """
+        return self._iter(self.get_shared_steps, "shared_steps", project_id, **kwargs)
 
 
 class Roles(_MetaCategory):
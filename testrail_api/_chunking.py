@@ -0,0 +1,237 @@
+"""Chunked upload behind the ``add_results*_chunked`` methods."""
+
+import contextvars
+import json
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Final, NamedTuple
+
+from ._convert import convert_json
+from ._exception import ChunkedUploadError, RateLimitError, ServerError, StatusCodeError, TestRailAPIError
+from ._journal import Journal
+from ._retry import RetryPolicy
+
+CHUNK_SIZE: Final[int] = 1000
+CHUNK_BYTES: Final[int] = 8 * 2**20
+# ``{"results": []}`` around the chunk
+_ENVELOPE_BYTES: Final[int] = 15
+
+# backoff of the safe chunk retries when the session has no retry policy, its budget is not used
+_BACKOFF: Final[RetryPolicy] = RetryPolicy()
+
+_Chunk = tuple[int, list[Any]]
+
+
+class _Chunking(NamedTuple):
+    """Chunking options, accepted as keyword arguments of the ``*_chunked`` methods."""
+
+    chunk_size: int = CHUNK_SIZE
+    max_bytes: int | None = CHUNK_BYTES
+    concurrency: int = 1
+    retries: int = 2
+    retry_policy: RetryPolicy | None = None
+
+    @classmethod
+    def pop(cls, kwargs: dict[str, Any]) -> "_Chunking":
+        """Remove the chunking options from the keyword arguments and validate them."""
+        options = cls(**{name: kwargs.pop(name) for name in cls._fields if name in kwargs})
+        if kwargs:
+            raise TypeError(f"Unexpected keyword arguments: {', '.join(kwargs)}")
+        if options.chunk_size < 1:
+            raise ValueError(f"chunk_size must be a positive number, got {options.chunk_size}")
+        if options.max_bytes is not None and options.max_bytes <= _ENVELOPE_BYTES:
+            raise ValueError(f"max_bytes must be greater than {_ENVELOPE_BYTES}, got {options.max_bytes}")
+        if options.concurrency < 1:
+            raise ValueError(f"concurrency must be a positive number, got {options.concurrency}")
+        if options.retries < 0:
+            raise ValueError(f"retries must not be negative, got {options.retries}")
+        return options
+
+    def split(self, results: list[Any]) -> list[_Chunk]:
+        """
+        Split the results into ``(index of the first result, chunk)`` pairs.
+
+        A chunk holds up to ``chunk_size`` results and, with ``max_bytes``, a JSON body of up to ``max_bytes``
+        (measured with the standard ``json`` module, an upper bound of the compact encoders).
+        A single result larger than ``max_bytes`` is sent alone.
+        """
+        if self.max_bytes is None:
+            return [
+                (start, results[start : start + self.chunk_size]) for start in range(0, len(results), self.chunk_size)
+            ]
+        chunks: list[_Chunk] = []
+        start, size = 0, _ENVELOPE_BYTES
+        for index, result in enumerate(results):
+            # the item and its ", " separator
+            item = len(json.dumps(convert_json(result)).encode("utf-8")) + 2
+            if index > start and (index - start == self.chunk_size or size + item > self.max_bytes):
+                chunks.append((start, results[start:index]))
+                start, size = index, _ENVELOPE_BYTES
+            size += item
+        if start < len(results):
+            chunks.append((start, results[start:]))
+        return chunks
+
+
+def _connect_failed(error: BaseException) -> bool:
+    """Whether the request failed before it was sent: the server cannot have added the chunk."""
+    import requests  # noqa: PLC0415
+    from urllib3.exceptions import ConnectTimeoutError  # noqa: PLC0415
+
+    httpx = sys.modules.get("httpx")
+    if httpx is not None and isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+        return True
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    if not isinstance(error, requests.ConnectionError) or not error.args:
+        return False
+    # requests wraps the urllib3 error in a MaxRetryError, the other transports pass it as is
+    reason = getattr(error.args[0], "reason", error.args[0])
+    return isinstance(reason, ConnectTimeoutError) or (httpx is not None and isinstance(reason, httpx.ConnectError))
+
+
+def _safe_retry(error: BaseException) -> bool:
+    """Exhausted rate limits and connection failures: the chunk was not added, sending it again is safe."""
+    return isinstance(error, RateLimitError) or _connect_failed(error)
+
+
+def _transient(error: BaseException) -> bool:
+    """Server and transport errors (read timeouts included): the chunk may have been added anyway."""
+    return not isinstance(error, StatusCodeError) or isinstance(error, ServerError)
+
+
+def _retry_round(
+    options: _Chunking, errors: dict[int, Exception], pending: list[_Chunk], attempt: int
+) -> tuple[list[_Chunk], float]:
+    """
+    Pick the failed chunks to send again after the attempt ``attempt`` and the seconds to wait before.
+
+    The safe errors are retried with a backoff. The other transient errors are retried only when the
+    ``retry_policy`` allows POST requests, with its backoff and within its budget: a chunk that timed out
+    may have been added, retrying it can duplicate its results.
+    """
+    retry: list[_Chunk] = []
+    delay = 0.0
+    for chunk in pending:
+        error = errors.get(chunk[0])
+        if error is None:
+            continue
+        wait: float | None = None
+        if _safe_retry(error):
+            wait = (options.retry_policy or _BACKOFF).delay(attempt)
+        elif options.retry_policy is not None and _transient(error):
+            wait = options.retry_policy.retry("POST", attempt)
+        if wait is not None:
+            retry.append(chunk)
+            delay = max(delay, wait)
+    return retry, delay
+
+
+def _chunk_response(response: Any) -> list[Any]:
+    if not isinstance(response, list):
+        raise TestRailAPIError(
+            f"Expected a list of results, got {type(response).__name__}. "
+            "Chunked methods require a response handler returning the parsed JSON."
+        )
+    return response
+
+
+def _merge(
+    results: list[Any], chunks: list[_Chunk], added: dict[int, list[Any]], errors: dict[int, Exception]
+) -> list[Any]:
+    """Concatenate the responses in input order, raise :class:`ChunkedUploadError` when chunks failed."""
+    if not errors:
+        return [item for start, _ in chunks for item in added[start]]
+    merged: list[Any] = [None] * len(results)
+    for start, chunk in chunks:
+        if start in added:
+            merged[start : start + len(chunk)] = added[start]
+    sizes = {start: len(chunk) for start, chunk in chunks if start in errors}
+    first = errors[min(errors)]
+    raise ChunkedUploadError(
+        f"{len(errors)} of {len(chunks)} chunks ({sum(sizes.values())} results) failed, first error: {first!r}",
+        merged,
+        errors,
+        sizes,
+    ) from first
+
+
+def _chunked_api_method(func: Callable[[list[Any]], Any], results: list[Any], **kwargs: Any) -> list[Any]:
+    """
+    Send the results in chunks, ``func`` sends one chunk and returns the added results.
+
+    With ``concurrency > 1`` up to ``concurrency`` chunks are in flight on a thread pool.
+    The failed chunks are sent again, up to ``retries`` times, see :func:`_retry_round`;
+    the result keeps the input order.
+    """
+    options = _Chunking.pop(kwargs)
+    chunks = options.split(results)
+    added: dict[int, list[Any]] = {}
+    errors: dict[int, Exception] = {}
+    # the attempts of a chunk share its journal entry
+    uploads: dict[int, list[str]] = {start: [] for start, _ in chunks}
+
+    def send(chunk: _Chunk) -> None:
+        start, items = chunk
+        try:
+            with Journal.upload(uploads[start]):
+                added[start] = _chunk_response(func(items))
+        except Exception as e:  # noqa: BLE001
+            errors[start] = e
+        else:
+            errors.pop(start, None)
+
+    pending, delay = chunks, 0.0
+    with ThreadPoolExecutor(max_workers=options.concurrency, thread_name_prefix="testrail_api-chunk") as pool:
+        for attempt in range(options.retries + 1):
+            if delay:
+                time.sleep(delay)
+            if options.concurrency == 1:
+                for chunk in pending:
+                    send(chunk)
+            else:
+                # run in a copy of the caller context, so tracing spans keep their parent
+                futures = [pool.submit(contextvars.copy_context().run, send, chunk) for chunk in pending]
+                for future in futures:
+                    future.result()
+            if attempt == options.retries:
+                break
+            pending, delay = _retry_round(options, errors, pending, attempt)
+            if not pending:
+                break
+    return _merge(results, chunks, added, errors)
+
+
+async def _async_chunked_api_method(func: Callable[[list[Any]], Any], results: list[Any], **kwargs: Any) -> list[Any]:
+    """Asyncio counterpart of :func:`_chunked_api_method`, ``func`` returns an awaitable."""
+    import asyncio  # noqa: PLC0415
+
+    options = _Chunking.pop(kwargs)
+    chunks = options.split(results)
+    added: dict[int, list[Any]] = {}
+    errors: dict[int, Exception] = {}
+    semaphore = asyncio.Semaphore(options.concurrency)
+
+    async def send(chunk: _Chunk) -> None:
+        start, items = chunk
+        async with semaphore:
+            try:
+                added[start] = _chunk_response(await func(items))
+            except Exception as e:  # noqa: BLE001
+                errors[start] = e
+            else:
+                errors.pop(start, None)
+
+    pending, delay = chunks, 0.0
+    for attempt in range(options.retries + 1):
+        if delay:
+            await asyncio.sleep(delay)
+        await asyncio.gather(*(send(chunk) for chunk in pending))
+        if attempt == options.retries:
+            break
+        pending, delay = _retry_round(options, errors, pending, attempt)
+        if not pending:
+            break
+    return _merge(results, chunks, added, errors)
@@ -0,0 +1,78 @@
+"""Coalescing of identical concurrent requests."""
+
+import asyncio
+import copy
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+
+class Singleflight:
+    """
+    Run a single call at a time per key: the callers arriving while it is in flight wait for its result.
+
+    The leader gets the original result and every follower its own copy (or the exception),
+    so none of them sees the changes of another. Nothing is copied when no caller waited.
+    """
+
+    def __init__(self) -> None:
+        self.__calls: dict[Hashable, Future[list[Any]]] = {}
+        self.__tasks: dict[Hashable, asyncio.Future[tuple[Any, list[Any]]]] = {}
+        self.__followers: dict[Hashable, int] = {}
+        self.__lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], _T]) -> _T:
+        """Call ``func`` unless a call with the same key is in flight, in which case wait for its result."""
+        with self.__lock:
+            future = self.__calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self.__calls[key] = Future()
+                self.__followers[key] = 0
+            else:
+                self.__followers[key] += 1
+        if not leader:
+            return future.result().pop()
+        try:
+            result = func()
+        except BaseException as e:
+            self.__done(key)
+            future.set_exception(e)
+            raise
+        future.set_result([copy.deepcopy(result) for _ in range(self.__done(key))])
+        return result
+
+    def __done(self, key: Hashable) -> int:
+        """Forget the call, return the number of its followers: none can join it afterwards."""
+        with self.__lock:
+            del self.__calls[key]
+            return self.__followers.pop(key)
+
+    async def do_async(self, key: Hashable, func: Callable[[], Awaitable[_T]]) -> _T:
+        """
+        Asyncio counterpart of :meth:`do`.
+
+        The call runs in a task, so cancelling the leader does not cancel it for the followers.
+        """
+        task = self.__tasks.get(key)
+        if task is not None:
+            self.__followers[key] += 1
+            _, copies = await asyncio.shield(task)
+            return copies.pop()
+        self.__followers[key] = 0
+        task = self.__tasks[key] = asyncio.ensure_future(self.__lead(key, func))
+        result, _ = await asyncio.shield(task)
+        return result
+
+    async def __lead(self, key: Hashable, func: Callable[[], Awaitable[_T]]) -> tuple[_T, list[_T]]:
+        """Run the call, return its result and a copy of it for each follower."""
+        try:
+            result = await func()
+        finally:
+            # in the same step as the return: no follower joins once they are counted
+            del self.__tasks[key]
+            followers = self.__followers.pop(key)
+        return result, [copy.deepcopy(result) for _ in range(followers)]
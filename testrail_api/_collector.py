@@ -0,0 +1,280 @@
+"""Aggregation of the results of several worker processes into one uploader process."""
+
+import contextlib
+import logging
+import os
+import threading
+import time
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection, Listener
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Final
+
+from ._exception import TestRailError
+from ._reporter import ResultsReporter
+
+if TYPE_CHECKING:
+    from ._testrail_api import TestRailAPI
+
+logger = logging.getLogger(__package__)
+
+ADDRESS_ENV: Final[str] = "TESTRAIL_COLLECTOR"
+AUTHKEY_ENV: Final[str] = "TESTRAIL_COLLECTOR_KEY"
+# seconds between two checks of the shutdown by a worker connection handler
+_POLL_INTERVAL: Final[float] = 0.1
+# sent by close() to wake the acceptor up, told apart from the workers connected just before
+_WAKE: Final = ("wake",)
+
+
+def _parse_address(value: str) -> Any:
+    """Read an address exported by :attr:`ResultsCollector.environ`: a socket path, a pipe name or ``host:port``."""
+    host, _, port = value.rpartition(":")
+    if host and port.isdigit() and not value.startswith(("/", "\\\\")):
+        return host, int(port)
+    return value
+
+
+class ResultsCollector:
+    """
+    Receive the results of worker processes on a local socket and upload them from this process.
+
+    Every worker sends its results with a :class:`RemoteReporter`; the collector owns the only session
+    and batches them per run with a :class:`ResultsReporter` (the keyword arguments are passed to it),
+    so N workers cost the requests of one. :attr:`environ` holds the address and the authentication key
+    to export to the workers, e.g. from the controller of pytest-xdist before the workers start.
+
+    .. code-block:: python
+
+        with ResultsCollector(api, batch_size=500) as collector:
+            os.environ.update(collector.environ)
+            ...  # start the workers, each one calls RemoteReporter(run_id).add(...)
+    """
+
+    def __init__(
+        self, api: "TestRailAPI", address: Any = None, *, authkey: bytes | None = None, **options: Any
+    ) -> None:
+        """
+        Collector constructor, starts listening.
+
+        :param api:
+            Session uploading the results.
+        :param address:
+            Address of the listener, by default a Unix socket (a named pipe on Windows) in a temporary directory.
+        :param authkey:
+            Key the workers authenticate with, random by default.
+        :param options:
+            Options of the :class:`ResultsReporter` of every run.
+        """
+        self.authkey = os.urandom(32) if authkey is None else authkey
+        self.__api = api
+        self.__options = options
+        self.__reporters: dict[int, ResultsReporter] = {}
+        self.__handlers: list[threading.Thread] = []
+        self.__lock = threading.Lock()
+        self.__listener = Listener(address, authkey=self.authkey)
+        self.__closed = False
+        self.__stop = threading.Event()
+        self.__acceptor = threading.Thread(target=self.__accept, name="testrail_api-collector", daemon=True)
+        self.__acceptor.start()
+
+    @property
+    def address(self) -> Any:
+        """Address the workers connect to."""
+        return self.__listener.address
+
+    @property
+    def environ(self) -> dict[str, str]:
+        """Environment variables read by :class:`RemoteReporter` in the workers."""
+        address = self.address
+        if isinstance(address, tuple):
+            address = f"{address[0]}:{address[1]}"
+        return {ADDRESS_ENV: address, AUTHKEY_ENV: self.authkey.hex()}
+
+    @property
+    def sent(self) -> int:
+        """Number of results added to TestRail."""
+        with self.__lock:
+            return sum(reporter.sent for reporter in self.__reporters.values())
+
+    @property
+    def failed(self) -> list[dict[str, Any]]:
+        """Results that could not be added, see :attr:`ResultsReporter.failed`."""
+        with self.__lock:
+            return [result for reporter in self.__reporters.values() for result in reporter.failed]
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Send the results received so far; False when ``timeout`` expired first."""
+        with self.__lock:
+            reporters = list(self.__reporters.values())
+        return all(reporter.flush(timeout) for reporter in reporters)
+
+    def close(self, timeout: float | None = None) -> None:
+        """
+        Stop accepting workers, wait for the connected ones to disconnect, and send the remaining results.
+
+        :param timeout: seconds to wait for the connected workers, None to wait until they all disconnect;
+            the workers still connected then are dropped
+        """
+        with self.__lock:
+            if self.__closed:
+                return
+            self.__closed = True
+        # wake the acceptor up: closing the listener does not interrupt a pending accept on every platform
+        with (
+            contextlib.suppress(OSError, EOFError, AuthenticationError),
+            Client(self.address, authkey=self.authkey) as connection,
+        ):
+            connection.send(_WAKE)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        self.__acceptor.join(None if deadline is None else max(deadline - time.monotonic(), 0))
+        for handler in self.__handlers:
+            handler.join(None if deadline is None else max(deadline - time.monotonic(), 0))
+        self.__stop.set()
+        self.__acceptor.join()
+        # the acceptor has stopped: the list of handlers is complete
+        for handler in self.__handlers:
+            handler.join()
+        # every handler has stopped: no reporter can be added anymore
+        with self.__lock:
+            reporters = list(self.__reporters.values())
+        for reporter in reporters:
+            reporter.close()
+
+    def __enter__(self) -> "ResultsCollector":
+        """Return the collector."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the collector, sending the remaining results."""
+        self.close()
+
+    def __reporter(self, run_id: int) -> ResultsReporter:
+        with self.__lock:
+            reporter = self.__reporters.get(run_id)
+            if reporter is None:
+                reporter = self.__reporters[run_id] = ResultsReporter(self.__api, run_id, **self.__options)
+            return reporter
+
+    def __accept(self) -> None:
+        while True:
+            try:
+                connection = self.__listener.accept()
+            except Exception:
+                # keep accepting until the wake-up connection: the workers queued before it are served
+                if self.__stop.is_set():
+                    break
+                logger.exception("Worker connection refused")
+                continue
+            message = None
+            if self.__closed:
+                # the wake-up connection of close() or a worker connected just before, whose results are kept
+                try:
+                    message = self.__first_message(connection)
+                except (EOFError, OSError):
+                    connection.close()
+                    continue
+                if message == _WAKE:
+                    connection.close()
+                    break
+            handler = threading.Thread(
+                target=self.__handle, args=(connection, message), name="testrail_api-collector-worker", daemon=True
+            )
+            handler.start()
+            self.__handlers.append(handler)
+        self.__listener.close()
+
+    def __first_message(self, connection: Connection) -> Any:
+        """Wait for the first message of a connection; None when none came before the collector stopped."""
+        while not connection.poll(_POLL_INTERVAL):
+            if self.__stop.is_set():
+                return None
+        return connection.recv()
+
+    def __handle(self, connection: Connection, message: Any = None) -> None:
+        """Serve a worker until it disconnects or the collector stops, from its first ``message`` if already read."""
+        with connection:
+            while True:
+                try:
+                    if message is None:
+                        if not connection.poll(_POLL_INTERVAL):
+                            if self.__stop.is_set():
+                                logger.warning("Worker still connected at the close of the collector, dropped")
+                                return
+                            continue
+                        message = connection.recv()
+                    self.__dispatch(connection, message)
+                except (EOFError, OSError):
+                    return
+                except Exception:
+                    logger.exception("Message of a worker dropped")
+                message = None
+
+    def __dispatch(self, connection: Connection, message: Any) -> None:
+        if message[0] == "result":
+            _, run_id, result = message
+            try:
+                self.__reporter(run_id).add(**result)
+            except TestRailError:
+                logger.exception("Result of case %s for run %s dropped", result.get("case_id"), run_id)
+        elif message[0] == "flush":
+            with self.__lock:
+                reporter = self.__reporters.get(message[1])
+            connection.send(reporter is None or reporter.flush(message[2]))
+        else:
+            raise TestRailError(f"Unknown message {message[0]!r}")
+
+
+class RemoteReporter:
+    """
+    Send results to a :class:`ResultsCollector` from a worker process, the interface of :class:`ResultsReporter`.
+
+    ``address`` and ``authkey`` default to the ``TESTRAIL_COLLECTOR``/``TESTRAIL_COLLECTOR_KEY`` environment
+    variables exported from :attr:`ResultsCollector.environ`. The worker needs no TestRail session.
+    """
+
+    def __init__(self, run_id: int, address: Any = None, *, authkey: bytes | None = None) -> None:
+        if address is None and ADDRESS_ENV in os.environ:
+            address = _parse_address(os.environ[ADDRESS_ENV])
+        if authkey is None and AUTHKEY_ENV in os.environ:
+            authkey = bytes.fromhex(os.environ[AUTHKEY_ENV])
+        if address is None or authkey is None:
+            raise TestRailError(f"No collector address or key, set {ADDRESS_ENV} and {AUTHKEY_ENV}")
+        self.run_id = run_id
+        self.__connection = Client(address, authkey=authkey)
+        self.__lock = threading.Lock()
+
+    def add(self, case_id: int, status_id: int | None = None, **fields: Any) -> None:
+        """Send the result of a case to the collector, the same fields as ``add_result_for_case``."""
+        if status_id is not None:
+            fields["status_id"] = status_id
+        with self.__lock:
+            self.__connection.send(("result", self.run_id, {"case_id": case_id, **fields}))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Ask the collector to send the results of the run now and wait until they are sent."""
+        with self.__lock:
+            self.__connection.send(("flush", self.run_id, timeout))
+            return bool(self.__connection.recv())
+
+    def close(self) -> None:
+        """Disconnect from the collector, the results already sent are kept."""
+        with self.__lock:
+            self.__connection.close()
+
+    def __enter__(self) -> "RemoteReporter":
+        """Return the reporter."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Disconnect from the collector."""
+        self.close()
@@ -0,0 +1,124 @@
+"""Conversion of the GET parameters and POST bodies to the values TestRail expects."""
+
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from decimal import Decimal
+from enum import Enum
+from pathlib import PurePath
+from typing import Any, Final, TypeVar
+
+_T = TypeVar("_T")
+
+# Sent as is: checked by exact type, so the subclasses (IntEnum, StrEnum, ...) still go through their converter.
+_PLAIN: Final[frozenset[type]] = frozenset({str, int, float, bool, type(None)})
+
+_CONVERTERS: dict[type, Callable[[Any], Any]] = {}
+# Converter resolved for every type met so far (``None`` when there is none), rebuilt on registration.
+_DISPATCH: dict[type, Callable[[Any], Any] | None] = {}
+
+
+def register_converter(cls: type[_T], converter: Callable[[_T], Any]) -> None:
+    """
+    Convert the values of ``cls`` (and its subclasses) in the GET parameters and POST bodies.
+
+    ``converter`` returns a JSON-compatible value, itself converted if needed.
+    GET parameters are then sent as strings: ``True`` as ``1``, collections as ``1,2,3``.
+
+    .. code-block:: python
+
+        register_converter(Version, str)
+    """
+    _CONVERTERS[cls] = converter
+    _DISPATCH.clear()
+
+
+def _resolve(cls: type) -> Callable[[Any], Any] | None:
+    """Return the converter of the closest registered base class."""
+    if (converter := _DISPATCH.get(cls, _resolve)) is not _resolve:
+        return converter
+    converter = next((_CONVERTERS[base] for base in cls.__mro__ if base in _CONVERTERS), None)
+    _DISPATCH[cls] = converter
+    return converter
+
+
+def _elapsed(value: timedelta) -> str:
+    """Format a duration as a TestRail timespan, e.g. ``1h 30m 5s``."""
+    minutes, seconds = divmod(max(round(value.total_seconds()), 0), 60)
+    hours, minutes = divmod(minutes, 60)
+    parts = [f"{hours}h"] if hours else []
+    if minutes:
+        parts.append(f"{minutes}m")
+    if seconds or not parts:
+        parts.append(f"{seconds}s")
+    return " ".join(parts)
+
+
+register_converter(Enum, lambda member: member.value)
+register_converter(datetime, lambda value: round(value.timestamp()))
+register_converter(timedelta, _elapsed)
+register_converter(PurePath, str)
+register_converter(Decimal, float)
+# Mappings and sequences of other types are converted as the builtin containers.
+register_converter(dict, dict)
+register_converter(list, list)
+register_converter(tuple, list)
+
+
+def convert_json(value: Any) -> Any:
+    """
+    Convert a POST body recursively.
+
+    The containers are copied only on the path to a converted value: a body made of plain values,
+    e.g. thousands of results with ints and strings, is returned as is.
+    """
+    cls = type(value)
+    if cls in _PLAIN:
+        return value
+    if cls is dict:
+        converted = None
+        for key, item in value.items():
+            new = item if type(item) in _PLAIN else convert_json(item)
+            if new is not item:
+                if converted is None:
+                    converted = dict(value)
+                converted[key] = new
+        return value if converted is None else converted
+    if cls is list or cls is tuple:
+        items = None
+        for index, item in enumerate(value):
+            new = item if type(item) in _PLAIN else convert_json(item)
+            if new is not item:
+                if items is None:
+                    items = list(value)
+                items[index] = new
+        return value if items is None else items
+    if (converter := _resolve(cls)) is None:
+        return value
+    value = converter(value)
+    return value if type(value) in _PLAIN else convert_json(value)
+
+
+def _convert_scalar(value: Any) -> Any:
+    """Convert a GET parameter value, except the collections."""
+    while (
+        type(value) not in _PLAIN
+        and not isinstance(value, (list, tuple, set, dict))
+        and (converter := _resolve(type(value))) is not None
+    ):
+        value = converter(value)
+    # Converting a boolean value to integer
+    return int(value) if type(value) is bool else value
+
+
+def convert_params(params: dict[Any, Any]) -> dict[Any, Any]:
+    """Convert GET parameters, returning a new dict."""
+    converted: dict[Any, Any] = {}
+    for key, raw_value in params.items():
+        value = raw_value if type(raw_value) in _PLAIN and type(raw_value) is not bool else _convert_scalar(raw_value)
+        if isinstance(value, (list, tuple, set)):
+            # A collection is sent as a string '1,2,3' (sets are sorted for determinism)
+            items = sorted(value, key=str) if isinstance(value, set) else value
+            converted[key] = ",".join(str(_convert_scalar(item)) for item in items)
+        else:
+            converted[key] = value
+    return converted
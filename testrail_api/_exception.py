@@ -1,6 +1,6 @@
 """Exceptions."""
 
-from typing import TYPE_CHECKING, Final
+from typing import TYPE_CHECKING, Any, Final
 
 if TYPE_CHECKING:
     import requests
@@ -59,6 +59,24 @@ class ServerError(StatusCodeError):
     """Raised for HTTP 5xx responses."""
 
 
+class ChunkedUploadError(TestRailAPIError):
+    """
+    Raised by the ``*_chunked`` methods when chunks still fail after their retries.
+
+    The other chunks were added: ``results`` holds the added results in input order,
+    ``None`` in place of the results of the failed chunks, ``errors`` maps the index
+    of the first result of every failed chunk to its exception and ``sizes`` to its number of results.
+    """
+
+    def __init__(
+        self, message: str, results: list[Any], errors: dict[int, Exception], sizes: dict[int, int] | None = None
+    ) -> None:
+        super().__init__(message)
+        self.results = results
+        self.errors = errors
+        self.sizes = {} if sizes is None else sizes
+
+
 _SERVER_ERROR_FLOOR: Final[int] = 500
 _STATUS_EXCEPTIONS: Final[dict[int, type[StatusCodeError]]] = {
     401: AuthError,
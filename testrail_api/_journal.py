@@ -0,0 +1,259 @@
+"""Write-ahead journal of the result and attachment uploads."""
+
+import contextlib
+import contextvars
+import json
+import logging
+import os
+import threading
+import uuid
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Final
+
+from ._convert import convert_json
+from ._enums import METHODS
+
+if TYPE_CHECKING:
+    from ._session import Session
+
+logger = logging.getLogger(__package__)
+
+JOURNALED: Final[tuple[str, ...]] = ("add_result", "add_attachment")
+
+_SERVER_ERROR_FLOOR: Final[int] = 500
+_RATE_LIMIT: Final[int] = 429
+
+# Set while a write is already covered by the journal: replayed entries, batches of the ResultsReporter.
+_suspended: contextvars.ContextVar[bool] = contextvars.ContextVar("testrail_api_journal_suspended", default=False)
+# Entry shared by the attempts of one upload, see Journal.upload
+_upload: contextvars.ContextVar[list[str] | None] = contextvars.ContextVar("testrail_api_journal_upload", default=None)
+
+
+def acknowledged(status_code: int) -> bool:
+    """Whether a response settles a write: the server errors and the rate limit leave it pending."""
+    return status_code < _SERVER_ERROR_FLOOR and status_code != _RATE_LIMIT
+
+
+class Journal:
+    """
+    Append-only JSONL journal of the uploads, so they survive a crash or a network outage.
+
+    Every ``add_result*``/``add_attachment*`` request of a session created with ``journal=`` is appended
+    as pending before it is sent, and acknowledged once the server has answered it (any status except
+    a 5xx or a 429). The entries still pending are replayed when the next session opens the journal:
+    the results of the same endpoint are sent in batches, the attachments are sent again from their file.
+    A :class:`ResultsReporter` journals the results as they are added, before they are buffered.
+
+    The file is rewritten with the pending entries only when opened, and truncated once none is pending.
+    A journal belongs to one process: give every worker its own file.
+    """
+
+    def __init__(self, path: Path | str, *, fsync: bool = True) -> None:
+        """
+        Open a journal, creating the file if needed.
+
+        :param path:
+            Path of the JSONL file.
+        :param fsync:
+            Flush every entry to the disk before the request is sent (default: True);
+            without it an entry may be lost in an OS crash, not in a crash of the process.
+        """
+        self.path = Path(path)
+        self.fsync = fsync
+        self.__lock = threading.Lock()
+        self.__pending = self.__load()
+        self.__file = self.__rewrite()
+
+    def __repr__(self) -> str:
+        return f"Journal(path={str(self.path)!r}, pending={len(self.__pending)})"
+
+    @property
+    def pending(self) -> list[dict[str, Any]]:
+        """Entries not acknowledged yet, in journal order: ``{"id", "endpoint", "json" or "file"}``."""
+        with self.__lock:
+            return list(self.__pending.values())
+
+    def append(self, endpoint: str, *, json: Any = None, file: Path | str | None = None) -> str:
+        """Record a pending upload of a JSON body or of a file, return the id of the entry."""
+        entry: dict[str, Any] = {"id": uuid.uuid4().hex, "endpoint": endpoint}
+        if file is not None:
+            entry["file"] = str(Path(file).absolute())
+        else:
+            entry["json"] = convert_json(json)
+        with self.__lock:
+            self.__write(entry)
+            self.__pending[entry["id"]] = entry
+        return entry["id"]
+
+    def record(self, endpoint: str, *, json: Any = None, file: Path | str | None = None) -> str | None:
+        """
+        Journal an upload sent by the session, return the id of its entry or None when it is not journaled.
+
+        Inside :meth:`upload` only the first attempt appends an entry, the next ones reuse it.
+        """
+        if not self.covers(endpoint):
+            return None
+        shared = _upload.get()
+        if shared:
+            return shared[0]
+        entry_id = self.append(endpoint, json=json, file=file)
+        if shared is not None:
+            shared.append(entry_id)
+        return entry_id
+
+    def ack(self, *ids: str) -> None:
+        """Mark entries as acknowledged by the server."""
+        with self.__lock:
+            for entry_id in ids:
+                self.__pending.pop(entry_id, None)
+            if not self.__pending:
+                self.__file.truncate(0)
+            elif ids:
+                self.__write({"ack": list(ids)})
+
+    def settle(self, entry_id: str, status_code: int) -> None:
+        """Acknowledge an entry if the status of its response settles the write, see :func:`acknowledged`."""
+        if acknowledged(status_code):
+            self.ack(entry_id)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def suspended() -> Iterator[None]:
+        """Do not journal the requests sent in this context: they are already covered by entries."""
+        token = _suspended.set(True)
+        try:
+            yield
+        finally:
+            _suspended.reset(token)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def upload(shared: list[str] | None = None) -> Iterator[None]:
+        """
+        Journal the requests sent in this context as the attempts of one upload: they share one entry.
+
+        Wrap the retries of an upload in it, so a failed attempt does not leave its own entry pending
+        and the upload is not sent again by the next replay once a later attempt succeeded.
+
+        :param shared:
+            Holds the entry between several ``with`` blocks of the same upload (default: a new one).
+        """
+        token = _upload.set([] if shared is None else shared)
+        try:
+            yield
+        finally:
+            _upload.reset(token)
+
+    @property
+    def active(self) -> bool:
+        """False inside :meth:`suspended`."""
+        return not _suspended.get()
+
+    def covers(self, endpoint: str) -> bool:
+        """Whether a POST to ``endpoint`` is journaled: the result and attachment uploads, outside :meth:`suspended`."""
+        return self.active and endpoint.startswith(JOURNALED)
+
+    def replay(self, session: "Session") -> int:
+        """
+        Send the pending entries again, acknowledging them as they succeed; return the number of sent requests.
+
+        Stops at the first request that is not acknowledged, the remaining entries are kept for the next replay.
+        """
+        sent = 0
+        response: Any
+        with self.suspended():
+            for entries in self.__batches():
+                endpoint = entries[0]["endpoint"]
+                try:
+                    if "file" in entries[0]:
+                        if not Path(entries[0]["file"]).exists():
+                            logger.warning("Journaled attachment %s no longer exists, dropped", entries[0]["file"])
+                            self.ack(entries[0]["id"])
+                            continue
+                        response = session.attachment_request(METHODS.POST, endpoint, entries[0]["file"], raw=True)
+                    else:
+                        body = entries[0]["json"]
+                        if len(entries) > 1:
+                            body = {"results": [result for entry in entries for result in entry["json"]["results"]]}
+                        response = session.request(METHODS.POST, endpoint, raw=True, json=body)
+                except Exception as e:  # noqa: BLE001
+                    response = e
+                if isinstance(response, Exception) or not acknowledged(response.status_code):
+                    logger.warning(
+                        "Replay of the journal %s stopped, %d entries pending: %r",
+                        self.path,
+                        len(self.pending),
+                        response,
+                    )
+                    break
+                self.ack(*(entry["id"] for entry in entries))
+                sent += 1
+        if sent:
+            logger.info("Replayed %d requests from the journal %s", sent, self.path)
+        return sent
+
+    def close(self) -> None:
+        """Close the file, the pending entries stay in it."""
+        with self.__lock:
+            self.__file.close()
+
+    def __batches(self) -> Iterator[list[dict[str, Any]]]:
+        """Group the consecutive pending results of the same ``add_results*`` endpoint, up to a chunk."""
+        from ._chunking import CHUNK_SIZE  # noqa: PLC0415
+
+        batch: list[dict[str, Any]] = []
+        size = 0
+        for entry in self.pending:
+            body = entry.get("json")
+            results = (
+                body.get("results") if isinstance(body, dict) and entry["endpoint"].startswith("add_results") else None
+            )
+            if batch and (
+                results is None or entry["endpoint"] != batch[0]["endpoint"] or size + len(results) > CHUNK_SIZE
+            ):
+                yield batch
+                batch, size = [], 0
+            if results is None:
+                yield [entry]
+                continue
+            batch.append(entry)
+            size += len(results)
+        if batch:
+            yield batch
+
+    def __write(self, record: dict[str, Any]) -> None:
+        self.__file.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+        self.__file.flush()
+        if self.fsync:
+            os.fsync(self.__file.fileno())
+
+    def __load(self) -> dict[str, dict[str, Any]]:
+        pending: dict[str, dict[str, Any]] = {}
+        if not self.path.exists():
+            return pending
+        with self.path.open(encoding="utf-8") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # the last line of a crashed process may be incomplete
+                    continue
+                if "ack" in record:
+                    for entry_id in record["ack"]:
+                        pending.pop(entry_id, None)
+                else:
+                    pending[record["id"]] = record
+        return pending
+
+    def __rewrite(self) -> Any:
+        """Replace the file with the pending entries only, return it opened for appending."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as file:
+            for entry in self.__pending.values():
+                file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+        tmp.replace(self.path)
+        return self.path.open("a", encoding="utf-8")
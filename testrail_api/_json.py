@@ -0,0 +1,65 @@
+"""Pluggable JSON encoding of request bodies and decoding of responses."""
+
+import importlib
+import importlib.util
+import json
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+from ._exception import TestRailError
+
+
+class JSONBackend(NamedTuple):
+    """JSON encoder/decoder working on bytes; ``errors`` are the exceptions raised on invalid JSON."""
+
+    name: str
+    dumps: Callable[[Any], bytes]
+    loads: Callable[[bytes], Any]
+    errors: tuple[type[Exception], ...] = (ValueError,)
+
+
+def _stdlib() -> JSONBackend:
+    # the same output as the ``json=`` argument of requests
+    return JSONBackend(
+        name="json",
+        dumps=lambda obj: json.dumps(obj, allow_nan=False).encode("utf-8"),
+        loads=json.loads,
+    )
+
+
+def _orjson() -> JSONBackend:
+    orjson = importlib.import_module("orjson")
+    return JSONBackend(name="orjson", dumps=orjson.dumps, loads=orjson.loads)
+
+
+def _msgspec() -> JSONBackend:
+    msgspec = importlib.import_module("msgspec")
+    return JSONBackend(
+        name="msgspec",
+        dumps=msgspec.json.encode,
+        loads=msgspec.json.decode,
+        errors=(msgspec.DecodeError, ValueError),
+    )
+
+
+_BACKENDS: dict[str, Callable[[], JSONBackend]] = {"json": _stdlib, "orjson": _orjson, "msgspec": _msgspec}
+
+
+def get_json_backend(backend: "str | JSONBackend") -> JSONBackend:
+    """
+    Resolve a JSON backend by name.
+
+    :param backend:
+        ``"json"`` (standard library), ``"orjson"``, ``"msgspec"``, ``"auto"`` for the fastest
+        installed one, or a :class:`JSONBackend`.
+    """
+    if isinstance(backend, JSONBackend):
+        return backend
+    if backend == "auto":
+        backend = next((name for name in ("orjson", "msgspec") if importlib.util.find_spec(name)), "json")
+    if backend not in _BACKENDS:
+        raise TestRailError(f"Unknown JSON backend {backend!r}, expected one of: auto, {', '.join(_BACKENDS)}")
+    try:
+        return _BACKENDS[backend]()
+    except ImportError as e:
+        raise TestRailError(f"JSON backend {backend!r} is not installed, install it with: pip install {backend}") from e
@@ -0,0 +1,159 @@
+"""Per-endpoint request metrics."""
+
+import bisect
+import re
+import threading
+from collections import Counter
+from collections.abc import Sequence
+from typing import Any, Final
+
+LATENCY_BUCKETS: Final[tuple[float, ...]] = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_ID_SEGMENT: Final[re.Pattern[str]] = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Replace the object ids of an endpoint, ``get_results_for_run/12`` -> ``get_results_for_run/{id}``."""
+    return _ID_SEGMENT.sub("/{id}", endpoint)
+
+
+class _EndpointMetrics:
+    def __init__(self, buckets: int) -> None:
+        self.requests = 0
+        self.errors: Counter[str] = Counter()
+        self.latency_sum = 0.0
+        self.latency_buckets = [0] * buckets
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.retries = 0
+        self.rate_limit_sleeps = 0
+        self.rate_limit_seconds = 0.0
+
+
+class Metrics:
+    """
+    Collector of request metrics, by endpoint template.
+
+    Every attempt is counted, retries included: request count, latency histogram,
+    bytes sent/received, errors by class, retries and HTTP 429 sleeps.
+    May be shared by several sessions.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        """
+        Metrics constructor.
+
+        :param buckets:
+            Upper bounds in seconds of the latency histogram buckets.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.__endpoints: dict[str, _EndpointMetrics] = {}
+        self.__lock = threading.Lock()
+
+    def __get(self, endpoint: str) -> _EndpointMetrics:
+        template = endpoint_template(endpoint)
+        if (metrics := self.__endpoints.get(template)) is None:
+            metrics = self.__endpoints[template] = _EndpointMetrics(len(self.buckets))
+        return metrics
+
+    def observe(
+        self,
+        endpoint: str,
+        seconds: float,
+        *,
+        sent: int = 0,
+        received: int = 0,
+        error: str | None = None,
+    ) -> None:
+        """Record a request attempt; ``error`` is the error class name of a failed one."""
+        with self.__lock:
+            metrics = self.__get(endpoint)
+            metrics.requests += 1
+            metrics.latency_sum += seconds
+            if (index := bisect.bisect_left(self.buckets, seconds)) < len(self.buckets):
+                metrics.latency_buckets[index] += 1
+            metrics.bytes_sent += sent
+            metrics.bytes_received += received
+            if error is not None:
+                metrics.errors[error] += 1
+
+    def retry(self, endpoint: str, *, rate_limit_delay: float | None = None) -> None:
+        """Record a retry, ``rate_limit_delay`` is the sleep before the retry of a 429 response."""
+        with self.__lock:
+            metrics = self.__get(endpoint)
+            metrics.retries += 1
+            if rate_limit_delay is not None:
+                metrics.rate_limit_sleeps += 1
+                metrics.rate_limit_seconds += rate_limit_delay
+
+    def reset(self) -> None:
+        """Drop all the recorded metrics."""
+        with self.__lock:
+            self.__endpoints.clear()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Snapshot of the metrics by endpoint template; latency buckets are cumulative like in Prometheus."""
+        with self.__lock:
+            result = {}
+            for template, metrics in sorted(self.__endpoints.items()):
+                cumulative, buckets = 0, {}
+                for bound, count in zip(self.buckets, metrics.latency_buckets, strict=True):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                result[template] = {
+                    "requests": metrics.requests,
+                    "errors": dict(metrics.errors),
+                    "retries": metrics.retries,
+                    "rate_limit_sleeps": metrics.rate_limit_sleeps,
+                    "rate_limit_seconds": metrics.rate_limit_seconds,
+                    "bytes_sent": metrics.bytes_sent,
+                    "bytes_received": metrics.bytes_received,
+                    "latency_sum": metrics.latency_sum,
+                    "latency_avg": metrics.latency_sum / metrics.requests if metrics.requests else 0.0,
+                    "latency_buckets": buckets,
+                }
+            return result
+
+    def to_prometheus(self, prefix: str = "testrail_api") -> str:
+        """Export the metrics in the Prometheus text exposition format."""
+        families: dict[str, tuple[str, str, list[str]]] = {
+            name: (kind, text, [])
+            for name, kind, text in (
+                ("requests_total", "counter", "Requests sent to TestRail, retries included."),
+                ("request_duration_seconds", "histogram", "Request latency."),
+                ("errors_total", "counter", "Failed requests by error class."),
+                ("retries_total", "counter", "Retried requests."),
+                ("rate_limit_sleeps_total", "counter", "Sleeps after HTTP 429."),
+                ("rate_limit_sleep_seconds_total", "counter", "Seconds slept after HTTP 429."),
+                ("sent_bytes_total", "counter", "Request body bytes sent."),
+                ("received_bytes_total", "counter", "Response body bytes received."),
+            )
+        }
+
+        def add(family: str, value: float, suffix: str = "", **labels: str) -> None:
+            text = ",".join(f'{key}="{_escape(label)}"' for key, label in labels.items())
+            families[family][2].append(f"{prefix}_{family}{suffix}{{{text}}} {value}")
+
+        for endpoint, stats in self.stats().items():
+            add("requests_total", stats["requests"], endpoint=endpoint)
+            for bound, count in stats["latency_buckets"].items():
+                add("request_duration_seconds", count, "_bucket", endpoint=endpoint, le=str(bound))
+            add("request_duration_seconds", stats["requests"], "_bucket", endpoint=endpoint, le="+Inf")
+            add("request_duration_seconds", stats["latency_sum"], "_sum", endpoint=endpoint)
+            add("request_duration_seconds", stats["requests"], "_count", endpoint=endpoint)
+            for error, count in sorted(stats["errors"].items()):
+                add("errors_total", count, endpoint=endpoint, error=error)
+            add("retries_total", stats["retries"], endpoint=endpoint)
+            add("rate_limit_sleeps_total", stats["rate_limit_sleeps"], endpoint=endpoint)
+            add("rate_limit_sleep_seconds_total", stats["rate_limit_seconds"], endpoint=endpoint)
+            add("sent_bytes_total", stats["bytes_sent"], endpoint=endpoint)
+            add("received_bytes_total", stats["bytes_received"], endpoint=endpoint)
+
+        lines = []
+        for family, (kind, text, samples) in families.items():
+            lines += [f"# HELP {prefix}_{family} {text}", f"# TYPE {prefix}_{family} {kind}", *samples]
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
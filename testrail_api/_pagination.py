@@ -0,0 +1,217 @@
+"""Offset pagination behind the ``*_bulk`` and ``iter_*`` methods."""
+
+import contextvars
+import itertools
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Final, NamedTuple
+
+from ._exception import TestRailAPIError
+
+if TYPE_CHECKING:
+    import asyncio
+
+LIMIT_MAX: Final[int] = 250
+
+
+class Page(NamedTuple):
+    """One page of a paginated response, passed to the ``on_page`` callback of ``*_bulk``/``iter_*`` methods."""
+
+    offset: int
+    limit: int
+    size: int
+    next: str | None
+    is_last: bool
+    fetched: int
+    items: list[Any]
+
+    @property
+    def total(self) -> int | None:
+        """Total number of objects, known once the last page has arrived."""
+        return self.fetched if self.is_last else None
+
+
+class _Pagination(NamedTuple):
+    """Pagination options, accepted as keyword arguments next to the endpoint filters."""
+
+    concurrency: int = 1
+    prefetch: bool = False
+    page_size: int = LIMIT_MAX
+    on_page: Callable[[Page], Any] | None = None
+
+    @classmethod
+    def pop(cls, kwargs: dict[str, Any]) -> "_Pagination":
+        """Remove the pagination options from the endpoint filters and validate them."""
+        if "limit" in kwargs or "offset" in kwargs:
+            raise TypeError(
+                "limit and offset are managed automatically by *_bulk methods, use the regular method instead"
+            )
+        options = cls(**{name: kwargs.pop(name) for name in cls._fields if name in kwargs})
+        if options.concurrency < 1:
+            raise ValueError(f"concurrency must be a positive number, got {options.concurrency}")
+        if not 1 <= options.page_size <= LIMIT_MAX:
+            raise ValueError(f"page_size must be between 1 and {LIMIT_MAX}, got {options.page_size}")
+        return options
+
+    def offsets(self) -> Iterator[int]:
+        return itertools.count(0, self.page_size)
+
+
+def _bulk_page(response: Any, resp_key: str, offset: int, options: _Pagination, fetched: int) -> Page:
+    """
+    Build a :class:`Page` from a paginated response.
+
+    The last page is detected by ``_links.next`` (TestRail 6.7+), or by a short page
+    when the response has no links, so a collection whose size is a multiple
+    of the page size costs no trailing empty request.
+    """
+    if not isinstance(response, dict) or resp_key not in response:
+        raise TestRailAPIError(
+            f"Expected a paginated response with the {resp_key!r} key, got {type(response).__name__}. "
+            "Bulk methods require TestRail 6.7+ pagination and a response handler returning the parsed JSON."
+        )
+    items = response[resp_key] or []
+    links = response.get("_links")
+    if isinstance(links, dict) and "next" in links:
+        _next = links["next"] or None
+        is_last = _next is None
+    else:
+        _next = None
+        is_last = len(items) < options.page_size
+    page = Page(
+        offset=offset,
+        limit=options.page_size,
+        size=response.get("size", len(items)),
+        next=_next,
+        is_last=is_last or not items,
+        fetched=fetched + len(items),
+        items=items,
+    )
+    if options.on_page is not None:
+        options.on_page(page)
+    return page
+
+
+def _iter_pages(
+    func: Callable[..., Any],
+    resp_key: str,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    options: _Pagination,
+) -> Iterator[Page]:
+    """
+    Yield the pages of a paginated endpoint in offset order.
+
+    With ``concurrency > 1`` up to ``concurrency`` page requests are kept in flight
+    on a thread pool; the speculative requests past the last page are dropped.
+    With ``prefetch`` the next page is requested in the background as soon as a full page
+    arrives, so the network round trip overlaps the processing of the current page.
+    """
+    offsets = options.offsets()
+    fetched = 0
+
+    def fetch(offset: int) -> Any:
+        return func(*args, **kwargs, offset=offset, limit=options.page_size)
+
+    if options.concurrency == 1 and not options.prefetch:
+        for offset in offsets:
+            page = _bulk_page(fetch(offset), resp_key, offset, options, fetched)
+            fetched = page.fetched
+            yield page
+            if page.is_last:
+                break
+        return
+
+    pool = ThreadPoolExecutor(max_workers=options.concurrency, thread_name_prefix="testrail_api-bulk")
+
+    def submit(offset: int) -> tuple[int, Future[Any]]:
+        # run in a copy of the caller context, so tracing spans keep their parent
+        return offset, pool.submit(contextvars.copy_context().run, fetch, offset)
+
+    try:
+        pending = deque(submit(offset) for offset in itertools.islice(offsets, options.concurrency))
+        while pending:
+            offset, future = pending.popleft()
+            page = _bulk_page(future.result(), resp_key, offset, options, fetched)
+            fetched = page.fetched
+            if page.is_last:
+                yield page
+                return
+            pending.append(submit(next(offsets)))
+            yield page
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _aiter_pages(
+    func: Callable[..., Any],
+    resp_key: str,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    options: _Pagination,
+) -> AsyncIterator[Page]:
+    """Asyncio counterpart of :func:`_iter_pages`, ``func`` returns an awaitable."""
+    import asyncio  # noqa: PLC0415
+
+    offsets = options.offsets()
+    fetched = 0
+    ahead = options.prefetch or options.concurrency > 1
+
+    def fetch(offset: int) -> tuple[int, "asyncio.Future[Any]"]:
+        return offset, asyncio.ensure_future(func(*args, **kwargs, offset=offset, limit=options.page_size))
+
+    pending = deque(fetch(offset) for offset in itertools.islice(offsets, options.concurrency))
+    try:
+        while pending:
+            offset, task = pending.popleft()
+            page = _bulk_page(await task, resp_key, offset, options, fetched)
+            fetched = page.fetched
+            if page.is_last:
+                yield page
+                return
+            if ahead:
+                pending.append(fetch(next(offsets)))
+            yield page
+            if not ahead:
+                pending.append(fetch(next(offsets)))
+    finally:
+        for _, task in pending:
+            task.cancel()
+        await asyncio.gather(*(task for _, task in pending), return_exceptions=True)
+
+
+def _bulk_api_method(func: Callable[..., Any], resp_key: str, *args: Any, **kwargs: Any) -> list[Any]:
+    """
+    Get all the objects handling the pagination via offset.
+
+    Stops on the last page: no ``_links.next`` or a page shorter than the page size.
+    Pagination options (see :class:`_Pagination`) are taken from ``kwargs``,
+    the result always keeps the offset order.
+    """
+    options = _Pagination.pop(kwargs)
+    return [item for page in _iter_pages(func, resp_key, args, kwargs, options) for item in page.items]
+
+
+async def _async_bulk_api_method(func: Callable[..., Any], resp_key: str, *args: Any, **kwargs: Any) -> list[Any]:
+    """Asyncio counterpart of :func:`_bulk_api_method`, ``func`` returns an awaitable."""
+    options = _Pagination.pop(kwargs)
+    return [item async for page in _aiter_pages(func, resp_key, args, kwargs, options) for item in page.items]
+
+
+def _iter_api_method(func: Callable[..., Any], resp_key: str, *args: Any, **kwargs: Any) -> Iterator[Any]:
+    """Lazy counterpart of :func:`_bulk_api_method`: yield the objects page by page."""
+    options = _Pagination.pop(kwargs)
+    return (item for page in _iter_pages(func, resp_key, args, kwargs, options) for item in page.items)
+
+
+def _async_iter_api_method(func: Callable[..., Any], resp_key: str, *args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+    """Asyncio counterpart of :func:`_iter_api_method`, ``func`` returns an awaitable."""
+    options = _Pagination.pop(kwargs)
+
+    async def items() -> AsyncIterator[Any]:
+        async for page in _aiter_pages(func, resp_key, args, kwargs, options):
+            for item in page.items:
+                yield item
+
+    return items()
@@ -0,0 +1,217 @@
+"""Background batching of the results reported one by one."""
+
+import atexit
+import contextlib
+import logging
+import queue
+import threading
+import time
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, Final
+
+from ._exception import ChunkedUploadError, StatusCodeError, TestRailError
+
+if TYPE_CHECKING:
+    from ._testrail_api import TestRailAPI
+
+logger = logging.getLogger(__package__)
+
+_STOP: Final = object()
+
+
+class ResultsReporter:
+    """
+    Collect results from any thread and add them to a run with ``add_results_for_cases`` in batches.
+
+    A background thread sends the buffered results once ``batch_size`` of them are waiting,
+    or ``flush_interval`` seconds after the first one; :meth:`flush` sends them right away.
+    When ``max_buffered`` results are waiting, :meth:`add` blocks until the thread catches up
+    (at most ``block_timeout`` seconds). The remaining results are sent on :meth:`close`,
+    at the exit of the context or at interpreter shutdown.
+
+    Batches are sent with ``add_results_for_cases_chunked``: rate-limit and connection errors are retried
+    ``retries`` times, the results that still could not be added are kept in :attr:`failed`
+    and their errors in :attr:`errors`.
+    With the :class:`Journal` of the session, every result is journaled by :meth:`add`, before it is buffered,
+    so the results lost in a crash or left failed by the server are sent again by the next session.
+
+    .. code-block:: python
+
+        with ResultsReporter(api, run_id=1) as reporter:
+            reporter.add(case_id=1, status_id=ResultStatus.PASSED, elapsed="2s")
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        api: "TestRailAPI",
+        run_id: int,
+        *,
+        batch_size: int = 250,
+        flush_interval: float = 5.0,
+        max_buffered: int = 10_000,
+        block_timeout: float | None = None,
+        retries: int = 2,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be a positive number, got {batch_size}")
+        if max_buffered < batch_size:
+            raise ValueError(f"max_buffered must be at least batch_size ({batch_size}), got {max_buffered}")
+        self.run_id = run_id
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.block_timeout = block_timeout
+        self.retries = retries
+        self.sent = 0
+        self.failed: list[dict[str, Any]] = []
+        self.errors: list[Exception] = []
+        # bound now: the category may be imported lazily, which fails at interpreter shutdown
+        self.__results = api.results
+        self.__journal = api.journal
+        self.__queue: queue.Queue[Any] = queue.Queue(max_buffered)
+        self.__closed = False
+        self.__putting = 0
+        self.__lock = threading.Condition()
+        self.__worker = threading.Thread(target=self.__run, name="testrail_api-reporter", daemon=True)
+        self.__worker.start()
+        atexit.register(self.close)
+
+    def add(self, case_id: int, status_id: int | None = None, **fields: Any) -> None:
+        """
+        Buffer the result of a case, the same fields as ``add_result_for_case``.
+
+        :raises TestRailError: when the reporter is closed, or still full after ``block_timeout``
+        """
+        if status_id is not None:
+            fields["status_id"] = status_id
+        result = {"case_id": case_id, **fields}
+        journal = self.__journal
+        self.__reserve()
+        try:
+            entry = None
+            if journal is not None:
+                entry = journal.append(f"add_results_for_cases/{self.run_id}", json={"results": [result]})
+            try:
+                self.__put((entry, result))
+            except TestRailError:
+                if journal is not None and entry is not None:
+                    # never buffered: the caller gets the error, the result must not be replayed
+                    journal.ack(entry)
+                raise
+        finally:
+            self.__release()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Send the buffered results now and wait until they are sent; False when ``timeout`` expired first."""
+        done = threading.Event()
+        self.__reserve()
+        try:
+            self.__put(done)
+        finally:
+            self.__release()
+        return done.wait(timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Send the buffered results and stop the background thread; further calls do nothing."""
+        with self.__lock:
+            if self.__closed:
+                return
+            self.__closed = True
+            # the worker keeps draining the queue: the pending puts end before the stop is enqueued
+            self.__lock.wait_for(lambda: not self.__putting)
+        atexit.unregister(self.close)
+        self.__queue.put(_STOP)
+        self.__worker.join(timeout)
+
+    def __enter__(self) -> "ResultsReporter":
+        """Return the reporter."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the reporter, sending the buffered results."""
+        self.close()
+
+    def __reserve(self) -> None:
+        """Count a put in progress, so close() waits for it; the blocking put itself runs outside the lock."""
+        with self.__lock:
+            if self.__closed:
+                raise TestRailError("ResultsReporter is closed")
+            self.__putting += 1
+
+    def __release(self) -> None:
+        with self.__lock:
+            self.__putting -= 1
+            self.__lock.notify_all()
+
+    def __put(self, item: Any) -> None:
+        try:
+            self.__queue.put(item, timeout=self.block_timeout)
+        except queue.Full:
+            raise TestRailError(f"ResultsReporter buffer is still full after {self.block_timeout} sec") from None
+
+    def __run(self) -> None:
+        batch: list[tuple[str | None, dict[str, Any]]] = []
+        deadline: float | None = None
+        while True:
+            try:
+                item = self.__queue.get(timeout=None if deadline is None else max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                item = None
+            if isinstance(item, tuple):
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+                if len(batch) < self.batch_size:
+                    continue
+            if batch:
+                self.__send(batch)
+                batch, deadline = [], None
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is _STOP:
+                return
+
+    def __send(self, batch: list[tuple[str | None, dict[str, Any]]]) -> None:
+        entries = [entry for entry, _ in batch]
+        results = [result for _, result in batch]
+        try:
+            # the results are already journaled by add
+            with self.__suspended():
+                self.__results.add_results_for_cases_chunked(
+                    self.run_id, results, chunk_size=self.batch_size, retries=self.retries
+                )
+        except Exception as e:
+            logger.exception("Results of %d cases could not be added to run %s", len(results), self.run_id)
+            self.errors.append(e)
+            if isinstance(e, ChunkedUploadError):
+                added = [result is not None for result in e.results]
+                self.sent += sum(added)
+                self.failed.extend(result for result, ok in zip(results, added, strict=True) if not ok)
+                self.__settle(entries, added, e.errors, e.sizes)
+            else:
+                self.failed.extend(results)
+                self.__settle(entries, [False] * len(entries), {0: e}, {0: len(entries)})
+        else:
+            self.sent += len(results)
+            self.__settle(entries, [True] * len(entries), {}, {})
+
+    def __suspended(self) -> contextlib.AbstractContextManager[None]:
+        return contextlib.nullcontext() if self.__journal is None else self.__journal.suspended()
+
+    def __settle(
+        self, entries: list[str | None], added: list[bool], errors: dict[int, Exception], sizes: dict[int, int]
+    ) -> None:
+        """Acknowledge the journal entries of the added results, and of the chunks refused by the server."""
+        if self.__journal is None:
+            return
+        self.__journal.ack(*(entry for entry, ok in zip(entries, added, strict=True) if ok and entry is not None))
+        for start, error in errors.items():
+            if not isinstance(error, StatusCodeError):
+                continue
+            for entry in entries[start : start + sizes[start]]:
+                if entry is not None:
+                    self.__journal.settle(entry, error.status_code)
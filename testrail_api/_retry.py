@@ -0,0 +1,91 @@
+"""Retry policy for transient failures."""
+
+import random
+import threading
+from collections.abc import Collection
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter for ``retry_exceptions`` and transient HTTP statuses.
+
+    Only the idempotent ``methods`` are retried, so a POST that may have been applied
+    is never sent twice. Retries are also limited by a budget shared by every session
+    using the policy: each request deposits ``budget`` retries, each retry takes one,
+    so an outage is never amplified by more than ``budget`` of the traffic.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        statuses: Collection[int] = (502, 503, 504),
+        methods: Collection[str] = ("GET",),
+        budget: float = 0.2,
+        min_retries: int = 10,
+    ) -> None:
+        """
+        Retry policy constructor.
+
+        :param backoff:
+            Base delay in seconds, doubled with every attempt (default: 0.5).
+        :param max_backoff:
+            Upper bound of the delay in seconds (default: 30).
+        :param jitter:
+            Sleep a random time between 0 and the backoff delay (full jitter)
+            so concurrent clients do not retry in lockstep (default: True).
+        :param statuses:
+            HTTP statuses to retry (default: 502, 503, 504).
+            A valid retry-after header of such a response replaces the backoff delay.
+        :param methods:
+            HTTP methods that are safe to retry (default: GET).
+        :param budget:
+            Retries allowed per request sent, as a ratio of the traffic (default: 0.2).
+        :param min_retries:
+            Retries available before the traffic-based budget applies,
+            also the maximum accumulated budget (default: 10).
+        """
+        if backoff < 0 or max_backoff < 0:
+            raise ValueError("backoff and max_backoff must not be negative")
+        if budget < 0:
+            raise ValueError(f"budget must not be negative, got {budget}")
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.budget = budget
+        self.min_retries = min_retries
+        self.__balance = float(min_retries)
+        self.__lock = threading.Lock()
+
+    @property
+    def balance(self) -> float:
+        """Number of retries currently left in the budget."""
+        return self.__balance
+
+    def record_request(self) -> None:
+        """Deposit the budget of a new request (not called for retries)."""
+        with self.__lock:
+            self.__balance = min(float(self.min_retries), self.__balance + self.budget)
+
+    def delay(self, count: int) -> float:
+        """Backoff delay in seconds after the failed attempt ``count`` (zero-based)."""
+        delay = min(self.max_backoff, self.backoff * 2**count)
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def retry(self, method: str, count: int, retry_after: float | None = None) -> float | None:
+        """
+        Seconds to wait before retrying the failed attempt ``count``, or None when it must not be retried.
+
+        Takes one retry from the budget when the retry is allowed.
+        """
+        if method.upper() not in self.methods:
+            return None
+        with self.__lock:
+            if self.__balance < 1:
+                return None
+            self.__balance -= 1
+        return self.delay(count) if retry_after is None else retry_after
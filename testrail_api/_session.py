@@ -1,33 +1,48 @@
 """Base session."""
 
+import abc
 import logging
+import threading
 import time
 import warnings
 from collections.abc import Callable, Mapping
+from contextlib import AbstractContextManager
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
-from enum import Enum
-from json.decoder import JSONDecodeError
 from os import environ
 from pathlib import Path
 from types import TracebackType
-from typing import Any, Final, TypeVar
-
-import requests
+from typing import TYPE_CHECKING, Any, Final, TypeVar
 
 try:
     from .__version__ import version as __version__
 except ImportError:  # pragma: no cover
     __version__ = "unknown"
 
+from ._cache import ResponseCache
+from ._convert import convert_json, convert_params
 from ._enums import METHODS
 from ._exception import TestRailError, status_error_class
+from ._json import JSONBackend, get_json_backend
+from ._metrics import Metrics, endpoint_template
+from ._retry import RetryPolicy
+from ._tracing import NOOP_SPAN, Span, Tracer
+
+if TYPE_CHECKING:
+    import requests
+
+    from ._coalesce import Singleflight
+    from ._journal import Journal
+    from ._throttle import ConcurrencyLimiter, RateLimiter
+    from ._transport import Transport
 
 logger = logging.getLogger(__package__)
 
 RATE_LIMIT_STATUS_CODE: Final[int] = 429
+HTTP_ERROR_FLOOR: Final[int] = 400
 MAX_RATE_LIMIT_DELAY: Final[float] = 300.0
 DOWNLOAD_CHUNK_SIZE: Final[int] = 2**20
+LOG_BODY_LIMIT: Final[int] = 1024
 
 _SENSITIVE_HEADERS: Final[frozenset[str]] = frozenset(
     {"authorization", "proxy-authorization", "cookie", "set-cookie", "x-api-key"},
@@ -42,10 +57,16 @@ class Environ:
     PASSWORD: str = "TESTRAIL_PASSWORD"  # noqa: S105
 
 
-class Session:
-    """Base Session."""
+class _BaseSession(abc.ABC):
+    """
+    Transport-independent part of a session.
+
+    Holds the configuration and converts parameters and responses;
+    subclasses only implement the actual I/O (blocking or asyncio).
+    """
 
     _user_agent = f"Python TestRail API v: {__version__}"
+    _is_async = False
 
     def __init__(  # noqa: PLR0913
         self,
@@ -63,87 +84,70 @@ class Session:
         rate_limit: bool = True,
         warn_ignore: bool = False,
         retry_exceptions: tuple[type[BaseException], ...] = (),
-        response_handler: Callable[[requests.Response], Any] | None = None,
-        session: requests.Session | None = None,
+        response_handler: Callable[["requests.Response"], Any] | None = None,
+        rate_limiter: "RateLimiter | None" = None,
+        concurrency_limiter: "ConcurrencyLimiter | None" = None,
+        retry_policy: RetryPolicy | None = None,
+        cache: ResponseCache | None = None,
+        json_backend: str | JSONBackend = "json",
+        metrics: bool | Metrics = False,
+        tracer: Tracer | None = None,
+        coalesce: bool = False,
     ) -> None:
-        """
-        Session constructor.
-
-        :param url:
-            TestRail address.
-        :param email:
-            Email for the account on the TestRail.
-        :param password:
-            Password for the account on the TestRail or token.
-        :param timeout:
-            How many seconds to wait for the server to send data (default: 30).
-            May be a ``(connect, read)`` tuple.
-        :param verify:
-            Controls whether we verify the server's certificate (default: True).
-        :param headers:
-            Dictionary of HTTP headers to send with every request.
-        :param retry:
-            Delay in seconds between retries on HTTP 429 when the response
-            has no valid retry-after header (default: 3).
-        :param exc_iterations:
-            Number of attempts for rate-limit and ``retry_exceptions`` retries (default: 3).
-        :param raise_on_error:
-            Raise :class:`StatusCodeError` for non-OK responses (default: True).
-        :param exc:
-            Deprecated, use ``raise_on_error`` (note the inverted meaning:
-            ``exc=True`` matches ``raise_on_error=False``).
-        :param rate_limit:
-            Check the response for HTTP 429 and retry the request.
-        :param warn_ignore:
-            Ignore warning when not using HTTPS.
-        :param retry_exceptions:
-            Set of exceptions to retry the request.
-        :param response_handler:
-            Override default response handling.
-        :param session:
-            A Given session will be used instead of new one.
-        """
         _url = self.__require(url, Environ.URL, "Url").rstrip("/")
         if _url.startswith("http://") and not warn_ignore:
             warnings.warn(
-                "Using HTTP and not HTTPS may cause writeable API requests to return 404 errors", stacklevel=2
+                "Using HTTP and not HTTPS may cause writeable API requests to return 404 errors", stacklevel=3
             )
         _email = self.__require(email, Environ.EMAIL, "Email")
         _password = self.__require(password, Environ.PASSWORD, "Password")
-        self.__base_url = f"{_url}/index.php?/api/v2/"
-        self.__timeout = timeout
-        self.__session = session or requests.Session()
-        self.__session.headers["User-Agent"] = self._user_agent
-        self.__session.headers.update(headers or {})
-        self.__session.verify = verify
-        self.__retry = retry
+        self._base_url = f"{_url}/index.php?/api/v2/"
+        self._timeout = timeout
+        self._verify = verify
+        self._headers = {"User-Agent": self._user_agent, **(headers or {})}
+        self._auth = (_email, _password)
+        self._retry = retry
         self.__user_email = _email
-        self.__session.auth = (self.__user_email, _password)
         if exc is not None:
             warnings.warn(
                 "The 'exc' argument is deprecated, use 'raise_on_error' instead "
                 "(note the inverted meaning: exc=True matches raise_on_error=False)",
                 DeprecationWarning,
-                stacklevel=2,
+                stacklevel=3,
             )
         if raise_on_error is None:
             raise_on_error = True if exc is None else not exc
-        self.__raise_on_error = raise_on_error
-        self.__retry_exceptions = tuple(retry_exceptions)
-        self.__exc_iterations = exc_iterations
-        self.__response_handler = response_handler or self.__default_response_handler
+        self._raise_on_error = raise_on_error
+        self._retry_exceptions = tuple(retry_exceptions)
+        self._exc_iterations = exc_iterations
+        self._response_handler = response_handler or self.__default_response_handler
         self._rate_limit = rate_limit
+        self._rate_limiter = rate_limiter
+        self._concurrency_limiter = concurrency_limiter
+        self._retry_policy = retry_policy
+        self._cache = cache
+        self._json = get_json_backend(json_backend)
+        self._metrics = Metrics() if metrics is True else metrics or None
+        self._tracer = tracer
+        self._singleflight: Singleflight | None = None
+        if coalesce:
+            from . import _coalesce  # noqa: PLC0415
+
+            self._singleflight = _coalesce.Singleflight()
+        self.__cooldown_until = 0.0
+        self.__cooldown_lock = threading.Lock()
         logger.info(
-            "Create Session{url: %s, user: %s, timeout: %s, headers: %s, verify: "
+            "Create %s{url: %s, user: %s, timeout: %s, headers: %s, verify: "
             "%s, raise_on_error: %s, exc_iterations: %s, retry: %s}",
+            type(self).__name__,
             _url,
             self.__user_email,
-            self.__timeout,
-            self._redact_headers(self.__session.headers),
-            self.__session.verify,
-            self.__raise_on_error,
-            self.__exc_iterations,
-            self.__retry,
+            self._timeout,
+            self._redact_headers(self._headers),
+            self._verify,
+            self._raise_on_error,
+            self._exc_iterations,
+            self._retry,
         )
 
     @property
@@ -151,22 +155,19 @@ class Session:
         """Get user email."""
         return self.__user_email
 
-    def close(self) -> None:
-        """Close the underlying HTTP session and release pooled connections."""
-        self.__session.close()
+    @property
+    def metrics(self) -> Metrics | None:
+        """Get the metrics collector, None when metrics are disabled."""
+        return self._metrics
 
-    def __enter__(self: _S) -> _S:
-        """Enter the runtime context and return the session."""
-        return self
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Request metrics by endpoint template, empty when metrics are disabled (see :meth:`Metrics.stats`)."""
+        return {} if self._metrics is None else self._metrics.stats()
 
-    def __exit__(
-        self,
-        exc_type: type[BaseException] | None,
-        exc_val: BaseException | None,
-        exc_tb: TracebackType | None,
-    ) -> None:
-        """Close the session when leaving the runtime context."""
-        self.close()
+    @property
+    def cache(self) -> ResponseCache | None:
+        """Get the response cache, e.g. to invalidate it."""
+        return self._cache
 
     @staticmethod
     def __require(value: str | None, env_var: str, name: str) -> str:
@@ -180,7 +181,7 @@ class Session:
         """Replace values of sensitive headers so they can be logged safely."""
         return {key: "***" if key.lower() in _SENSITIVE_HEADERS else value for key, value in headers.items()}
 
-    def __default_response_handler(self, response: requests.Response) -> Any:
+    def __default_response_handler(self, response: "requests.Response") -> Any:
         """Deserialization json or return None."""
         if not response.ok:
             logger.error(
@@ -190,7 +191,7 @@ class Session:
                 response.url,
                 response.content,
             )
-            if self.__raise_on_error:
+            if self._raise_on_error:
                 raise status_error_class(response.status_code)(
                     response.status_code,
                     response.reason,
@@ -198,47 +199,23 @@ class Session:
                     response.content,
                     response=response,
                 )
-        logger.debug("Response body: %s", response.text)
+        content = response.content
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response body: %r", self._truncate(content))
+        if not content:
+            return None
         try:
-            return response.json()
-        except (JSONDecodeError, ValueError):
+            # decode the bytes once, without the charset detection of response.text/response.json()
+            return self._json.loads(content)
+        except self._json.errors:
             return response.text or None
 
     @staticmethod
-    def __get_converter(params: dict[Any, Any]) -> dict[Any, Any]:
-        """Convert GET parameters, returning a new dict."""
-        converted: dict[Any, Any] = {}
-        for key, raw_value in params.items():
-            # Unwrapping an Enum member (str(member) is unreliable across Python versions)
-            value = raw_value.value if isinstance(raw_value, Enum) else raw_value
-            if isinstance(value, bool):
-                # Converting a boolean value to integer
-                converted[key] = int(value)
-            elif isinstance(value, (list, tuple, set)):
-                # Converting a collection to a string '1,2,3' (sets are sorted for determinism)
-                items = sorted(value, key=str) if isinstance(value, set) else value
-                converted[key] = ",".join(str(i.value if isinstance(i, Enum) else i) for i in items)
-            elif isinstance(value, datetime):
-                # Converting a datetime value to integer (UNIX timestamp)
-                converted[key] = round(value.timestamp())
-            else:
-                converted[key] = value
-        return converted
-
-    @classmethod
-    def __post_converter(cls, json: Any) -> Any:
-        """Convert POST parameters recursively, returning a new structure."""
-        if isinstance(json, Enum):
-            # Unwrapping an Enum member to its value
-            return cls.__post_converter(json.value)
-        if isinstance(json, datetime):
-            # Converting a datetime value to integer (UNIX timestamp)
-            return round(json.timestamp())
-        if isinstance(json, dict):
-            return {key: cls.__post_converter(value) for key, value in json.items()}
-        if isinstance(json, (list, tuple)):
-            return [cls.__post_converter(value) for value in json]
-        return json
+    def _truncate(content: bytes) -> bytes:
+        """Shorten a body for logging."""
+        if len(content) <= LOG_BODY_LIMIT:
+            return content
+        return content[:LOG_BODY_LIMIT] + b"... (%d bytes)" % len(content)
 
     @staticmethod
     def _parse_retry_after(value: str) -> float | None:
@@ -256,6 +233,180 @@ class Session:
             return None
         return (date - datetime.now(timezone.utc)).total_seconds()
 
+    def _prepare(self, endpoint: str, kwargs: dict[str, Any]) -> str:
+        """
+        Build the request URL, convert the parameters and encode the JSON body in place.
+
+        Also counts the request in the retry budget.
+        """
+        if self._retry_policy is not None:
+            self._retry_policy.record_request()
+        if not endpoint.startswith(("add_attachment", "add_bdd")):
+            headers = kwargs.setdefault("headers", {})
+            headers.update({"Content-Type": "application/json"})
+
+        if "params" in kwargs:
+            kwargs["params"] = convert_params(kwargs["params"])
+        if "json" in kwargs:
+            kwargs["data"] = self._json.dumps(convert_json(kwargs.pop("json")))
+        return f"{self._base_url}{endpoint}"
+
+    def _throttle(self) -> float:
+        """Seconds to wait before sending a request: the shared 429 cooldown and the client-side rate limit."""
+        delay = 0.0 if self._rate_limiter is None else self._rate_limiter.reserve()
+        if (cooldown := self.__cooldown_until - time.monotonic()) > delay:
+            delay = cooldown
+        if delay:
+            logger.debug("Throttling, sleeping %s sec before the request", delay)
+        return delay
+
+    def _cooldown(self, delay: float) -> None:
+        """Pause every request sent through this session for ``delay`` seconds."""
+        with self.__cooldown_lock:
+            self.__cooldown_until = max(self.__cooldown_until, time.monotonic() + delay)
+
+    def _span(self, name: str, attributes: dict[str, Any] | None = None) -> AbstractContextManager[Span]:
+        """Start a tracing span, a no-op one without a tracer."""
+        if self._tracer is None:
+            return NOOP_SPAN
+        return self._tracer.start_as_current_span(f"testrail_api.{name}", attributes=attributes)
+
+    def _request_span(self, method: METHODS, endpoint: str) -> AbstractContextManager[Span]:
+        """Start the span of a whole request call."""
+        if self._tracer is None:
+            return NOOP_SPAN
+        attributes = {"http.request.method": method.value, "testrail.endpoint": endpoint_template(endpoint)}
+        return self._span("request", attributes)
+
+    def _endpoint(self, url: str) -> str:
+        """Endpoint of a request URL, without the base URL and the query parameters."""
+        return url.removeprefix(self._base_url).split("&", 1)[0]
+
+    def _release(  # noqa: PLR0913
+        self,
+        ticket: int | None,
+        url: str,
+        started: float,
+        *,
+        response: Any = None,
+        error: BaseException | None = None,
+        streamed: bool = False,
+    ) -> None:
+        """Release the concurrency limiter slot taken by an attempt and record the attempt metrics."""
+        status_code = None if response is None else response.status_code
+        if self._concurrency_limiter is not None and ticket is not None:
+            throttled = None if status_code is None else status_code == RATE_LIMIT_STATUS_CODE
+            self._concurrency_limiter.release(ticket, throttled=throttled)
+        if self._metrics is None or (response is None and error is None):
+            return
+        seconds = time.perf_counter() - started
+        endpoint = self._endpoint(url)
+        if response is None:
+            self._metrics.observe(endpoint, seconds, error=type(error).__name__)
+            return
+        sent = response.request.headers.get("Content-Length")
+        received = response.headers.get("Content-Length")
+        if received is None:
+            received = 0 if streamed else len(response.content)
+        failed = response.status_code >= HTTP_ERROR_FLOOR
+        self._metrics.observe(
+            endpoint,
+            seconds,
+            sent=int(sent or 0),
+            received=int(received),
+            error=status_error_class(response.status_code).__name__ if failed else None,
+        )
+
+    def _retry_exception(self, method: METHODS, url: str, exc: BaseException, count: int) -> float | None:
+        """Seconds to sleep before retrying a ``retry_exceptions`` error raised on attempt ``count``, or None."""
+        if count >= self._exc_iterations - 1:
+            return None
+        delay: float | None = 0.0
+        if self._retry_policy is not None and (delay := self._retry_policy.retry(method.value, count)) is None:
+            return None
+        logger.warning("%s, retrying %s/%s in %s sec", exc, count + 1, self._exc_iterations, delay)
+        if self._metrics is not None:
+            self._metrics.retry(self._endpoint(url))
+        return delay
+
+    def _retry_delay(
+        self, method: METHODS, url: str, status_code: int, headers: Mapping[str, str], count: int
+    ) -> float | None:
+        """
+        Seconds to sleep before retrying a rate-limited or transient error response, or None when it is final.
+
+        A 429 also starts a cooldown shared by every caller of the session,
+        so the other threads or tasks wait instead of being rejected in turn.
+        """
+        final = count >= self._exc_iterations - 1
+        delay: float | None
+        retry_after = self._parse_retry_after(headers.get("retry-after", ""))
+        if self._rate_limit and status_code == RATE_LIMIT_STATUS_CODE:
+            delay = self._retry if retry_after is None else retry_after
+            delay = min(max(delay, 0.0), MAX_RATE_LIMIT_DELAY)
+            self._cooldown(delay)
+            reason = "Rate limit"
+        elif not final and self._retry_policy is not None and status_code in self._retry_policy.statuses:
+            if retry_after is not None:
+                retry_after = min(max(retry_after, 0.0), MAX_RATE_LIMIT_DELAY)
+            if (delay := self._retry_policy.retry(method.value, count, retry_after)) is None:
+                return None
+            reason = "Transient error"
+        else:
+            return None
+        if final:
+            return None
+        logger.warning(
+            "%s (%s) on %s, sleeping %s sec before retry %s/%s",
+            reason,
+            status_code,
+            url,
+            delay,
+            count + 1,
+            self._exc_iterations,
+        )
+        if self._metrics is not None:
+            rate_limited = status_code == RATE_LIMIT_STATUS_CODE
+            self._metrics.retry(self._endpoint(url), rate_limit_delay=delay if rate_limited else None)
+        return delay
+
+    def _cache_key(self, method: METHODS, endpoint: str, kwargs: dict[str, Any], *, raw: bool) -> Any:
+        """Cache key of a request with converted parameters, None when its response is not cached."""
+        if self._cache is None or raw or method is not METHODS.GET or self._cache.ttl(endpoint) is None:
+            return None
+        return self._base_url, endpoint, tuple(sorted(kwargs.get("params", {}).items()))
+
+    def _coalesce_key(self, method: METHODS, endpoint: str, kwargs: dict[str, Any], *, raw: bool) -> Any:
+        """Key of identical in-flight requests with converted parameters, None when the request is not coalesced."""
+        if raw or method is not METHODS.GET:
+            return None
+        return endpoint, tuple(sorted(kwargs.get("params", {}).items()))
+
+    def _cache_lookup(self, cache_key: Any) -> tuple[bool, Any]:
+        """Return ``(True, result)`` when the response of the request is cached."""
+        if self._cache is None or cache_key is None:
+            return False, None
+        return self._cache.get(cache_key)
+
+    def _handle(self, response: "requests.Response", *, raw: bool, cache_key: Any = None) -> Any:
+        """Return the raw response or pass it to the response handler, caching successful results."""
+        logger.debug("Response header: %s", response.headers)
+        if raw:
+            return response
+        with self._span("decode"):
+            result = self._response_handler(response)
+        if self._cache is not None and cache_key is not None and response.ok:
+            self._cache.put(cache_key, cache_key[1], result)
+        return result
+
+    @staticmethod
+    def _path(path: Path | str) -> Path:
+        return path if isinstance(path, Path) else Path(path)
+
+    @abc.abstractmethod
+    def request(self, method: METHODS, endpoint: str, *, raw: bool = False, **kwargs: Any) -> Any:
+        """Send request method."""
+
     def get(self, endpoint: str, params: dict[Any, Any] | None = None) -> Any:
         """GET method."""
         return self.request(
@@ -278,54 +429,283 @@ class Session:
             json=json or {},
         )
 
+    @abc.abstractmethod
+    def attachment_request(self, method: METHODS, src: str, file: Path | str, **kwargs: Any) -> Any:
+        """Send attach."""
+
+    @abc.abstractmethod
+    def get_attachment(self, method: METHODS, src: str, file: Path | str, **kwargs: Any) -> Any:
+        """Download attach."""
+
+
+class Session(_BaseSession):
+    """Base Session."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        url: str | None = None,
+        email: str | None = None,
+        password: str | None = None,
+        *,
+        timeout: float | tuple[float, float] = 30,
+        verify: bool | str = True,
+        headers: dict[str, str] | None = None,
+        retry: float = 3,
+        exc_iterations: int = 3,
+        raise_on_error: bool | None = None,
+        exc: bool | None = None,
+        rate_limit: bool = True,
+        warn_ignore: bool = False,
+        retry_exceptions: tuple[type[BaseException], ...] = (),
+        response_handler: Callable[["requests.Response"], Any] | None = None,
+        rate_limiter: "RateLimiter | None" = None,
+        concurrency_limiter: "ConcurrencyLimiter | None" = None,
+        retry_policy: RetryPolicy | None = None,
+        cache: ResponseCache | None = None,
+        json_backend: str | JSONBackend = "json",
+        metrics: bool | Metrics = False,
+        tracer: Tracer | None = None,
+        coalesce: bool = False,
+        session: "requests.Session | None" = None,
+        transport: "Transport | None" = None,
+        record: Path | str | None = None,
+        journal: "Journal | Path | str | None" = None,
+        pool_connections: int | None = None,
+        pool_maxsize: int | None = None,
+        pool_block: bool | None = None,
+        max_retries: int | None = None,
+        tcp_keepalive: int | None = None,
+    ) -> None:
+        """
+        Session constructor.
+
+        :param url:
+            TestRail address.
+        :param email:
+            Email for the account on the TestRail.
+        :param password:
+            Password for the account on the TestRail or token.
+        :param timeout:
+            How many seconds to wait for the server to send data (default: 30).
+            May be a ``(connect, read)`` tuple.
+        :param verify:
+            Controls whether we verify the server's certificate (default: True).
+        :param headers:
+            Dictionary of HTTP headers to send with every request.
+        :param retry:
+            Delay in seconds between retries on HTTP 429 when the response
+            has no valid retry-after header (default: 3).
+        :param exc_iterations:
+            Number of attempts for rate-limit, ``retry_policy`` and ``retry_exceptions`` retries (default: 3).
+        :param raise_on_error:
+            Raise :class:`StatusCodeError` for non-OK responses (default: True).
+        :param exc:
+            Deprecated, use ``raise_on_error`` (note the inverted meaning:
+            ``exc=True`` matches ``raise_on_error=False``).
+        :param rate_limit:
+            Check the response for HTTP 429 and retry the request.
+        :param warn_ignore:
+            Ignore warning when not using HTTPS.
+        :param retry_exceptions:
+            Set of exceptions to retry the request.
+        :param response_handler:
+            Override default response handling.
+        :param rate_limiter:
+            Client-side token bucket applied before every request, may be shared
+            by several sessions (see :class:`RateLimiter`, :class:`FileRateLimiter`).
+        :param concurrency_limiter:
+            Adaptive limit of the requests in flight, lowered on HTTP 429
+            (see :class:`ConcurrencyLimiter`).
+        :param retry_policy:
+            Backoff, jitter and budget for ``retry_exceptions`` and transient statuses
+            such as 502/503/504; without it errors are retried immediately (see :class:`RetryPolicy`).
+        :param cache:
+            In-memory cache of GET responses of the metadata endpoints (see :class:`ResponseCache`).
+        :param json_backend:
+            JSON library encoding request bodies and decoding responses:
+            ``"json"`` (default), ``"orjson"``, ``"msgspec"`` or ``"auto"`` for the fastest installed one.
+        :param metrics:
+            Collect per-endpoint request metrics, see :meth:`stats`;
+            ``True`` creates a new :class:`Metrics`, which may also be shared by several sessions.
+        :param tracer:
+            OpenTelemetry-compatible tracer receiving a span per request with child spans
+            for the preparation, every attempt, the sleeps and the decoding (see :class:`SpanRecorder`).
+        :param coalesce:
+            Send identical concurrent GET requests (same endpoint and parameters) once:
+            the callers arriving while the request is in flight get a copy of its result.
+        :param session:
+            A Given session will be used instead of new one.
+        :param transport:
+            Transport sending the requests (default: :class:`RequestsTransport` over ``session``),
+            e.g. :class:`Urllib3Transport` for a lower per-call overhead.
+        :param record:
+            Append every request/response pair to this cassette file, with the sensitive headers
+            redacted, to replay it later with :class:`ReplayTransport`.
+        :param journal:
+            Write-ahead journal of the result and attachment uploads (a :class:`Journal` or its path):
+            they are recorded before being sent, and the ones left pending by a previous process
+            are sent again when the session is created.
+        :param pool_connections:
+            Number of per-host connection pools to cache (default: 10).
+        :param pool_maxsize:
+            Maximum number of connections kept in each pool (default: 10).
+            Set it to at least the number of threads sharing this object.
+        :param pool_block:
+            Wait for a free connection when the pool is exhausted instead of
+            opening a connection that is discarded after use (default: False).
+        :param max_retries:
+            Adapter-level retries of failed connections, DNS lookups and timeouts (default: 0).
+        :param tcp_keepalive:
+            Enable TCP keep-alive probes on idle pooled connections after this many seconds.
+
+        The pool options mount an adapter on the (given or new) ``requests.Session``;
+        when none of them is set its adapters are left untouched. Setting them with a ``transport`` is an error.
+        A single object with its pool can be shared by many threads.
+        """
+        super().__init__(
+            url,
+            email,
+            password,
+            timeout=timeout,
+            verify=verify,
+            headers=headers,
+            retry=retry,
+            exc_iterations=exc_iterations,
+            raise_on_error=raise_on_error,
+            exc=exc,
+            rate_limit=rate_limit,
+            warn_ignore=warn_ignore,
+            retry_exceptions=retry_exceptions,
+            response_handler=response_handler,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+            retry_policy=retry_policy,
+            cache=cache,
+            json_backend=json_backend,
+            metrics=metrics,
+            tracer=tracer,
+            coalesce=coalesce,
+        )
+        if transport is not None and session is not None:
+            raise TestRailError("Use either session or transport")
+        pool_options = (pool_connections, pool_maxsize, pool_block, max_retries, tcp_keepalive)
+        if transport is not None and any(option is not None for option in pool_options):
+            raise TestRailError("The pool options do not apply to a given transport")
+        if transport is None:
+            # imported here, not with the module: ``requests`` is only loaded by the sessions using it
+            from ._transport import RequestsTransport, _PoolAdapter  # noqa: PLC0415
+
+            transport = RequestsTransport(session)
+            if any(option is not None for option in pool_options):
+                adapter = _PoolAdapter(
+                    pool_connections=pool_connections,
+                    pool_maxsize=pool_maxsize,
+                    pool_block=pool_block,
+                    max_retries=max_retries,
+                    tcp_keepalive=tcp_keepalive,
+                )
+                transport.session.mount("https://", adapter)
+                transport.session.mount("http://", adapter)
+        if record is not None:
+            from ._cassette import RecordingTransport  # noqa: PLC0415
+
+            transport = RecordingTransport(transport, record, redact=self._redact_headers)
+        transport.setup(headers=self._headers, auth=self._auth, verify=verify)
+        self.__transport = transport
+        self._journal: Journal | None = None
+        self.__own_journal = False
+        if journal is not None:
+            from . import _journal  # noqa: PLC0415
+
+            self.__own_journal = not isinstance(journal, _journal.Journal)
+            self._journal = journal if isinstance(journal, _journal.Journal) else _journal.Journal(journal)
+            if self._journal.pending:
+                self._journal.replay(self)
+
+    @property
+    def journal(self) -> "Journal | None":
+        """Write-ahead journal of the uploads, see :class:`Journal`."""
+        return self._journal
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and release pooled connections."""
+        self.__transport.close()
+        if self._journal is not None and self.__own_journal:
+            self._journal.close()
+
+    def __enter__(self: _S) -> _S:
+        """Enter the runtime context and return the session."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Close the session when leaving the runtime context."""
+        self.close()
+
+    def _sleep(self, seconds: float, reason: str) -> None:
+        with self._span("sleep", {"testrail.sleep.reason": reason, "testrail.sleep.seconds": seconds}):
+            time.sleep(seconds)
+
     def request(self, method: METHODS, endpoint: str, *, raw: bool = False, **kwargs: Any) -> Any:
         """Send request method."""
-        url = f"{self.__base_url}{endpoint}"
-        if not endpoint.startswith(("add_attachment", "add_bdd")):
-            headers = kwargs.setdefault("headers", {})
-            headers.update({"Content-Type": "application/json"})
-
-        if "params" in kwargs:
-            kwargs["params"] = self.__get_converter(kwargs["params"])
-        if "json" in kwargs:
-            kwargs["json"] = self.__post_converter(kwargs["json"])
+        entry = self.__journal_append(method, endpoint, kwargs)
+        with self._request_span(method, endpoint) as span:
+            with self._span("prepare"):
+                url = self._prepare(endpoint, kwargs)
+                cache_key = self._cache_key(method, endpoint, kwargs, raw=raw)
+                hit, cached = self._cache_lookup(cache_key)
+            if hit:
+                span.set_attribute("testrail.cache_hit", value=True)
+                return cached
+            if self._singleflight is not None and (key := self._coalesce_key(method, endpoint, kwargs, raw=raw)):
+                return self._singleflight.do(key, lambda: self._send(method, url, kwargs, raw=raw, cache_key=cache_key))
+            return self._send(method, url, kwargs, raw=raw, cache_key=cache_key, entry=entry)
+
+    def __journal_append(self, method: METHODS, endpoint: str, kwargs: dict[str, Any]) -> str | None:
+        """Record a result or attachment upload in the journal, return the id of the entry."""
+        if self._journal is None or method is not METHODS.POST:
+            return None
+        if "files" in kwargs:
+            return self._journal.record(endpoint, file=kwargs["files"]["attachment"].name)
+        return self._journal.record(endpoint, json=kwargs.get("json"))
 
-        for count in range(self.__exc_iterations):
+    def _send(  # noqa: PLR0913
+        self, method: METHODS, url: str, kwargs: dict[str, Any], *, raw: bool, cache_key: Any, entry: str | None = None
+    ) -> Any:
+        """Send the prepared request, retrying it as configured, and handle the response; ack its journal entry."""
+        for count in range(self._exc_iterations):
+            if wait := self._throttle():
+                self._sleep(wait, "throttle")
+            ticket = None if self._concurrency_limiter is None else self._concurrency_limiter.acquire()
+            started = time.perf_counter()
             try:
-                response = self.__session.request(method=str(method.value), url=url, timeout=self.__timeout, **kwargs)
-            except self.__retry_exceptions as exc:
-                if count < self.__exc_iterations - 1:
-                    logger.warning("%s, retrying %s/%s", exc, count + 1, self.__exc_iterations)
+                with self._span("send", {"testrail.attempt": count + 1}) as attempt:
+                    response = self.__transport.request(str(method.value), url, timeout=self._timeout, **kwargs)
+                    attempt.set_attribute("http.response.status_code", response.status_code)
+            except self._retry_exceptions as exc:
+                self._release(ticket, url, started, error=exc)
+                if (delay := self._retry_exception(method, url, exc, count)) is not None:
+                    self._sleep(delay, "retry")
                     continue
                 raise
-            except Exception:
+            except Exception as exc:
+                self._release(ticket, url, started, error=exc)
                 logger.exception("Request error")
                 raise
-            if (
-                self._rate_limit
-                and response.status_code == RATE_LIMIT_STATUS_CODE
-                and count < self.__exc_iterations - 1
-            ):
-                retry_after = self._parse_retry_after(response.headers.get("retry-after", ""))
-                delay = self.__retry if retry_after is None else retry_after
-                delay = min(max(delay, 0.0), MAX_RATE_LIMIT_DELAY)
-                logger.warning(
-                    "Rate limit (429) on %s, sleeping %s sec before retry %s/%s",
-                    url,
-                    delay,
-                    count + 1,
-                    self.__exc_iterations,
-                )
-                time.sleep(delay)
+            self._release(ticket, url, started, response=response, streamed=kwargs.get("stream", False))
+            delay = self._retry_delay(method, url, response.status_code, response.headers, count)
+            if delay is not None:
+                self._sleep(delay, "retry")
                 continue
-            logger.debug("Response header: %s", response.headers)
-            return response if raw else self.__response_handler(response)
+            if entry is not None and self._journal is not None:
+                self._journal.settle(entry, response.status_code)
+            return self._handle(response, raw=raw, cache_key=cache_key)
         return None
 
-    @staticmethod
-    def _path(path: Path | str) -> Path:
-        return path if isinstance(path, Path) else Path(path)
-
     def attachment_request(self, method: METHODS, src: str, file: Path | str, **kwargs: Any) -> dict[str, Any]:
         """Send attach."""
         file = self._path(file)
@@ -342,6 +722,6 @@ class Session:
                     for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                         attachment.write(chunk)
                 return file
-            return self.__response_handler(response)
+            return self._response_handler(response)
         finally:
             response.close()
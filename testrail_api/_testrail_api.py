@@ -1,12 +1,23 @@
 """TestRail API Categories."""
 
 from functools import cached_property
+from types import ModuleType
+from typing import TYPE_CHECKING
 
-from . import _category
-from ._session import Session
+from ._session import Session, _BaseSession
 
+if TYPE_CHECKING:
+    from . import _category
 
-class TestRailAPI(Session):
+
+def _categories() -> ModuleType:
+    """Import the categories on first use: most clients only touch a few of them."""
+    from . import _category  # noqa: PLC0415
+
+    return _category
+
+
+class _Categories(_BaseSession):
     """
     API Categories.
 
@@ -16,136 +27,140 @@ class TestRailAPI(Session):
     """
 
     @cached_property
-    def attachments(self) -> _category.Attachments:
+    def attachments(self) -> "_category.Attachments":
         """Attachments category."""
-        return _category.Attachments(self)
+        return _categories().Attachments(self)
 
     @cached_property
-    def bdds(self) -> _category.Bdds:
+    def bdds(self) -> "_category.Bdds":
         """Bdds category."""
-        return _category.Bdds(self)
+        return _categories().Bdds(self)
 
     @cached_property
-    def cases(self) -> _category.Cases:
+    def cases(self) -> "_category.Cases":
         """Cases category."""
-        return _category.Cases(self)
+        return _categories().Cases(self)
 
     @cached_property
-    def case_fields(self) -> _category.CaseFields:
+    def case_fields(self) -> "_category.CaseFields":
         """CaseFields category."""
-        return _category.CaseFields(self)
+        return _categories().CaseFields(self)
 
     @cached_property
-    def case_types(self) -> _category.CaseTypes:
+    def case_types(self) -> "_category.CaseTypes":
         """CaseTypes category."""
-        return _category.CaseTypes(self)
+        return _categories().CaseTypes(self)
 
     @cached_property
-    def configurations(self) -> _category.Configurations:
+    def configurations(self) -> "_category.Configurations":
         """Configurations category."""
-        return _category.Configurations(self)
+        return _categories().Configurations(self)
 
     @cached_property
-    def milestones(self) -> _category.Milestones:
+    def milestones(self) -> "_category.Milestones":
         """Milestones category."""
-        return _category.Milestones(self)
+        return _categories().Milestones(self)
 
     @cached_property
-    def plans(self) -> _category.Plans:
+    def plans(self) -> "_category.Plans":
         """Plans category."""
-        return _category.Plans(self)
+        return _categories().Plans(self)
 
     @cached_property
-    def priorities(self) -> _category.Priorities:
+    def priorities(self) -> "_category.Priorities":
         """Priorities category."""
-        return _category.Priorities(self)
+        return _categories().Priorities(self)
 
     @cached_property
-    def projects(self) -> _category.Projects:
+    def projects(self) -> "_category.Projects":
         """Projects category."""
-        return _category.Projects(self)
+        return _categories().Projects(self)
 
     @cached_property
-    def reports(self) -> _category.Reports:
+    def reports(self) -> "_category.Reports":
         """Reports category."""
-        return _category.Reports(self)
+        return _categories().Reports(self)
 
     @cached_property
-    def results(self) -> _category.Results:
+    def results(self) -> "_category.Results":
         """Results category."""
-        return _category.Results(self)
+        return _categories().Results(self)
 
     @cached_property
-    def result_fields(self) -> _category.ResultFields:
+    def result_fields(self) -> "_category.ResultFields":
         """ResultFields category."""
-        return _category.ResultFields(self)
+        return _categories().ResultFields(self)
 
     @cached_property
-    def runs(self) -> _category.Runs:
+    def runs(self) -> "_category.Runs":
         """Runs category."""
-        return _category.Runs(self)
+        return _categories().Runs(self)
 
     @cached_property
-    def sections(self) -> _category.Sections:
+    def sections(self) -> "_category.Sections":
         """Sections category."""
-        return _category.Sections(self)
+        return _categories().Sections(self)
 
     @cached_property
-    def shared_steps(self) -> _category.SharedSteps:
+    def shared_steps(self) -> "_category.SharedSteps":
         """SharedSteps category."""
-        return _category.SharedSteps(self)
+        return _categories().SharedSteps(self)
 
     @cached_property
-    def statuses(self) -> _category.Statuses:
+    def statuses(self) -> "_category.Statuses":
         """Statuses category."""
-        return _category.Statuses(self)
+        return _categories().Statuses(self)
 
     @cached_property
-    def suites(self) -> _category.Suites:
+    def suites(self) -> "_category.Suites":
         """Suites category."""
-        return _category.Suites(self)
+        return _categories().Suites(self)
 
     @cached_property
-    def templates(self) -> _category.Template:
+    def templates(self) -> "_category.Template":
         """Template category."""
-        return _category.Template(self)
+        return _categories().Template(self)
 
     @cached_property
-    def tests(self) -> _category.Tests:
+    def tests(self) -> "_category.Tests":
         """Tests category."""
-        return _category.Tests(self)
+        return _categories().Tests(self)
 
     @cached_property
-    def users(self) -> _category.Users:
+    def users(self) -> "_category.Users":
         """Users category."""
-        return _category.Users(self)
+        return _categories().Users(self)
 
     @cached_property
-    def roles(self) -> _category.Roles:
+    def roles(self) -> "_category.Roles":
         """Roles category."""
-        return _category.Roles(self)
+        return _categories().Roles(self)
 
     @cached_property
-    def groups(self) -> _category.Groups:
+    def groups(self) -> "_category.Groups":
         """Groups category."""
-        return _category.Groups(self)
+        return _categories().Groups(self)
 
     @cached_property
-    def variables(self) -> _category.Variables:
+    def variables(self) -> "_category.Variables":
         """Variables category."""
-        return _category.Variables(self)
+        return _categories().Variables(self)
 
     @cached_property
-    def datasets(self) -> _category.Datasets:
+    def datasets(self) -> "_category.Datasets":
         """Datasets category."""
-        return _category.Datasets(self)
+        return _categories().Datasets(self)
 
     @cached_property
-    def dynamic_filter_fields(self) -> _category.DynamicFilterFields:
+    def dynamic_filter_fields(self) -> "_category.DynamicFilterFields":
         """DynamicFilterFields category."""
-        return _category.DynamicFilterFields(self)
+        return _categories().DynamicFilterFields(self)
 
     @cached_property
-    def labels(self) -> _category.Labels:
+    def labels(self) -> "_category.Labels":
         """Labels category."""
-        return _category.Labels(self)
+        return _categories().Labels(self)
+
+
+class TestRailAPI(_Categories, Session):
+    """TestRail API client."""
@@ -0,0 +1,217 @@
+"""Client-side request throttling."""
+
+import asyncio
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import IO, Final
+
+if sys.platform == "win32":  # pragma: no cover
+    import msvcrt
+
+    def _lock_file(file: IO[bytes]) -> None:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+
+    def _unlock_file(file: IO[bytes]) -> None:
+        file.seek(0)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock_file(file: IO[bytes]) -> None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+
+    def _unlock_file(file: IO[bytes]) -> None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+
+_STATE: Final[struct.Struct] = struct.Struct("<dd")
+
+
+class RateLimiter:
+    """
+    Token bucket limiting the request rate of every session sharing it.
+
+    Each request reserves a token; when the bucket is empty the reservation is
+    granted in the future and the session sleeps until then, so callers are
+    served in order and never exceed ``per_minute`` on average.
+    Safe to share between threads, use :class:`FileRateLimiter` across processes.
+    """
+
+    def __init__(self, per_minute: float, burst: int = 1) -> None:
+        """
+        Rate limiter constructor.
+
+        :param per_minute:
+            Sustained number of requests per minute.
+        :param burst:
+            Number of requests that may be sent at once after an idle period (default: 1).
+        """
+        if per_minute <= 0:
+            raise ValueError(f"per_minute must be positive, got {per_minute}")
+        if burst < 1:
+            raise ValueError(f"burst must be at least 1, got {burst}")
+        self.per_minute = per_minute
+        self.burst = burst
+        self._lock = threading.Lock()
+        self.__state = (float(burst), time.time())
+
+    def _take(self, state: tuple[float, float]) -> tuple[float, float]:
+        """Refill the bucket up to ``now`` and take one token; the balance goes negative when overdrawn."""
+        tokens, updated = state
+        now = time.time()
+        tokens = min(float(self.burst), tokens + max(now - updated, 0.0) * self.per_minute / 60) - 1
+        return tokens, now
+
+    def _delay(self, tokens: float) -> float:
+        return 0.0 if tokens >= 0 else -tokens * 60 / self.per_minute
+
+    def reserve(self) -> float:
+        """Reserve a request slot and return how many seconds to wait before sending it."""
+        with self._lock:
+            self.__state = self._take(self.__state)
+            return self._delay(self.__state[0])
+
+
+class FileRateLimiter(RateLimiter):
+    """
+    Token bucket stored in a file, shared by all processes on the host using the same path.
+
+    The bucket state is read and written under an exclusive file lock.
+    """
+
+    def __init__(self, path: str | Path, per_minute: float, burst: int = 1) -> None:
+        """
+        File rate limiter constructor.
+
+        :param path:
+            Path of the state file, created when missing.
+        :param per_minute:
+            Sustained number of requests per minute.
+        :param burst:
+            Number of requests that may be sent at once after an idle period (default: 1).
+        """
+        super().__init__(per_minute, burst)
+        self.path = Path(path)
+
+    def reserve(self) -> float:
+        """Reserve a request slot and return how many seconds to wait before sending it."""
+        with self._lock, self.path.open("a+b") as file:
+            _lock_file(file)
+            try:
+                file.seek(0)
+                data = file.read(_STATE.size)
+                state = _STATE.unpack(data) if len(data) == _STATE.size else (float(self.burst), time.time())
+                tokens, updated = self._take(state)
+                file.seek(0)
+                file.truncate()
+                file.write(_STATE.pack(tokens, updated))
+                file.flush()
+            finally:
+                _unlock_file(file)
+        return self._delay(tokens)
+
+
+class ConcurrencyLimiter:
+    """
+    Adaptive (AIMD) limit of the requests in flight, shared by the threads and tasks using a session.
+
+    The limit grows by one after a full window of successful responses and is halved
+    on HTTP 429, at most once per window: the other requests already in flight
+    when the limit dropped were sent under the old limit and do not count again.
+    """
+
+    def __init__(self, maximum: int = 16, minimum: int = 1, initial: int | None = None) -> None:
+        """
+        Concurrency limiter constructor.
+
+        :param maximum:
+            Upper bound of the limit (default: 16).
+        :param minimum:
+            Lower bound of the limit (default: 1).
+        :param initial:
+            Starting limit (default: ``maximum``).
+        """
+        if minimum < 1:
+            raise ValueError(f"minimum must be at least 1, got {minimum}")
+        if maximum < minimum:
+            raise ValueError(f"maximum must be at least minimum ({minimum}), got {maximum}")
+        initial = maximum if initial is None else initial
+        if not minimum <= initial <= maximum:
+            raise ValueError(f"initial must be between {minimum} and {maximum}, got {initial}")
+        self.maximum = maximum
+        self.minimum = minimum
+        self.__limit = initial
+        self.__in_flight = 0
+        self.__successes = 0
+        self.__epoch = 0
+        self.__condition = threading.Condition()
+        self.__waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = []
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return self.__limit
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests in flight."""
+        return self.__in_flight
+
+    def __try_acquire(self) -> int | None:
+        if self.__in_flight >= self.__limit:
+            return None
+        self.__in_flight += 1
+        return self.__epoch
+
+    def acquire(self) -> int:
+        """Block until a request may be sent; the returned ticket is passed to :meth:`release`."""
+        with self.__condition:
+            while (ticket := self.__try_acquire()) is None:
+                self.__condition.wait()
+            return ticket
+
+    async def acquire_async(self) -> int:
+        """Asyncio counterpart of :meth:`acquire`."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self.__condition:
+                if (ticket := self.__try_acquire()) is not None:
+                    return ticket
+                waiter = loop.create_future()
+                self.__waiters.append((loop, waiter))
+            await waiter
+
+    def release(self, ticket: int, *, throttled: bool | None) -> None:
+        """
+        Release a slot taken by :meth:`acquire` and adjust the limit.
+
+        :param ticket:
+            Value returned by :meth:`acquire`.
+        :param throttled:
+            True for HTTP 429, False for any other response, None when no response was received.
+        """
+        with self.__condition:
+            self.__in_flight -= 1
+            if throttled and ticket == self.__epoch:
+                self.__limit = max(self.minimum, self.__limit // 2)
+                self.__successes = 0
+                self.__epoch += 1
+            elif throttled is False:
+                self.__successes += 1
+                if self.__successes >= self.__limit:
+                    self.__limit = min(self.maximum, self.__limit + 1)
+                    self.__successes = 0
+            self.__condition.notify_all()
+            waiters, self.__waiters = self.__waiters, []
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(self.__wake, waiter)
+
+    @staticmethod
+    def __wake(waiter: "asyncio.Future[None]") -> None:
+        if not waiter.done():
+            waiter.set_result(None)
@@ -0,0 +1,93 @@
+"""Tracing of the requests through an OpenTelemetry-compatible tracer."""
+
+import contextlib
+import contextvars
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any, Final, Protocol
+
+
+class Span(Protocol):
+    """The part of ``opentelemetry.trace.Span`` used by the client."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute of the span."""
+
+
+class Tracer(Protocol):
+    """
+    The part of ``opentelemetry.trace.Tracer`` used by the client.
+
+    Any OpenTelemetry tracer, e.g. ``opentelemetry.trace.get_tracer("testrail_api")``, can be used as is.
+    """
+
+    def start_as_current_span(
+        self, name: str, attributes: dict[str, Any] | None = None
+    ) -> contextlib.AbstractContextManager[Span]:
+        """Start a span, child of the current one, and make it current for the duration of the context."""
+
+
+class _NoopSpan:
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+NOOP_SPAN: Final[contextlib.AbstractContextManager[Span]] = contextlib.nullcontext(_NoopSpan())
+
+_current_span: contextvars.ContextVar["RecordedSpan | None"] = contextvars.ContextVar(
+    "testrail_api_current_span", default=None
+)
+
+
+class RecordedSpan:
+    """A span recorded by :class:`SpanRecorder`; ``start``/``end`` are ``time.perf_counter`` values."""
+
+    def __init__(self, name: str, attributes: dict[str, Any], parent: "RecordedSpan | None") -> None:
+        self.name = name
+        self.attributes = attributes
+        self.parent = parent
+        self.thread = threading.get_ident()
+        self.start = time.perf_counter()
+        self.end: float | None = None
+
+    def __repr__(self) -> str:
+        return f"RecordedSpan(name={self.name!r}, duration={self.duration}, attributes={self.attributes!r})"
+
+    @property
+    def duration(self) -> float | None:
+        """Duration in seconds of a finished span."""
+        return None if self.end is None else self.end - self.start
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Set an attribute of the span."""
+        self.attributes[key] = value
+
+
+class SpanRecorder:
+    """
+    Minimal in-memory tracer, for when OpenTelemetry is not installed.
+
+    Keeps every finished span in :attr:`spans`, with its parent and thread,
+    e.g. to draw parallel bulk fetches on a timeline.
+    """
+
+    def __init__(self) -> None:
+        self.spans: list[RecordedSpan] = []
+        self.__lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def start_as_current_span(self, name: str, attributes: dict[str, Any] | None = None) -> Iterator[RecordedSpan]:
+        """Start a span, child of the current one, and make it current for the duration of the context."""
+        span = RecordedSpan(name, dict(attributes or {}), _current_span.get())
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.set_attribute("exception.type", type(e).__name__)
+            raise
+        finally:
+            span.end = time.perf_counter()
+            _current_span.reset(token)
+            with self.__lock:
+                self.spans.append(span)
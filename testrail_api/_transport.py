@@ -0,0 +1,425 @@
+"""HTTP transports of the blocking session."""
+
+import abc
+import importlib.util
+import os
+import socket
+import ssl
+from collections.abc import Iterator, Mapping
+from typing import IO, TYPE_CHECKING, Any
+from urllib.parse import urlencode
+
+import requests
+import urllib3
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, DEFAULT_RETRIES, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import (
+    ConnectTimeoutError,
+    HTTPError,
+    MaxRetryError,
+    NewConnectionError,
+    ProtocolError,
+    ReadTimeoutError,
+)
+from urllib3.exceptions import SSLError as Urllib3SSLError
+
+from ._exception import TestRailError
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class Transport(abc.ABC):
+    """
+    Sends the requests of a :class:`Session`.
+
+    Responses are returned as ``requests.Response`` whatever the HTTP library,
+    so response handlers and errors are the same for every transport.
+    """
+
+    @abc.abstractmethod
+    def setup(self, *, headers: Mapping[str, str], auth: tuple[str, str], verify: bool | str) -> None:
+        """Apply the session settings, called once by the session."""
+
+    @abc.abstractmethod
+    def request(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        *,
+        timeout: float | tuple[float, float],
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        data: bytes | None = None,
+        files: Mapping[str, IO[bytes]] | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send a request; ``stream=True`` leaves the body unread for ``iter_content``."""
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Release pooled connections."""
+
+
+class RequestsTransport(Transport):
+    """Default transport based on ``requests.Session``: hooks, redirects, cookies and environment proxies."""
+
+    def __init__(self, session: requests.Session | None = None) -> None:
+        """
+        Create a transport over a ``requests.Session``.
+
+        :param session:
+            A given session will be used instead of a new one.
+        """
+        self.session = session or requests.Session()
+
+    def setup(self, *, headers: Mapping[str, str], auth: tuple[str, str], verify: bool | str) -> None:
+        """Apply the session settings to the ``requests.Session``."""
+        self.session.headers.update(headers)
+        self.session.verify = verify
+        self.session.auth = auth
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request through the ``requests.Session``."""
+        return self.session.request(method=method, url=url, **kwargs)
+
+    def close(self) -> None:
+        """Close the ``requests.Session``."""
+        self.session.close()
+
+
+def _keepalive_socket_options(idle: int) -> list[tuple[int, int, int]]:
+    """Socket options enabling TCP keep-alive probes after ``idle`` seconds, where the platform supports it."""
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    # Linux/Windows name the idle time TCP_KEEPIDLE, macOS TCP_KEEPALIVE
+    keepidle = getattr(socket, "TCP_KEEPIDLE", None) or getattr(socket, "TCP_KEEPALIVE", None)
+    if keepidle is not None:
+        options.append((socket.IPPROTO_TCP, keepidle, idle))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, idle))
+    return options
+
+
+class _PoolAdapter(HTTPAdapter):
+    """HTTP adapter with a configurable connection pool and optional TCP keep-alive probes."""
+
+    def __init__(
+        self,
+        *,
+        pool_connections: int | None = None,
+        pool_maxsize: int | None = None,
+        pool_block: bool | None = None,
+        max_retries: Any = None,
+        tcp_keepalive: int | None = None,
+    ) -> None:
+        # set before HTTPAdapter.__init__, which creates the pool manager
+        self.__tcp_keepalive = tcp_keepalive
+        super().__init__(
+            pool_connections=DEFAULT_POOLSIZE if pool_connections is None else pool_connections,
+            pool_maxsize=DEFAULT_POOLSIZE if pool_maxsize is None else pool_maxsize,
+            pool_block=DEFAULT_POOLBLOCK if pool_block is None else pool_block,
+            max_retries=DEFAULT_RETRIES if max_retries is None else max_retries,
+        )
+
+    def init_poolmanager(self, *args: Any, **pool_kwargs: Any) -> None:
+        """Create the pool manager, adding the keep-alive socket options."""
+        if self.__tcp_keepalive is not None:
+            pool_kwargs["socket_options"] = [
+                *HTTPConnection.default_socket_options,
+                *_keepalive_socket_options(self.__tcp_keepalive),
+            ]
+        super().init_poolmanager(*args, **pool_kwargs)
+
+
+class Urllib3Transport(Transport):
+    """
+    Thin transport calling a ``urllib3.PoolManager`` directly.
+
+    Skips the per-call work of ``requests.Session`` (hooks, redirects, cookie merging,
+    environment proxy lookup); urllib3 errors are raised as the matching ``requests`` exceptions,
+    so ``retry_exceptions`` keep working.
+    """
+
+    def __init__(self, *, pool_maxsize: int = 10, pool_block: bool = False, max_retries: int = 0) -> None:
+        """
+        Urllib3 transport constructor.
+
+        :param pool_maxsize:
+            Maximum number of connections kept in the pool (default: 10).
+        :param pool_block:
+            Wait for a free connection when the pool is exhausted (default: False).
+        :param max_retries:
+            Retries of failed connections (default: 0).
+        """
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.max_retries = max_retries
+        self.__headers: dict[str, str] = {}
+        self.__pool: urllib3.PoolManager | None = None
+
+    def setup(self, *, headers: Mapping[str, str], auth: tuple[str, str], verify: bool | str) -> None:
+        """Create the pool manager with the session settings."""
+        self.__headers = {
+            "Accept": "*/*",
+            "Accept-Encoding": "gzip, deflate",
+            **headers,
+            **urllib3.make_headers(basic_auth=":".join(auth)),
+        }
+        tls: dict[str, Any] = {"cert_reqs": "CERT_REQUIRED" if verify else "CERT_NONE"}
+        if isinstance(verify, str):
+            tls["ca_certs" if os.path.isfile(verify) else "ca_cert_dir"] = verify  # noqa: PTH113
+        retries = urllib3.Retry(self.max_retries, redirect=False, raise_on_status=False) if self.max_retries else False
+        self.__pool = urllib3.PoolManager(maxsize=self.pool_maxsize, block=self.pool_block, retries=retries, **tls)
+
+    def request(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        *,
+        timeout: float | tuple[float, float],
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        data: bytes | None = None,
+        files: Mapping[str, IO[bytes]] | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send a request with the pool manager."""
+        if self.__pool is None:
+            raise RuntimeError("Urllib3Transport.setup() must be called before sending requests")
+        if params and (query := urlencode([(k, v) for k, v in params.items() if v is not None], doseq=True)):
+            url = f"{url}&{query}"
+        request_headers = {**self.__headers, **(headers or {})}
+        if files:
+            fields = {name: (os.path.basename(file.name), file.read()) for name, file in files.items()}  # noqa: PTH119
+            data, request_headers["Content-Type"] = urllib3.encode_multipart_formdata(fields)
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        try:
+            raw = self.__pool.request(
+                method,
+                url,
+                body=data,
+                headers=request_headers,
+                timeout=urllib3.Timeout(connect=connect, read=read),
+                preload_content=not stream,
+                redirect=False,
+            )
+        except MaxRetryError as e:
+            raise _requests_error(e.reason or e) from e
+        except HTTPError as e:
+            raise _requests_error(e) from e
+        return _to_requests_response(method, url, request_headers, data, raw, stream=stream)
+
+    def close(self) -> None:
+        """Clear the pool manager."""
+        if self.__pool is not None:
+            self.__pool.clear()
+
+
+class HttpxTransport(Transport):
+    """
+    Transport based on ``httpx.Client``, optionally speaking HTTP/2.
+
+    With ``http2=True`` the requests sent concurrently by the threads sharing a session
+    (e.g. parallel bulk fetches) are multiplexed over a single connection per host
+    instead of a TCP+TLS connection each. HTTP/2 is negotiated with TLS (ALPN),
+    plain ``http://`` hosts keep HTTP/1.1.
+    Requires the ``http2`` extra: ``pip install testrail-api[http2]``.
+    """
+
+    def __init__(
+        self,
+        *,
+        http2: bool = True,
+        pool_maxsize: int = 10,
+        max_retries: int = 0,
+        keepalive_expiry: float = 5.0,
+        client: "httpx.Client | None" = None,
+    ) -> None:
+        """
+        Httpx transport constructor.
+
+        :param http2:
+            Use HTTP/2 when the server supports it (default: True).
+        :param pool_maxsize:
+            Maximum number of connections in the pool (default: 10).
+        :param max_retries:
+            Retries of failed connections (default: 0).
+        :param keepalive_expiry:
+            Seconds an idle connection is kept in the pool (default: 5).
+        :param client:
+            A given ``httpx.Client`` will be used instead of a new one, the other options do not apply to it.
+        """
+        try:
+            import httpx  # noqa: PLC0415
+        except ImportError as e:
+            raise TestRailError(
+                "HttpxTransport requires httpx, install it with: pip install testrail-api[http2]"
+            ) from e
+        if http2 and client is None:
+            require_h2()
+        self.http2 = http2
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.keepalive_expiry = keepalive_expiry
+        self.client = client
+        self.__httpx = httpx
+
+    def setup(self, *, headers: Mapping[str, str], auth: tuple[str, str], verify: bool | str) -> None:
+        """Create the client with the session settings, or apply them to the given one."""
+        httpx = self.__httpx
+        if self.client is None:
+            # httpx deprecates CA bundle paths in ``verify``, build the context explicitly
+            _verify = ssl.create_default_context(cafile=verify) if isinstance(verify, str) else verify
+            limits = httpx.Limits(
+                max_connections=self.pool_maxsize,
+                max_keepalive_connections=self.pool_maxsize,
+                keepalive_expiry=self.keepalive_expiry,
+            )
+            self.client = httpx.Client(
+                transport=httpx.HTTPTransport(
+                    verify=_verify, http2=self.http2, limits=limits, retries=self.max_retries
+                ),
+            )
+        self.client.headers.update(headers)
+        self.client.auth = httpx.BasicAuth(*auth)
+
+    def request(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        *,
+        timeout: float | tuple[float, float],
+        params: Mapping[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        data: bytes | None = None,
+        files: Mapping[str, IO[bytes]] | None = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send a request with the client."""
+        if self.client is None:
+            raise RuntimeError("HttpxTransport.setup() must be called before sending requests")
+        httpx = self.__httpx
+        if params and (query := urlencode([(k, v) for k, v in params.items() if v is not None], doseq=True)):
+            # httpx would replace the "?/api/v2/..." query, so params are appended the way requests does it
+            url = f"{url}&{query}"
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        try:
+            request = self.client.build_request(
+                method,
+                url,
+                headers=headers,
+                content=data,
+                files=files,
+                timeout=httpx.Timeout(read, connect=connect),
+            )
+            response = self.client.send(request, stream=stream)
+        except httpx.TransportError as e:
+            raise _httpx_error(httpx, e) from e
+        return _from_httpx(response, data, stream=stream)
+
+    def close(self) -> None:
+        """Close the client."""
+        if self.client is not None:
+            self.client.close()
+
+
+def require_h2() -> None:
+    """Check the HTTP/2 dependencies of httpx are installed."""
+    if importlib.util.find_spec("h2") is None:
+        raise TestRailError("HTTP/2 requires h2, install it with: pip install testrail-api[http2]")
+
+
+class _HttpxStream:
+    """``requests.Response.raw`` of an httpx response, read by ``iter_content``."""
+
+    def __init__(self, response: "httpx.Response") -> None:
+        self.__response = response
+
+    def stream(self, amt: int, decode_content: bool = True) -> Iterator[bytes]:  # noqa: ARG002, FBT001, FBT002
+        yield from self.__response.iter_bytes(amt)
+
+    def close(self) -> None:
+        self.__response.close()
+
+
+def _httpx_error(httpx: Any, error: Exception) -> requests.RequestException:
+    """Translate an httpx transport error to the exception ``requests`` would raise."""
+    if isinstance(error, httpx.ConnectTimeout):
+        return requests.ConnectTimeout(error)
+    if isinstance(error, httpx.ReadTimeout):
+        return requests.ReadTimeout(error)
+    if isinstance(error, httpx.TimeoutException):
+        return requests.Timeout(error)
+    if isinstance(error, (httpx.NetworkError, httpx.RemoteProtocolError)):
+        return requests.ConnectionError(error)
+    return requests.RequestException(error)
+
+
+def _from_httpx(response: "httpx.Response", body: bytes | None, *, stream: bool) -> requests.Response:
+    """Wrap an httpx response into a ``requests.Response``, the body stays unread for streamed responses."""
+    request = _prepared_request(
+        response.request.method, str(response.request.url), dict(response.request.headers), body
+    )
+    result = requests.Response()
+    result.status_code = response.status_code
+    result.reason = response.reason_phrase
+    result.headers = CaseInsensitiveDict(response.headers.multi_items())
+    result.url = request.url or ""
+    result.raw = _HttpxStream(response)
+    result.request = request
+    result.encoding = response.charset_encoding
+    if not stream:
+        result._content = response.content  # noqa: SLF001
+    return result
+
+
+def _requests_error(error: BaseException) -> requests.RequestException:
+    """Translate a urllib3 error to the exception ``requests`` would raise."""
+    if isinstance(error, ConnectTimeoutError):
+        return requests.ConnectTimeout(error)
+    if isinstance(error, ReadTimeoutError):
+        return requests.ReadTimeout(error)
+    if isinstance(error, Urllib3SSLError):
+        return requests.exceptions.SSLError(error)
+    if isinstance(error, (NewConnectionError, ProtocolError, ConnectionError)):
+        return requests.ConnectionError(error)
+    return requests.RequestException(error)
+
+
+def _to_requests_response(  # noqa: PLR0913
+    method: str,
+    url: str,
+    headers: Mapping[str, str],
+    body: bytes | None,
+    raw: urllib3.BaseHTTPResponse,
+    *,
+    stream: bool,
+) -> requests.Response:
+    """Wrap a urllib3 response into a ``requests.Response``, the body stays unread for streamed responses."""
+    request = _prepared_request(method, url, headers, body)
+    response = requests.Response()
+    response.status_code = raw.status
+    response.reason = raw.reason or ""
+    response.headers = CaseInsensitiveDict(raw.headers)
+    response.url = url
+    response.raw = raw
+    response.request = request
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    if not stream:
+        response._content = raw.data  # noqa: SLF001
+    return response
+
+
+def _prepared_request(
+    method: str, url: str, headers: Mapping[str, str], body: bytes | None
+) -> requests.PreparedRequest:
+    """Build the ``request`` of a wrapped response, as it was sent."""
+    request = requests.PreparedRequest()
+    request.method = method
+    request.url = url
+    request.headers = CaseInsensitiveDict(headers)
+    if body is not None:
+        request.headers["Content-Length"] = str(len(body))
+    request.body = body
+    return request
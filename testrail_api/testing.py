@@ -0,0 +1,652 @@
+"""
+In-process TestRail emulator for functional, load and throughput tests.
+
+A WSGI application keeping its state in memory and implementing the core endpoints
+(projects, suites, sections, cases, milestones, runs, plans, tests, results, users,
+attachments and the metadata lists) with TestRail 6.7+ offset pagination and ``_links``.
+Latency, HTTP 429/5xx faults and a server-side rate limit can be configured
+to exercise the retries, limiters and concurrent fetches of the clients::
+
+    from testrail_api import TestRailAPI
+    from testrail_api.testing import Emulator, Fault
+
+    emulator = Emulator(latency=0.02, faults=[Fault(429, probability=0.05, retry_after=1)])
+    project = emulator.add("projects", name="Load")
+    with emulator.serve() as url:
+        api = TestRailAPI(url, emulator.email, emulator.password, warn_ignore=True)
+        api.cases.get_cases_bulk(project["id"], concurrency=4)
+
+Only the standard library is used, the emulator is part of the package.
+"""
+
+import base64
+import contextlib
+import email.policy
+import functools
+import json
+import random
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Iterable, Iterator
+from email.parser import BytesParser
+from socketserver import ThreadingMixIn
+from typing import Any, Final, NamedTuple
+from urllib.parse import parse_qsl
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+from ._metrics import endpoint_template
+from ._pagination import LIMIT_MAX
+
+__all__ = ["Emulator", "Fault"]
+
+StartResponse = Callable[[str, list[tuple[str, str]]], Any]
+
+_REASONS: Final[dict[int, str]] = {
+    200: "OK",
+    400: "Bad Request",
+    401: "Unauthorized",
+    403: "Forbidden",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+    502: "Bad Gateway",
+    503: "Service Unavailable",
+    504: "Gateway Timeout",
+}
+
+STATUSES: Final[list[dict[str, Any]]] = [
+    {"id": 1, "name": "passed", "label": "Passed", "is_final": True, "is_system": True, "is_untested": False},
+    {"id": 2, "name": "blocked", "label": "Blocked", "is_final": True, "is_system": True, "is_untested": False},
+    {"id": 3, "name": "untested", "label": "Untested", "is_final": False, "is_system": True, "is_untested": True},
+    {"id": 4, "name": "retest", "label": "Retest", "is_final": False, "is_system": True, "is_untested": False},
+    {"id": 5, "name": "failed", "label": "Failed", "is_final": True, "is_system": True, "is_untested": False},
+]
+
+UNTESTED: Final[int] = 3
+
+_METADATA: Final[dict[str, list[dict[str, Any]]]] = {
+    "get_statuses": STATUSES,
+    "get_case_statuses": [{"case_status_id": 1, "name": "Approved", "abbreviation": None, "is_default": True}],
+    "get_priorities": [
+        {"id": 1, "name": "1 - Low", "short_name": "1 - Low", "priority": 1, "is_default": False},
+        {"id": 2, "name": "2 - Medium", "short_name": "2 - Med", "priority": 2, "is_default": True},
+        {"id": 3, "name": "3 - High", "short_name": "3 - High", "priority": 3, "is_default": False},
+    ],
+    "get_case_types": [
+        {"id": 1, "name": "Automated", "is_default": False},
+        {"id": 2, "name": "Functionality", "is_default": False},
+        {"id": 3, "name": "Other", "is_default": True},
+    ],
+    "get_case_fields": [],
+    "get_result_fields": [],
+    "get_templates": [
+        {"id": 1, "name": "Test Case (Text)", "is_default": True},
+        {"id": 2, "name": "Test Case (Steps)", "is_default": False},
+    ],
+    "get_roles": [{"id": 1, "name": "Lead", "is_default": True}],
+}
+
+# endpoint object -> (table, field set from the id of the ``add_*`` URL)
+_RESOURCES: Final[dict[str, tuple[str, str | None]]] = {
+    "project": ("projects", None),
+    "suite": ("suites", "project_id"),
+    "section": ("sections", "project_id"),
+    "case": ("cases", "section_id"),
+    "milestone": ("milestones", "project_id"),
+    "run": ("runs", "project_id"),
+    "plan": ("plans", "project_id"),
+    "test": ("tests", None),
+    "user": ("users", None),
+}
+
+# ``get_attachments_for_*``/``add_attachment_to_*`` object -> attachment field of the object id
+_ATTACHMENT_TARGETS: Final[dict[str, str]] = {
+    "case": "case_id",
+    "plan": "plan_id",
+    "run": "run_id",
+    "result": "result_id",
+    "test": "test_id",
+}
+
+
+class Fault(NamedTuple):
+    """
+    Error injected by the :class:`Emulator` instead of a response.
+
+    :param status:
+        HTTP status of the error, e.g. 429 or 503.
+    :param probability:
+        Chance of a request getting the error (default: every request).
+    :param retry_after:
+        Value of the ``Retry-After`` header, in seconds.
+    :param endpoints:
+        Endpoint names affected, e.g. ``("get_cases",)`` (default: all).
+    :param times:
+        Number of errors to inject before the fault is exhausted (default: unlimited).
+    """
+
+    status: int
+    probability: float = 1.0
+    retry_after: float | None = None
+    endpoints: tuple[str, ...] | None = None
+    times: int | None = None
+
+
+class _ApiError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class _Response(NamedTuple):
+    status: int
+    body: bytes
+    content_type: str = "application/json"
+    headers: tuple[tuple[str, str], ...] = ()
+
+
+def _route(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        func.__route__ = name  # type: ignore[attr-defined]
+        return func
+
+    return decorator
+
+
+def _matches(obj: dict[str, Any], filters: dict[str, str]) -> bool:
+    """
+    Apply the filters of a list endpoint.
+
+    ``*_after``/``*_before`` compare timestamps, ``filter`` searches the title or name,
+    the other keys match one of the ``value[,value]`` list.
+    """
+    for key, expected in filters.items():
+        if key.endswith(("_after", "_before")):
+            field = key.rsplit("_", 1)[0].replace("created", "created_on").replace("updated", "updated_on")
+            timestamp = obj.get(field) or 0
+            if timestamp <= int(expected) if key.endswith("_after") else timestamp >= int(expected):
+                return False
+        elif key == "filter":
+            if expected.lower() not in str(obj.get("title", obj.get("name", ""))).lower():
+                return False
+        else:
+            value = obj.get(key)
+            if isinstance(value, bool):
+                value = int(value)
+            if str(value) not in expected.split(","):
+                return False
+    return True
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, *_: Any) -> None:
+        pass
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class Emulator:
+    """
+    WSGI application emulating a TestRail instance, with in-memory state.
+
+    Objects may be created through the API or directly with :meth:`add`; :attr:`tables` holds the state.
+    :attr:`requests` counts the requests by endpoint template and :attr:`max_in_flight` records
+    the highest number of requests served at once.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        email: str = "example@mail.com",
+        password: str = "password",  # noqa: S107
+        latency: float | Callable[[], float] = 0.0,
+        faults: Iterable[Fault] = (),
+        max_rps: float | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Emulator constructor.
+
+        :param email:
+            Email of the account accepted by the basic authentication.
+        :param password:
+            Password or API key of the account.
+        :param latency:
+            Seconds every request takes, or a function returning them, e.g. ``lambda: random.uniform(0.01, 0.1)``.
+        :param faults:
+            Errors injected instead of responses (see :class:`Fault`).
+        :param max_rps:
+            Requests accepted per second, the requests over it get a 429 with ``Retry-After``
+            like a TestRail Cloud instance.
+        :param seed:
+            Seed of the random injection of faults.
+        """
+        self.email = email
+        self.password = password
+        self.latency = latency
+        self.faults = list(faults)
+        self.max_rps = max_rps
+        tables = [table for table, _ in _RESOURCES.values()] + ["results", "attachments"]
+        self.tables: dict[str, dict[int, dict[str, Any]]] = {table: {} for table in tables}
+        self.requests: Counter[str] = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.__random = random.Random(seed)
+        self.__injected: Counter[int] = Counter()
+        self.__window: deque[float] = deque()
+        self.__ids: Counter[str] = Counter()
+        self.__files: dict[int, bytes] = {}
+        self.__case_tests: dict[tuple[int, int], dict[str, Any]] = {}
+        self.__lock = threading.RLock()
+        self.__authorization = "Basic " + base64.b64encode(f"{email}:{password}".encode()).decode()
+        self.__routes: dict[str, Callable[..., Any]] = {}
+        for name in dir(type(self)):
+            if route := getattr(getattr(type(self), name), "__route__", None):
+                self.__routes[route] = getattr(self, name)
+        # the endpoints without a specific behaviour
+        for name, (table, parent) in _RESOURCES.items():
+            field = f"{name}_id"
+            self.__routes.setdefault(f"get_{name}", functools.partial(self.__get_object, table, field))
+            self.__routes.setdefault(f"add_{name}", functools.partial(self.__add_object, table, parent))
+            self.__routes.setdefault(f"update_{name}", functools.partial(self.__update_object, table, field))
+            self.__routes.setdefault(f"delete_{name}", functools.partial(self.__delete_object, table, field))
+        for target in _ATTACHMENT_TARGETS:
+            self.__routes[f"add_attachment_to_{target}"] = functools.partial(self.__add_attachment, target)
+            self.__routes[f"get_attachments_for_{target}"] = functools.partial(self.__attachments, target)
+        for name, items in _METADATA.items():
+            self.__routes[name] = functools.partial(self.__metadata, items)
+        self.add("users", name="Example", email=email, is_active=True, role_id=1)
+
+    # state
+
+    def add(self, table: str, **fields: Any) -> dict[str, Any]:
+        """Store a new object in a table, e.g. ``add("cases", section_id=1, title="Case")``, and return it."""
+        with self.__lock:
+            self.__ids[table] += 1
+            obj = {"id": self.__ids[table], **fields}
+            self.tables[table][obj["id"]] = obj
+            return obj
+
+    def __get(self, table: str, obj_id: int, field: str) -> dict[str, Any]:
+        if (obj := self.tables[table].get(obj_id)) is None:
+            raise _ApiError(400, f"Field :{field} is not a valid or accessible {table[:-1]}.")
+        return obj
+
+    # WSGI
+
+    def __call__(self, environ: dict[str, Any], start_response: StartResponse) -> list[bytes]:
+        """Serve a request."""
+        with self.__lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            response = self.__serve(environ)
+        finally:
+            with self.__lock:
+                self.in_flight -= 1
+        headers = [("Content-Type", response.content_type), ("Content-Length", str(len(response.body)))]
+        start_response(f"{response.status} {_REASONS.get(response.status, '')}", headers + list(response.headers))
+        return [response.body]
+
+    @contextlib.contextmanager
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> Iterator[str]:
+        """Serve the emulator on a local port with a thread per request, yield its URL."""
+        server = make_server(host, port, self, server_class=_ThreadingWSGIServer, handler_class=_QuietHandler)
+        thread = threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.05}, name="testrail_api-emulator", daemon=True
+        )
+        thread.start()
+        try:
+            yield f"http://{host}:{server.server_port}/"
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def __serve(self, environ: dict[str, Any]) -> _Response:  # noqa: PLR0911
+        endpoint, _, query = environ.get("QUERY_STRING", "").partition("&")
+        name, *ids = endpoint.removeprefix("/api/v2/").split("/")
+        with self.__lock:
+            self.requests[endpoint_template(endpoint.removeprefix("/api/v2/"))] += 1
+        latency = self.latency() if callable(self.latency) else self.latency
+        if latency:
+            time.sleep(latency)
+        if environ.get("HTTP_AUTHORIZATION") != self.__authorization:
+            return self.__error(401, "Authentication failed: invalid or missing user/password or session cookie.")
+        if (throttled := self.__throttle()) is not None:
+            return throttled
+        if (fault := self.__fault(name)) is not None:
+            return fault
+        handler = self.__routes.get(name)
+        method = environ["REQUEST_METHOD"]
+        if handler is None or (method == "GET") != name.startswith("get_"):
+            return self.__error(400, f"Unknown method '{name}'")
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+        body = environ["wsgi.input"].read(length) if length else b""
+        try:
+            params = dict(parse_qsl(query))
+            args = [int(value) for value in ids]
+            with self.__lock:
+                result = handler(*args, params=params, body=self.__parse_body(environ, body))
+                # serialized under the lock, the objects are shared with the other requests
+                return result if isinstance(result, _Response) else _Response(200, json.dumps(result).encode())
+        except _ApiError as e:
+            return self.__error(e.status, str(e))
+        except (TypeError, ValueError) as e:
+            return self.__error(400, f"Invalid request: {e}")
+
+    @staticmethod
+    def __parse_body(environ: dict[str, Any], body: bytes) -> Any:
+        content_type = environ.get("CONTENT_TYPE", "")
+        if content_type.startswith("multipart/form-data"):
+            message = BytesParser(policy=email.policy.HTTP).parsebytes(
+                f"Content-Type: {content_type}\r\n\r\n".encode() + body
+            )
+            return {
+                part.get_param("name", header="content-disposition"): (
+                    part.get_filename(),
+                    part.get_payload(decode=True),
+                )
+                for part in message.iter_parts()
+            }
+        return json.loads(body) if body else {}
+
+    @staticmethod
+    def __error(status: int, message: str, retry_after: float | None = None) -> _Response:
+        headers = () if retry_after is None else (("Retry-After", f"{retry_after:g}"),)
+        return _Response(status, json.dumps({"error": message}).encode(), headers=headers)
+
+    def __throttle(self) -> _Response | None:
+        if self.max_rps is None:
+            return None
+        with self.__lock:
+            now = time.monotonic()
+            while self.__window and self.__window[0] <= now - 1:
+                self.__window.popleft()
+            if len(self.__window) >= self.max_rps:
+                retry_after = max(1, round(self.__window[0] + 1 - now))
+                return self.__error(429, "API Rate Limit Exceeded", retry_after)
+            self.__window.append(now)
+        return None
+
+    def __fault(self, name: str) -> _Response | None:
+        with self.__lock:
+            for index, fault in enumerate(self.faults):
+                if fault.endpoints is not None and name not in fault.endpoints:
+                    continue
+                if fault.times is not None and self.__injected[index] >= fault.times:
+                    continue
+                if self.__random.random() < fault.probability:
+                    self.__injected[index] += 1
+                    return self.__error(fault.status, f"Injected error {fault.status}", fault.retry_after)
+        return None
+
+    # generic endpoints
+
+    @staticmethod
+    def __page(key: str, endpoint: str, items: list[dict[str, Any]], params: dict[str, str]) -> dict[str, Any]:
+        offset = int(params.get("offset", 0))
+        limit = min(int(params.get("limit", LIMIT_MAX)), LIMIT_MAX)
+        filters = {k: v for k, v in params.items() if k not in ("offset", "limit")}
+        query = "".join(f"&{k}={v}" for k, v in filters.items())
+        items = [item for item in items if _matches(item, filters)]
+        page = items[offset : offset + limit]
+        more = offset + limit < len(items)
+        return {
+            "offset": offset,
+            "limit": limit,
+            "size": len(page),
+            "_links": {
+                "next": f"/api/v2/{endpoint}{query}&limit={limit}&offset={offset + limit}" if more else None,
+                "prev": f"/api/v2/{endpoint}{query}&limit={limit}&offset={max(offset - limit, 0)}" if offset else None,
+            },
+            key: page,
+        }
+
+    def __list(self, table: str, field: str | None, parent_id: int | None) -> list[dict[str, Any]]:
+        return [obj for obj in self.tables[table].values() if field is None or obj.get(field) == parent_id]
+
+    def __update(self, obj: dict[str, Any], body: dict[str, Any]) -> dict[str, Any]:
+        obj.update({key: value for key, value in body.items() if key != "id"})
+        obj["updated_on"] = int(time.time())
+        return obj
+
+    def __get_object(self, table: str, field: str, obj_id: int, **_: Any) -> dict[str, Any]:
+        return self.__get(table, obj_id, field)
+
+    def __add_object(
+        self, table: str, parent: str | None, parent_id: int | None = None, *, body: dict[str, Any], **_: Any
+    ) -> dict[str, Any]:
+        if parent is None:
+            return self.add(table, **body)
+        if parent_id is None:
+            raise _ApiError(400, f"Field :{parent} is a required field.")
+        return self.add(table, **{parent: parent_id}, **body)
+
+    def __update_object(self, table: str, field: str, obj_id: int, *, body: dict[str, Any], **_: Any) -> dict[str, Any]:
+        return self.__update(self.__get(table, obj_id, field), body)
+
+    def __delete_object(self, table: str, field: str, obj_id: int, **_: Any) -> None:
+        self.__get(table, obj_id, field)
+        del self.tables[table][obj_id]
+
+    @staticmethod
+    def __metadata(items: list[dict[str, Any]], *_: Any, **__: Any) -> list[dict[str, Any]]:
+        return items
+
+    # projects, suites, sections, milestones, plans, users
+
+    @_route("get_projects")
+    def _get_projects(self, *, params: dict[str, str], **_: Any) -> dict[str, Any]:
+        return self.__page("projects", "get_projects", self.__list("projects", None, None), params)
+
+    @_route("get_project")
+    def _get_project(self, project_id: int, **_: Any) -> dict[str, Any]:
+        return self.__get("projects", project_id, "project_id")
+
+    @_route("add_project")
+    def _add_project(self, *, body: dict[str, Any], **_: Any) -> dict[str, Any]:
+        return self.add("projects", **{"is_completed": False, "suite_mode": 1} | body)
+
+    @_route("get_suites")
+    def _get_suites(self, project_id: int, *, params: dict[str, str], **_: Any) -> dict[str, Any]:
+        suites = self.__list("suites", "project_id", project_id)
+        return self.__page("suites", f"get_suites/{project_id}", suites, params)
+
+    @_route("get_sections")
+    def _get_sections(self, project_id: int, *, params: dict[str, str], **_: Any) -> dict[str, Any]:
+        sections = self.__list("sections", "project_id", project_id)
+        return self.__page("sections", f"get_sections/{project_id}", sections, params)
+
+    @_route("add_section")
+    def _add_section(self, project_id: int, *, body: dict[str, Any], **_: Any) -> dict[str, Any]:
+        self.__get("projects", project_id, "project_id")
+        if "suite_id" not in body:
+            suites = self.__list("suites", "project_id", project_id)
+            body["suite_id"] = suites[0]["id"] if suites else self.add("suites", project_id=project_id)["id"]
+        return self.add("sections", **{"project_id": project_id, "parent_id": None, "depth": 0} | body)
+
+    @_route("get_milestones")
+    def _get_milestones(self, project_id: int, *, params: dict[str, str], **_: Any) -> dict[str, Any]:
+        milestones = self.__list("milestones", "project_id", project_id)
+        return self.__page("milestones", f"get_milestones/{project_id}", milestones, params)
+
+    @_route("get_plans")
+    def _get_plans(self, project_id: int, *, params: dict[str, str], **_: Any) -> dict[str, Any]:
+        return self.__page("plans", f"get_plans/{project_id}", self.__list("plans", "project_id", project_id), params)
+
+    @_route("close_plan")
+    def _close_plan(self, plan_id: int, **_: Any) -> dict[str, Any]:
+        return self.__update(self.__get("plans", plan_id, "plan_id"), {"is_completed": True})
+
+    @_route("get_users")
+    def _get_users(self, project_id: int | None = None, *, params: dict[str, str], **_: Any) -> dict[str, Any]:
+        endpoint = "get_users" if project_id is None else f"get_users/{project_id}"
+        return self.__page("users", endpoint, self.__list("users", None, None), params)
+
+    @_route("get_user_by_email")
+    def _get_user_by_email(self, *, params: dict[str, str], **_: Any) -> dict[str, Any]:
+        for user in self.tables["users"].values():
+            if user["email"] == params.get("email"):
+                return user
+        raise _ApiError(400, "Field :email is not a valid email address.")
+
+    @_route("get_current_user")
+    def _get_current_user(self, _user_id: int | None = None, **__: Any) -> dict[str, Any]:
+        return self._get_user_by_email(params={"email": self.email})
+
+    # cases
+
+    @_route("get_cases")
+    def _get_cases(self, project_id: int, *, params: dict[str, str], **_: Any) -> dict[str, Any]:
+        return self.__page("cases", f"get_cases/{project_id}", self.__list("cases", "project_id", project_id), params)
+
+    @_route("add_case")
+    def _add_case(self, section_id: int, *, body: dict[str, Any], **_: Any) -> dict[str, Any]:
+        section = self.__get("sections", section_id, "section_id")
+        now = int(time.time())
+        fields = {
+            "section_id": section_id,
+            "suite_id": section["suite_id"],
+            "project_id": section["project_id"],
+            "type_id": 3,
+            "priority_id": 2,
+            "template_id": 1,
+            "created_on": now,
+            "updated_on": now,
+        }
+        return self.add("cases", **fields | body)
+
+    # runs and tests
+
+    @_route("add_run")
+    def _add_run(self, project_id: int, *, body: dict[str, Any], **_: Any) -> dict[str, Any]:
+        self.__get("projects", project_id, "project_id")
+        include_all = body.pop("include_all", True)
+        case_ids = body.pop("case_ids", None) or []
+        run = self.add("runs", project_id=project_id, is_completed=False, created_on=int(time.time()), **body)
+        cases = self.__list("cases", "project_id", project_id)
+        if body.get("suite_id") is not None:
+            cases = [case for case in cases if case["suite_id"] == body["suite_id"]]
+        for case in cases:
+            if include_all or case["id"] in case_ids:
+                self.add(
+                    "tests",
+                    case_id=case["id"],
+                    run_id=run["id"],
+                    status_id=UNTESTED,
+                    title=case.get("title"),
+                )
+        return run
+
+    @_route("close_run")
+    def _close_run(self, run_id: int, **_: Any) -> dict[str, Any]:
+        return self.__update(self.__get("runs", run_id, "run_id"), {"is_completed": True})
+
+    @_route("get_runs")
+    def _get_runs(self, project_id: int, *, params: dict[str, str], **_: Any) -> dict[str, Any]:
+        return self.__page("runs", f"get_runs/{project_id}", self.__list("runs", "project_id", project_id), params)
+
+    @_route("get_tests")
+    def _get_tests(self, run_id: int, *, params: dict[str, str], **_: Any) -> dict[str, Any]:
+        self.__get("runs", run_id, "run_id")
+        return self.__page("tests", f"get_tests/{run_id}", self.__list("tests", "run_id", run_id), params)
+
+    # results
+
+    def __test_for_case(self, run_id: int, case_id: int) -> dict[str, Any]:
+        self.__get("runs", run_id, "run_id")
+        test = self.__case_tests.get((run_id, case_id))
+        if test is None or self.tables["tests"].get(test["id"]) is not test:
+            # index the tests of the run, they may have been added directly to the table
+            self.__case_tests.pop((run_id, case_id), None)
+            for test in self.__list("tests", "run_id", run_id):
+                self.__case_tests[run_id, test["case_id"]] = test
+            test = self.__case_tests.get((run_id, case_id))
+        if test is not None:
+            return test
+        raise _ApiError(400, f"Field :case_id is not a valid test case of run {run_id}.")
+
+    def __add_result(self, test: dict[str, Any], fields: dict[str, Any]) -> dict[str, Any]:
+        fields = {key: value for key, value in fields.items() if key not in ("test_id", "case_id")}
+        result = self.add("results", test_id=test["id"], created_on=int(time.time()), **fields)
+        if fields.get("status_id") is not None:
+            test["status_id"] = fields["status_id"]
+        return result
+
+    @_route("add_result")
+    def _add_result(self, test_id: int, *, body: dict[str, Any], **_: Any) -> dict[str, Any]:
+        return self.__add_result(self.__get("tests", test_id, "test_id"), body)
+
+    @_route("add_result_for_case")
+    def _add_result_for_case(self, run_id: int, case_id: int, *, body: dict[str, Any], **_: Any) -> dict[str, Any]:
+        return self.__add_result(self.__test_for_case(run_id, case_id), body)
+
+    @_route("add_results")
+    def _add_results(self, run_id: int, *, body: dict[str, Any], **_: Any) -> list[dict[str, Any]]:
+        self.__get("runs", run_id, "run_id")
+        tests = [self.__get("tests", result["test_id"], "test_id") for result in body["results"]]
+        return [self.__add_result(test, result) for test, result in zip(tests, body["results"], strict=True)]
+
+    @_route("add_results_for_cases")
+    def _add_results_for_cases(self, run_id: int, *, body: dict[str, Any], **_: Any) -> list[dict[str, Any]]:
+        tests = [self.__test_for_case(run_id, result["case_id"]) for result in body["results"]]
+        return [self.__add_result(test, result) for test, result in zip(tests, body["results"], strict=True)]
+
+    def __results(self, test_ids: set[int]) -> list[dict[str, Any]]:
+        results = [result for result in self.tables["results"].values() if result["test_id"] in test_ids]
+        return sorted(results, key=lambda result: result["id"], reverse=True)
+
+    @_route("get_results")
+    def _get_results(self, test_id: int, *, params: dict[str, str], **_: Any) -> dict[str, Any]:
+        self.__get("tests", test_id, "test_id")
+        return self.__page("results", f"get_results/{test_id}", self.__results({test_id}), params)
+
+    @_route("get_results_for_case")
+    def _get_results_for_case(self, run_id: int, case_id: int, *, params: dict[str, str], **_: Any) -> dict[str, Any]:
+        test = self.__test_for_case(run_id, case_id)
+        endpoint = f"get_results_for_case/{run_id}/{case_id}"
+        return self.__page("results", endpoint, self.__results({test["id"]}), params)
+
+    @_route("get_results_for_run")
+    def _get_results_for_run(self, run_id: int, *, params: dict[str, str], **_: Any) -> dict[str, Any]:
+        self.__get("runs", run_id, "run_id")
+        test_ids = {test["id"] for test in self.__list("tests", "run_id", run_id)}
+        return self.__page("results", f"get_results_for_run/{run_id}", self.__results(test_ids), params)
+
+    # attachments
+
+    def __add_attachment(self, target: str, obj_id: int, *, body: dict[str, Any], **_: Any) -> dict[str, Any]:
+        if target != "result":
+            self.__get(_RESOURCES[target][0], obj_id, _ATTACHMENT_TARGETS[target])
+        if "attachment" not in body:
+            raise _ApiError(400, "Field :attachment is a required field.")
+        filename, content = body["attachment"]
+        attachment = self.add(
+            "attachments",
+            name=filename,
+            filename=filename,
+            size=len(content),
+            created_on=int(time.time()),
+            **{_ATTACHMENT_TARGETS[target]: obj_id},
+        )
+        self.__files[attachment["id"]] = content
+        return {"attachment_id": attachment["id"]}
+
+    def __attachments(self, target: str, obj_id: int, *, params: dict[str, str], **_: Any) -> dict[str, Any]:
+        field = _ATTACHMENT_TARGETS[target]
+        items = [item for item in self.tables["attachments"].values() if item.get(field) == obj_id]
+        return self.__page("attachments", f"get_attachments_for_{target}/{obj_id}", items, params)
+
+    @_route("get_attachment")
+    def _get_attachment(self, attachment_id: int, **_: Any) -> _Response:
+        self.__get("attachments", attachment_id, "attachment_id")
+        return _Response(200, self.__files[attachment_id], "application/octet-stream")
+
+    @_route("delete_attachment")
+    def _delete_attachment(self, attachment_id: int, **_: Any) -> None:
+        self.__get("attachments", attachment_id, "attachment_id")
+        del self.tables["attachments"][attachment_id]
+        del self.__files[attachment_id]
@@ -13,6 +13,7 @@ except ImportError:
     false_bool = False
 
 from testrail_api import TestRailAPI
+from testrail_api.testing import Emulator
 
 BASE_HOST = "https://example.testrail.com/index.php?/api/v2/"
 
@@ -100,3 +101,48 @@ def environ(auth_data: tuple[str, str, str]) -> Iterator[None]:
     del os.environ["TESTRAIL_URL"]
     del os.environ["TESTRAIL_EMAIL"]
     del os.environ["TESTRAIL_PASSWORD"]
+
+
+@pytest.fixture
+def cases() -> int:
+    """Give the number of cases of the emulated project, override or parametrize it for more."""
+    return 3
+
+
+@pytest.fixture
+def emulator(cases: int) -> Emulator:
+    """In-process TestRail: a project with a suite, a section and ``cases`` cases titled ``Case <number>``."""
+    emulator = Emulator()
+    project = emulator.add("projects", name="Project")
+    suite = emulator.add("suites", project_id=project["id"], name="Suite")
+    section = emulator.add("sections", project_id=project["id"], suite_id=suite["id"], name="Section")
+    for number in range(cases):
+        emulator.add(
+            "cases",
+            project_id=project["id"],
+            suite_id=suite["id"],
+            section_id=section["id"],
+            title=f"Case {number}",
+            type_id=3,
+        )
+    return emulator
+
+
+@pytest.fixture
+def served(emulator: Emulator) -> Iterator[str]:
+    """URL of the running emulator."""
+    with emulator.serve() as url:
+        yield url
+
+
+@pytest.fixture
+def emulated_api(emulator: Emulator, served: str) -> Iterator[TestRailAPI]:
+    """TestRailAPI object connected to the emulator."""
+    with TestRailAPI(served, emulator.email, emulator.password, warn_ignore=True) as api:
+        yield api
+
+
+@pytest.fixture
+def run(emulated_api: TestRailAPI) -> dict:
+    """Run of every case of the emulated project."""
+    return emulated_api.runs.add_run(1, suite_id=1)
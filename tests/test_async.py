@@ -0,0 +1,286 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from testrail_api import AsyncTestRailAPI, NotFoundError, RateLimitError, ResultStatus, RetryPolicy
+
+httpx = pytest.importorskip("httpx")
+
+
+class Router:
+    """Mock transport handler: endpoint -> callback(request) returning an httpx.Response."""
+
+    def __init__(self) -> None:
+        self.routes = {}
+        self.requests = []
+
+    def add(self, endpoint, callback) -> None:
+        self.routes[endpoint] = callback
+
+    def __call__(self, request):
+        self.requests.append(request)
+        endpoint = request.url.query.decode().split("&", 1)[0].replace("/api/v2/", "", 1)
+        return self.routes[endpoint](request)
+
+
+@pytest.fixture
+def router() -> Router:
+    return Router()
+
+
+@pytest.fixture
+def async_api(auth_data, router) -> AsyncTestRailAPI:
+    return AsyncTestRailAPI(*auth_data, client=httpx.AsyncClient(transport=httpx.MockTransport(router)))
+
+
+def test_get_case(async_api, router):
+    router.add("get_case/1", lambda _: httpx.Response(200, json={"id": 1}))
+
+    async def main() -> object:
+        async with async_api:
+            return await async_api.cases.get_case(1)
+
+    assert asyncio.run(main()) == {"id": 1}
+    request = router.requests[0]
+    assert request.headers["Authorization"].startswith("Basic ")
+    assert request.headers["User-Agent"].startswith("Python TestRail API v:")
+
+
+def test_get_params_conversion(async_api, router):
+    def callback(request) -> "httpx.Response":
+        assert request.url.params["status_id"] == "1,5"
+        assert request.url.params["is_completed"] == "1"
+        assert "milestone_id" not in request.url.params
+        return httpx.Response(200, json={"runs": []})
+
+    router.add("get_runs/1", callback)
+    asyncio.run(
+        async_api.get(
+            "get_runs/1",
+            params={
+                "status_id": [ResultStatus.PASSED, ResultStatus.FAILED],
+                "is_completed": True,
+                "milestone_id": None,
+            },
+        )
+    )
+
+
+def test_post_body_conversion(async_api, router):
+    def callback(request) -> "httpx.Response":
+        assert json.loads(request.content) == {"results": [{"test_id": 1, "status_id": 1}]}
+        return httpx.Response(200, json=[{"id": 1}])
+
+    router.add("add_results/1", callback)
+    resp = asyncio.run(async_api.results.add_results(1, [{"test_id": 1, "status_id": ResultStatus.PASSED}]))
+    assert resp == [{"id": 1}]
+
+
+def test_post_body_orjson(auth_data, router):
+    pytest.importorskip("orjson")
+
+    def callback(request) -> "httpx.Response":
+        assert request.content == b'{"results":[{"test_id":1,"status_id":1}]}'
+        return httpx.Response(200, json=[{"id": 1}])
+
+    router.add("add_results/1", callback)
+    api = AsyncTestRailAPI(
+        *auth_data,
+        json_backend="orjson",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(router)),
+    )
+    assert asyncio.run(api.results.add_results(1, [{"test_id": 1, "status_id": 1}])) == [{"id": 1}]
+
+
+def test_concurrent_requests(async_api, router):
+    router.add("get_case/1", lambda _: httpx.Response(200, json={"id": 1}))
+    router.add("get_case/2", lambda _: httpx.Response(200, json={"id": 2}))
+
+    async def main() -> object:
+        return await asyncio.gather(async_api.cases.get_case(1), async_api.cases.get_case(2))
+
+    assert asyncio.run(main()) == [{"id": 1}, {"id": 2}]
+
+
+def test_bulk(async_api, router):
+    def callback(request) -> "httpx.Response":
+        offset = int(request.url.params["offset"])
+        size = 250 if offset == 0 else 3
+        return httpx.Response(
+            200, json={"offset": offset, "size": size, "cases": [{"id": offset + i} for i in range(size)]}
+        )
+
+    router.add("get_cases/1", callback)
+    resp = asyncio.run(async_api.cases.get_cases_bulk(1, suite_id=2))
+    assert [case["id"] for case in resp] == list(range(253))
+    assert [r.url.params["offset"] for r in router.requests] == ["0", "250"]
+
+
+def test_bulk_concurrency(async_api, router):
+    def callback(request) -> "httpx.Response":
+        offset = int(request.url.params["offset"])
+        cases = [{"id": i} for i in range(offset, min(offset + 250, 1100))]
+        return httpx.Response(200, json={"offset": offset, "size": len(cases), "cases": cases})
+
+    router.add("get_cases/1", callback)
+    resp = asyncio.run(async_api.cases.get_cases_bulk(1, concurrency=3))
+    assert [case["id"] for case in resp] == list(range(1100))
+
+
+def test_add_results_for_cases_chunked(async_api, router):
+    failed = set()
+
+    def callback(request) -> "httpx.Response":
+        results = json.loads(request.content)["results"]
+        if results[0]["case_id"] not in failed:
+            failed.add(results[0]["case_id"])
+            return httpx.Response(502)
+        return httpx.Response(200, json=results)
+
+    router.add("add_results_for_cases/1", callback)
+    results = [{"case_id": case_id, "status_id": 1} for case_id in range(1, 11)]
+    policy = RetryPolicy(methods=("POST",), backoff=0)
+    resp = asyncio.run(
+        async_api.results.add_results_for_cases_chunked(1, results, chunk_size=3, concurrency=2, retry_policy=policy)
+    )
+    assert resp == results
+    assert len(router.requests) == 8
+
+
+def test_bulk_links_and_progress(async_api, router):
+    def callback(request) -> "httpx.Response":
+        offset = int(request.url.params["offset"])
+        limit = int(request.url.params["limit"])
+        tests = [{"id": i} for i in range(offset, min(offset + limit, 200))]
+        links = {"next": "next" if offset + limit < 200 else None}
+        return httpx.Response(200, json={"offset": offset, "size": len(tests), "_links": links, "tests": tests})
+
+    router.add("get_tests/1", callback)
+    pages = []
+    resp = asyncio.run(async_api.tests.get_tests_bulk(1, page_size=100, on_page=pages.append))
+    assert len(resp) == 200
+    assert [r.url.params["offset"] for r in router.requests] == ["0", "100"]
+    assert [page.total for page in pages] == [None, 200]
+
+
+def test_iter_cases(async_api, router):
+    def callback(request) -> "httpx.Response":
+        offset = int(request.url.params["offset"])
+        cases = [{"id": i} for i in range(offset, min(offset + 250, 300))]
+        return httpx.Response(200, json={"offset": offset, "size": len(cases), "cases": cases})
+
+    router.add("get_cases/1", callback)
+
+    async def main() -> list:
+        return [case["id"] async for case in async_api.cases.iter_cases(1)]
+
+    assert asyncio.run(main()) == list(range(300))
+
+
+def test_iter_cases_prefetch(async_api, router):
+    def callback(request) -> "httpx.Response":
+        offset = int(request.url.params["offset"])
+        cases = [{"id": i} for i in range(offset, min(offset + 250, 600))]
+        return httpx.Response(200, json={"offset": offset, "size": len(cases), "cases": cases})
+
+    router.add("get_cases/1", callback)
+
+    async def main() -> list:
+        items = async_api.cases.iter_cases(1, prefetch=True)
+        first = await anext(items)
+        await asyncio.sleep(0)  # let the prefetch task run while the first page is consumed
+        requested = [r.url.params["offset"] for r in router.requests]
+        return [first["id"], requested, len([case async for case in items])]
+
+    assert asyncio.run(main()) == [0, ["0", "250"], 599]
+
+
+def test_rate_limit_retry(async_api, router):
+    calls = []
+
+    def callback(_) -> "httpx.Response":
+        calls.append(1)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"retry-after": "0"})
+        return httpx.Response(200, json={"id": 1})
+
+    router.add("get_case/1", callback)
+    assert asyncio.run(async_api.cases.get_case(1)) == {"id": 1}
+    assert len(calls) == 2
+
+
+def test_rate_limit_exhausted(async_api, router):
+    router.add("get_case/1", lambda _: httpx.Response(429, headers={"retry-after": "0"}))
+    with pytest.raises(RateLimitError):
+        asyncio.run(async_api.cases.get_case(1))
+
+
+def test_transient_status_retry(auth_data, router):
+    calls = []
+
+    def callback(_) -> "httpx.Response":
+        calls.append(1)
+        if len(calls) == 1:
+            return httpx.Response(503, headers={"retry-after": "0"})
+        return httpx.Response(200, json={"id": 1})
+
+    router.add("get_case/1", callback)
+    api = AsyncTestRailAPI(
+        *auth_data,
+        retry_policy=RetryPolicy(),
+        client=httpx.AsyncClient(transport=httpx.MockTransport(router)),
+    )
+    assert asyncio.run(api.cases.get_case(1)) == {"id": 1}
+    assert len(calls) == 2
+
+
+def test_status_code_error(async_api, router):
+    router.add("get_case/1", lambda _: httpx.Response(404, content=b"not found"))
+    with pytest.raises(NotFoundError) as exc_info:
+        asyncio.run(async_api.cases.get_case(1))
+    assert exc_info.value.content == b"not found"
+    assert "get_case/1" in exc_info.value.url
+
+
+def test_retry_exceptions(auth_data, router):
+    calls = []
+
+    def callback(request) -> "httpx.Response":
+        calls.append(1)
+        if len(calls) < 3:
+            raise httpx.ConnectError("fail", request=request)
+        return httpx.Response(200, json={"id": 1})
+
+    router.add("get_case/1", callback)
+    api = AsyncTestRailAPI(
+        *auth_data,
+        retry_exceptions=(httpx.ConnectError,),
+        client=httpx.AsyncClient(transport=httpx.MockTransport(router)),
+    )
+    assert asyncio.run(api.cases.get_case(1)) == {"id": 1}
+
+
+def test_add_attachment(async_api, router, base_path):
+    def callback(request) -> "httpx.Response":
+        assert "multipart/form-data" in request.headers["Content-Type"]
+        return httpx.Response(200, json={"attachment_id": 433})
+
+    router.add("add_attachment_to_result/2", callback)
+    resp = asyncio.run(async_api.attachments.add_attachment_to_result(2, Path(base_path, "attach.jpg")))
+    assert resp == {"attachment_id": 433}
+
+
+def test_get_attachment(async_api, router, base_path, tmp_path):
+    content = Path(base_path, "attach.jpg").read_bytes()
+    router.add("get_attachment/1", lambda _: httpx.Response(200, content=content))
+    path = asyncio.run(async_api.attachments.get_attachment(1, tmp_path / "attach.jpg"))
+    assert path.read_bytes() == content
+
+
+def test_get_attachment_error(async_api, router, tmp_path):
+    router.add("get_attachment/1", lambda _: httpx.Response(404))
+    with pytest.raises(NotFoundError):
+        asyncio.run(async_api.attachments.get_attachment(1, tmp_path / "attach.jpg"))
+    assert not (tmp_path / "attach.jpg").exists()
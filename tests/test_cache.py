@@ -0,0 +1,130 @@
+import asyncio
+import json
+
+import pytest
+import responses
+
+from testrail_api import AsyncTestRailAPI, ResponseCache, _cache
+from testrail_api import TestRailAPI as TRApi
+
+
+class FakeTime:
+    """Replacement of the ``time`` module with a manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeTime:
+    fake = FakeTime()
+    monkeypatch.setattr(_cache, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def cached_api(auth_data) -> TRApi:
+    return TRApi(*auth_data, cache=ResponseCache())
+
+
+def test_metadata_cached(cached_api, mock, url):
+    mock.add_callback(responses.GET, url("get_statuses"), lambda _: (200, {}, json.dumps([{"id": 1}])))
+    assert cached_api.statuses.get_statuses() == [{"id": 1}]
+    assert cached_api.statuses.get_statuses() == [{"id": 1}]
+    assert len(mock.calls) == 1
+    assert cached_api.cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_cached_value_is_copied(cached_api, mock, url):
+    mock.add_callback(responses.GET, url("get_priorities"), lambda _: (200, {}, json.dumps([{"id": 1}])))
+    cached_api.priorities.get_priorities().append({"id": 2})
+    assert cached_api.priorities.get_priorities() == [{"id": 1}]
+
+
+def test_key_includes_object_id(cached_api, mock, url):
+    mock.add_callback(responses.GET, url("get_templates/1"), lambda _: (200, {}, json.dumps([{"id": 1}])))
+    mock.add_callback(responses.GET, url("get_templates/2"), lambda _: (200, {}, json.dumps([{"id": 2}])))
+    for _ in range(2):
+        assert cached_api.templates.get_templates(1) == [{"id": 1}]
+        assert cached_api.templates.get_templates(2) == [{"id": 2}]
+    assert len(mock.calls) == 2
+
+
+def test_other_endpoints_not_cached(cached_api, mock, url):
+    mock.add_callback(responses.GET, url("get_case/1"), lambda _: (200, {}, json.dumps({"id": 1})))
+    cached_api.cases.get_case(1)
+    cached_api.cases.get_case(1)
+    assert len(mock.calls) == 2
+    assert len(cached_api.cache) == 0
+
+
+def test_errors_not_cached(auth_data, mock, url):
+    mock.add_callback(responses.GET, url("get_case_types"), lambda _: (500, {}, ""))
+    api = TRApi(*auth_data, cache=ResponseCache(), raise_on_error=False)
+    api.case_types.get_case_types()
+    api.case_types.get_case_types()
+    assert len(mock.calls) == 2
+
+
+def test_ttl_expiry(clock, auth_data, mock, url):
+    mock.add_callback(responses.GET, url("get_case_fields"), lambda _: (200, {}, json.dumps([])))
+    api = TRApi(*auth_data, cache=ResponseCache(ttls={"get_case_fields": 60}))
+    api.case_fields.get_case_fields()
+    clock.now += 59
+    api.case_fields.get_case_fields()
+    assert len(mock.calls) == 1
+    clock.now += 1
+    api.case_fields.get_case_fields()
+    assert len(mock.calls) == 2
+
+
+def test_lru_eviction():
+    cache = ResponseCache(ttls={"get_templates": 60}, maxsize=2)
+    for project_id in (1, 2):
+        cache.put(project_id, f"get_templates/{project_id}", project_id)
+    cache.get(1)
+    cache.put(3, "get_templates/3", 3)
+    assert cache.get(1) == (True, 1)
+    assert cache.get(2) == (False, None)
+    assert cache.get(3) == (True, 3)
+
+
+def test_invalidate(cached_api, mock, url):
+    mock.add_callback(responses.GET, url("get_statuses"), lambda _: (200, {}, json.dumps([])))
+    mock.add_callback(responses.GET, url("get_result_fields"), lambda _: (200, {}, json.dumps([])))
+    cached_api.statuses.get_statuses()
+    cached_api.result_fields.get_result_fields()
+    cached_api.cache.invalidate("get_statuses")
+    assert len(cached_api.cache) == 1
+    cached_api.statuses.get_statuses()
+    cached_api.result_fields.get_result_fields()
+    assert len(mock.calls) == 3
+    cached_api.cache.invalidate()
+    assert len(cached_api.cache) == 0
+
+
+def test_invalid_maxsize():
+    with pytest.raises(ValueError):  # noqa: PT011
+        ResponseCache(maxsize=0)
+
+
+def test_async_cache(auth_data):
+    httpx = pytest.importorskip("httpx")
+    calls = []
+
+    def handler(request) -> "httpx.Response":
+        calls.append(request)
+        return httpx.Response(200, json=[{"id": 1}])
+
+    cache = ResponseCache()
+    api = AsyncTestRailAPI(*auth_data, cache=cache, client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    async def main() -> list:
+        return [await api.statuses.get_statuses() for _ in range(3)]
+
+    assert asyncio.run(main()) == [[{"id": 1}]] * 3
+    assert len(calls) == 1
+    assert cache.hits == 2
@@ -0,0 +1,105 @@
+import json
+from pathlib import Path
+
+import pytest
+import responses
+
+from testrail_api import ReplayTransport, StatusCodeError, _cassette
+from testrail_api import TestRailAPI as TRApi
+from testrail_api._exception import TestRailError as TRError
+
+
+@pytest.fixture
+def cassette(tmp_path) -> Path:
+    return tmp_path / "testrail.jsonl"
+
+
+@pytest.fixture
+def recorded(auth_data, mock, url, base_path, cassette) -> Path:
+    """Record a GET with parameters, a POST, an error, an attachment upload and download."""
+    mock.add_callback(responses.GET, url("get_case/1"), lambda _: (200, {"Set-Cookie": "tr_session=1"}, '{"id": 1}'))
+    mock.add_callback(responses.POST, url("add_result/1"), lambda r: (200, {}, r.body))
+    mock.add_callback(responses.GET, url("get_run/404"), lambda _: (404, {}, '{"error": "not found"}'))
+    mock.add_callback(responses.POST, url("add_attachment_to_run/1"), lambda _: (200, {}, '{"attachment_id": 5}'))
+    image = Path(base_path, "attach.jpg").read_bytes()
+    mock.add_callback(responses.GET, url("get_attachment/5"), lambda _: (200, {}, image))
+    with TRApi(*auth_data, record=cassette) as api:
+        api.cases.get_case(1)
+        api.results.add_result(1, status_id=1)
+        with pytest.raises(StatusCodeError):
+            api.runs.get_run(404)
+        api.attachments.add_attachment_to_run(1, Path(base_path, "attach.jpg"))
+        api.attachments.get_attachment(5, cassette.parent / "attach.jpg")
+    return cassette
+
+
+def test_record(recorded):
+    interactions = [json.loads(line) for line in recorded.read_text().splitlines()]
+    assert [(i["method"], i["url"].split("?")[1], i["status"]) for i in interactions] == [
+        ("GET", "/api/v2/get_case/1", 200),
+        ("POST", "/api/v2/add_result/1", 200),
+        ("GET", "/api/v2/get_run/404", 404),
+        ("POST", "/api/v2/add_attachment_to_run/1", 200),
+        ("GET", "/api/v2/get_attachment/5", 200),
+    ]
+    assert interactions[0]["request"]["headers"]["Authorization"] == "***"
+    assert interactions[0]["headers"]["Set-Cookie"] == "***"
+    assert interactions[1]["request"]["body"] == {"text": '{"status_id": 1}'}
+    assert interactions[3]["request"]["files"] == {"attachment": "attach.jpg"}
+    assert "base64" in interactions[4]["body"]
+    assert all(i["latency"] >= 0 for i in interactions)
+
+
+def test_record_streamed_download(recorded, base_path):
+    assert (recorded.parent / "attach.jpg").read_bytes() == Path(base_path, "attach.jpg").read_bytes()
+
+
+def test_replay(recorded, auth_data, base_path, tmp_path):
+    with TRApi(*auth_data, transport=ReplayTransport(recorded)) as api:
+        for _ in range(3):
+            assert api.cases.get_case(1) == {"id": 1}
+        assert api.results.add_result(1, status_id=1) == {"status_id": 1}
+        with pytest.raises(StatusCodeError) as exc_info:
+            api.runs.get_run(404)
+        assert exc_info.value.status_code == 404
+        assert api.attachments.add_attachment_to_run(1, Path(base_path, "attach.jpg")) == {"attachment_id": 5}
+        path = api.attachments.get_attachment(5, tmp_path / "replayed.jpg")
+        assert path.read_bytes() == Path(base_path, "attach.jpg").read_bytes()
+
+
+def test_replay_matches_params(cassette, auth_data):
+    lines = [
+        {
+            "method": "GET",
+            "url": f"{auth_data[0]}index.php?/api/v2/get_cases/1&suite_id=3",
+            "body": {"text": '{"cases": [], "size": 0}'},
+        },
+        {
+            "method": "GET",
+            "url": "https://other.host/index.php?/api/v2/get_cases/2&section_id=4&suite_id=3",
+            "body": {"text": '{"cases": [{"id": 2}], "size": 1}'},
+        },
+    ]
+    cassette.write_text(
+        "".join(
+            json.dumps({"latency": 0, "status": 200, "reason": "OK", "headers": {}, **line}) + "\n" for line in lines
+        )
+    )
+    api = TRApi(*auth_data, transport=ReplayTransport(cassette))
+    assert api.cases.get_cases(2, suite_id=3, section_id=4) == {"cases": [{"id": 2}], "size": 1}
+    with pytest.raises(TRError, match="No recorded response for GET /api/v2/get_cases/1"):
+        api.cases.get_cases(1, suite_id=4)
+
+
+@pytest.mark.parametrize(
+    ("latency", "expected"), (("recorded", [0.25]), (0.5, [0.5]), (lambda: 0.1, [0.1]), (None, []))
+)
+def test_replay_latency(recorded, auth_data, monkeypatch, latency, expected):
+    sleeps = []
+    monkeypatch.setattr(_cassette.time, "sleep", sleeps.append)
+    lines = [json.loads(line) for line in recorded.read_text().splitlines()]
+    lines[0]["latency"] = 0.25
+    recorded.write_text(json.dumps(lines[0]) + "\n")
+    api = TRApi(*auth_data, transport=ReplayTransport(recorded, latency=latency))
+    api.cases.get_case(1)
+    assert sleeps == expected
@@ -0,0 +1,164 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+import responses
+
+from testrail_api import AsyncTestRailAPI, NotFoundError
+from testrail_api import TestRailAPI as TRApi
+from testrail_api._coalesce import Singleflight
+
+
+def slow_callback(calls, status=200, body=None) -> object:
+    release = threading.Event()
+
+    def callback(request) -> tuple:
+        calls.append(request)
+        release.wait(1)
+        return status, {}, json.dumps({"id": 1} if body is None else body)
+
+    return callback, release
+
+
+def run_concurrently(func, count: int, calls: list, release: threading.Event) -> list:
+    with ThreadPoolExecutor(count) as pool:
+        futures = [pool.submit(func) for _ in range(count)]
+        while not calls:
+            time.sleep(0.001)
+        time.sleep(0.05)  # let the followers join the leader
+        release.set()
+        return [future.exception() or future.result() for future in futures]
+
+
+def test_identical_gets_coalesced(auth_data, mock, url):
+    calls = []
+    callback, release = slow_callback(calls)
+    mock.add_callback(responses.GET, url("get_run/1"), callback)
+    api = TRApi(*auth_data, coalesce=True)
+    results = run_concurrently(lambda: api.runs.get_run(1), 5, calls, release)
+    assert results == [{"id": 1}] * 5
+    assert len(calls) == 1
+    # followers get their own copies
+    assert len({id(result) for result in results}) == 5
+
+
+def test_different_params_not_coalesced(auth_data, mock, url):
+    mock.add_callback(responses.GET, url("get_tests/1"), lambda _: (200, {}, "[]"))
+    api = TRApi(*auth_data, coalesce=True)
+    with ThreadPoolExecutor(2) as pool:
+        list(pool.map(lambda status: api.tests.get_tests(1, status_id=status), (1, 5)))
+    assert len(mock.calls) == 2
+
+
+def test_sequential_gets_not_coalesced(auth_data, mock, url):
+    mock.add_callback(responses.GET, url("get_case/1"), lambda _: (200, {}, "{}"))
+    api = TRApi(*auth_data, coalesce=True)
+    api.cases.get_case(1)
+    api.cases.get_case(1)
+    assert len(mock.calls) == 2
+
+
+def test_posts_not_coalesced(auth_data, mock, url):
+    calls = []
+    callback, release = slow_callback(calls)
+    mock.add_callback(responses.POST, url("add_result/1"), callback)
+    api = TRApi(*auth_data, coalesce=True)
+    release.set()
+    with ThreadPoolExecutor(3) as pool:
+        list(pool.map(lambda _: api.results.add_result(1, status_id=1), range(3)))
+    assert len(calls) == 3
+
+
+def test_error_shared(auth_data, mock, url):
+    calls = []
+    callback, release = slow_callback(calls, status=404, body={"error": "not found"})
+    mock.add_callback(responses.GET, url("get_run/1"), callback)
+    api = TRApi(*auth_data, coalesce=True)
+    results = run_concurrently(lambda: api.runs.get_run(1), 3, calls, release)
+    assert all(isinstance(result, NotFoundError) for result in results)
+    assert len(calls) == 1
+
+
+def test_singleflight_releases_key():
+    flight = Singleflight()
+    with pytest.raises(ValueError):  # noqa: PT011
+        flight.do("key", lambda: int("x"))
+    assert flight.do("key", lambda: 1) == 1
+
+
+def test_leader_changes_not_shared():
+    flight = Singleflight()
+    calls = []
+    followers = []
+
+    def func() -> dict:
+        calls.append(1)
+        follower = threading.Thread(target=lambda: followers.append(flight.do("key", func)))
+        follower.start()
+        time.sleep(0.05)  # let the follower join the leader
+        return {"id": 1}
+
+    result = flight.do("key", func)
+    result.clear()
+    while not followers:
+        time.sleep(0.001)
+    assert followers == [{"id": 1}]
+    assert len(calls) == 1
+
+
+def test_async_leader_changes_not_shared():
+    flight = Singleflight()
+    calls = []
+
+    async def func() -> dict:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"id": 1}
+
+    async def leader() -> dict:
+        result = await flight.do_async("key", func)
+        result.clear()
+        return result
+
+    async def main() -> list:
+        return await asyncio.gather(leader(), flight.do_async("key", func), flight.do_async("key", func))
+
+    results = asyncio.run(main())
+    assert results == [{}, {"id": 1}, {"id": 1}]
+    assert results[1] is not results[2]
+    assert len(calls) == 1
+
+
+def test_alone_not_copied():
+    flight = Singleflight()
+    result = {"id": 1}
+
+    async def func() -> dict:
+        return result
+
+    with patch("copy.deepcopy") as deepcopy:
+        assert flight.do("key", lambda: result) is result
+        assert asyncio.run(flight.do_async("key", func)) is result
+    deepcopy.assert_not_called()
+
+
+def test_async_coalesced(auth_data):
+    httpx = pytest.importorskip("httpx")
+    calls = []
+
+    async def handler(request) -> "httpx.Response":
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"id": 1})
+
+    api = AsyncTestRailAPI(*auth_data, coalesce=True, client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    async def main() -> list:
+        return await asyncio.gather(*(api.cases.get_case(1) for _ in range(4)), api.cases.get_case(2))
+
+    assert asyncio.run(main()) == [{"id": 1}] * 5
+    assert len(calls) == 2
@@ -0,0 +1,111 @@
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+from multiprocessing.connection import Client
+
+import pytest
+
+from testrail_api import RemoteReporter, ResultsCollector, ResultStatus
+from testrail_api._exception import TestRailError as TRError
+
+CASES = 60
+WORKER = """
+import sys
+from testrail_api import RemoteReporter
+with RemoteReporter(int(sys.argv[1])) as reporter:
+    for case_id in range(int(sys.argv[2]), int(sys.argv[3])):
+        reporter.add(case_id, 1, comment=f"worker {sys.argv[2]}")
+"""
+
+
+@pytest.fixture
+def cases() -> int:
+    return CASES
+
+
+def test_workers(emulated_api, emulator, run):
+    emulator.requests.clear()
+    with ResultsCollector(emulated_api, batch_size=CASES, flush_interval=60) as collector:
+        workers = [
+            subprocess.Popen(  # noqa: S603
+                [sys.executable, "-c", WORKER, str(run["id"]), str(first), str(first + 20)],
+                env=collector.environ | {"PYTHONPATH": os.pathsep.join(sys.path)},
+            )
+            for first in range(1, CASES, 20)
+        ]
+        assert [worker.wait(timeout=30) for worker in workers] == [0, 0, 0]
+    assert collector.sent == CASES
+    assert collector.failed == []
+    assert emulator.requests == {"add_results_for_cases/{id}": 1}
+    comments = [result["comment"] for result in emulator.tables["results"].values()]
+    assert sorted(comments) == sorted(f"worker {first}" for first in range(1, CASES, 20) for _ in range(20))
+
+
+def test_tcp_and_flush(emulated_api, run, monkeypatch):
+    with ResultsCollector(emulated_api, ("127.0.0.1", 0), flush_interval=60) as collector:
+        for name, value in collector.environ.items():
+            monkeypatch.setenv(name, value)
+        assert collector.environ["TESTRAIL_COLLECTOR"] == f"127.0.0.1:{collector.address[1]}"
+        with RemoteReporter(run["id"]) as reporter:
+            reporter.add(1, ResultStatus.PASSED)
+            reporter.add(2, ResultStatus.FAILED, comment="failed")
+            assert reporter.flush(timeout=5)
+            assert collector.sent == 2
+    results = emulated_api.results.get_results_for_run(run["id"])["results"]
+    assert sorted(result["status_id"] for result in results) == [1, 5]
+
+
+def test_malformed_messages(emulated_api, run):
+    with ResultsCollector(emulated_api, flush_interval=60) as collector:
+        with Client(collector.address, authkey=collector.authkey) as connection:
+            connection.send_bytes(b"not a pickle")
+            connection.send(("unknown",))
+            connection.send(("result", run["id"]))
+            connection.send(("result", run["id"], {"case_id": 1, "status_id": ResultStatus.PASSED}))
+            connection.send(("flush", run["id"], 5))
+            assert connection.recv() is True
+        assert collector.sent == 1
+
+
+def test_close_drops_connected_workers(emulated_api, run):
+    collector = ResultsCollector(emulated_api, flush_interval=60)
+    with Client(collector.address, authkey=collector.authkey) as connection:
+        connection.send(("result", run["id"], {"case_id": 1, "status_id": ResultStatus.PASSED}))
+        started = time.monotonic()
+        collector.close(timeout=0.2)
+        assert time.monotonic() - started < 5
+    assert collector.sent == 1
+
+
+def test_worker_connected_while_closing(emulated_api, run):
+    collector = ResultsCollector(emulated_api, ("127.0.0.1", 0), flush_interval=60)
+    # holds the acceptor in the handshake, so the worker is accepted once the collector is closing
+    stalled = socket.create_connection(collector.address)
+
+    def worker() -> None:
+        with Client(collector.address, authkey=collector.authkey) as connection:
+            connection.send(("result", run["id"], {"case_id": 1, "status_id": ResultStatus.PASSED}))
+
+    threads = [threading.Thread(target=worker), threading.Thread(target=collector.close)]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.2)
+    stalled.close()
+    for thread in threads:
+        thread.join(10)
+    assert collector.sent == 1
+
+
+def test_wrong_authkey(emulated_api, run):
+    with ResultsCollector(emulated_api) as collector, pytest.raises(multiprocessing.AuthenticationError):
+        RemoteReporter(run["id"], collector.address, authkey=b"wrong")
+
+
+def test_no_collector(monkeypatch):
+    monkeypatch.delenv("TESTRAIL_COLLECTOR", raising=False)
+    with pytest.raises(TRError, match="No collector address"):
+        RemoteReporter(1)
@@ -0,0 +1,115 @@
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from enum import IntEnum
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import responses
+
+from testrail_api import ResultStatus, register_converter
+from testrail_api import _convert as convert
+
+
+class Version:
+    """A custom type sent as a string."""
+
+    def __init__(self, value: str) -> None:
+        self.value = value
+
+    def __str__(self) -> str:
+        """Return the version."""
+        return self.value
+
+
+class Priority(IntEnum):
+    """An int enum."""
+
+    LOW = 1
+    HIGH = 4
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(convert, "_CONVERTERS", dict(convert._CONVERTERS))  # noqa: SLF001
+    monkeypatch.setattr(convert, "_DISPATCH", {})
+
+
+def test_plain_body_is_not_copied():
+    body = {"results": [{"case_id": 1, "status_id": 1, "comment": "ok", "elapsed": None, "defects": 1.5}]}
+    assert convert.convert_json(body) is body
+
+
+def test_body_copied_on_converted_path_only():
+    when = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    plain = {"case_id": 2, "status_id": 1}
+    body = {"results": [{"case_id": 1, "status_id": ResultStatus.FAILED, "on": when}, plain], "refs": ("A", "B")}
+    converted = convert.convert_json(body)
+    assert converted == {
+        "results": [{"case_id": 1, "status_id": 5, "on": round(when.timestamp())}, plain],
+        "refs": ("A", "B"),
+    }
+    assert converted["results"][1] is plain
+    assert body["results"][0]["status_id"] is ResultStatus.FAILED
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    (
+        (timedelta(hours=1, minutes=30, seconds=5), "1h 30m 5s"),
+        (timedelta(minutes=2), "2m"),
+        (timedelta(days=1, seconds=0.6), "24h 1s"),
+        (timedelta(0), "0s"),
+        (Path("logs", "run.txt"), str(Path("logs", "run.txt"))),
+        (Decimal("1.25"), 1.25),
+        (Priority.HIGH, 4),
+        (True, True),
+    ),
+)
+def test_builtin_converters(value, expected):
+    assert convert.convert_json({"value": value}) == {"value": expected}
+
+
+def test_params_conversion():
+    when = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    params = {
+        "is_completed": False,
+        "priority_id": [Priority.LOW, Priority.HIGH],
+        "status_id": {ResultStatus.RETEST, ResultStatus.PASSED},
+        "created_after": when,
+        "flags": (True, False),
+        "milestone_id": None,
+    }
+    assert convert.convert_params(params) == {
+        "is_completed": 0,
+        "priority_id": "1,4",
+        "status_id": "1,4",
+        "created_after": round(when.timestamp()),
+        "flags": "1,0",
+        "milestone_id": None,
+    }
+
+
+@pytest.mark.usefixtures("registry")
+def test_register_converter(api, mock, url):
+    register_converter(Version, str)
+
+    def callback(request) -> tuple[int, dict, str]:
+        if request.method == "GET":
+            assert parse_qs(urlparse(request.url).query)["version"] == ["1.2.0,1.3.0"]
+            return 200, {}, json.dumps({"offset": 0, "size": 0, "results": []})
+        assert json.loads(request.body) == {"status_id": 1, "version": "1.2.0"}
+        return 200, {}, json.dumps({})
+
+    mock.add_callback(responses.POST, url("add_result/1"), callback)
+    mock.add_callback(responses.GET, url("get_results/1"), callback)
+    api.results.add_result(1, status_id=1, version=Version("1.2.0"))
+    api.get("get_results/1", params={"version": [Version("1.2.0"), Version("1.3.0")]})
+
+
+@pytest.mark.usefixtures("registry")
+def test_register_converter_overrides_base():
+    assert convert.convert_json(Priority.HIGH) == 4
+    register_converter(Priority, lambda member: member.name.lower())
+    assert convert.convert_json([Priority.HIGH, ResultStatus.PASSED]) == ["high", 1]
@@ -0,0 +1,142 @@
+import asyncio
+import io
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from testrail_api import AsyncTestRailAPI, AuthError, RetryPolicy, ServerError, StatusCodeError
+from testrail_api import TestRailAPI as TRApi
+from testrail_api.testing import Emulator, Fault
+
+
+@pytest.fixture
+def cases() -> int:
+    return 600
+
+
+@pytest.fixture
+def project(emulator) -> dict:
+    return emulator.tables["projects"][1]
+
+
+def test_pagination(emulated_api, emulator, project):
+    page = emulated_api.cases.get_cases(project["id"], limit=250, offset=500)
+    assert page["size"] == 100
+    assert page["_links"] == {"next": None, "prev": f"/api/v2/get_cases/{project['id']}&limit=250&offset=250"}
+    emulator.requests.clear()
+    cases = emulated_api.cases.get_cases_bulk(project["id"])
+    assert [case["title"] for case in cases] == [f"Case {number}" for number in range(600)]
+    assert emulator.requests == {"get_cases/{id}": 3}
+    assert emulated_api.cases.get_cases_bulk(project["id"], concurrency=3) == cases
+
+
+def test_filters(emulated_api, project):
+    emulated_api.cases.add_case(1, "Other", type_id=1)
+    cases = emulated_api.cases.get_cases(project["id"], type_id=[1, 2])
+    assert [case["title"] for case in cases["cases"]] == ["Other"]
+    cases = emulated_api.cases.get_cases(project["id"], filter="case 59")
+    assert [case["title"] for case in cases["cases"]] == ["Case 59"] + [f"Case {number}" for number in range(590, 600)]
+
+
+def test_run_and_results(emulated_api, project):
+    run = emulated_api.runs.add_run(project["id"], suite_id=1, include_all=False, case_ids=[1, 2, 3])
+    tests = emulated_api.tests.get_tests(run["id"])["tests"]
+    assert [test["case_id"] for test in tests] == [1, 2, 3]
+    results = emulated_api.results.add_results_for_cases(
+        run["id"], [{"case_id": 1, "status_id": 1}, {"case_id": 2, "status_id": 5}]
+    )
+    assert [result["test_id"] for result in results] == [tests[0]["id"], tests[1]["id"]]
+    emulated_api.results.add_result(tests[2]["id"], status_id=2, comment="blocked")
+    assert [result["status_id"] for result in emulated_api.results.get_results_for_run_bulk(run["id"])] == [2, 5, 1]
+    assert [test["status_id"] for test in emulated_api.tests.get_tests_bulk(run["id"])] == [1, 5, 2]
+    assert emulated_api.runs.close_run(run["id"])["is_completed"] is True
+
+
+def test_crud(emulated_api):
+    project = emulated_api.projects.add_project("New")
+    milestone = emulated_api.milestones.add_milestone(project["id"], "1.0")
+    assert emulated_api.milestones.update_milestone(milestone["id"], is_completed=True)["is_completed"] is True
+    emulated_api.milestones.delete_milestone(milestone["id"])
+    with pytest.raises(StatusCodeError) as exc_info:
+        emulated_api.milestones.get_milestone(milestone["id"])
+    assert exc_info.value.status_code == 400
+    assert emulated_api.users.get_user_by_email("example@mail.com")["id"] == 1
+    assert emulated_api.statuses.get_statuses()[0]["name"] == "passed"
+
+
+def test_attachments(emulated_api, project, base_path, tmp_path):
+    run = emulated_api.runs.add_run(project["id"], suite_id=1)
+    attachment = emulated_api.attachments.add_attachment_to_run(run["id"], Path(base_path, "attach.jpg"))
+    assert emulated_api.attachments.get_attachments_for_run_bulk(run["id"])[0]["filename"] == "attach.jpg"
+    path = emulated_api.attachments.get_attachment(attachment["attachment_id"], tmp_path / "attach.jpg")
+    assert path.read_bytes() == Path(base_path, "attach.jpg").read_bytes()
+
+
+def test_auth(emulator, served):
+    api = TRApi(served, emulator.email, "wrong", warn_ignore=True)
+    with pytest.raises(AuthError):
+        api.projects.get_projects()
+
+
+def test_unknown_endpoint(emulated_api):
+    with pytest.raises(StatusCodeError, match="Unknown method"):
+        emulated_api.reports.get_reports(1)
+
+
+def test_faults():
+    emulator = Emulator(faults=[Fault(429, retry_after=0, times=1), Fault(503, endpoints=("get_priorities",), times=1)])
+    with emulator.serve() as url:
+        api = TRApi(url, emulator.email, emulator.password, warn_ignore=True)
+        assert api.statuses.get_statuses()
+        assert emulator.requests == {"get_statuses": 2}
+        with pytest.raises(ServerError):
+            api.priorities.get_priorities()
+        api = TRApi(
+            url, emulator.email, emulator.password, warn_ignore=True, retry_policy=RetryPolicy(jitter=False, backoff=0)
+        )
+        assert api.priorities.get_priorities()
+
+
+def test_concurrent_requests_counted():
+    emulator = Emulator()
+    environ = {"QUERY_STRING": "/api/v2/get_statuses", "REQUEST_METHOD": "GET", "wsgi.input": io.BytesIO()}
+
+    def serve(_: int) -> None:
+        for _ in range(500):
+            emulator(environ, lambda *_: None)
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(serve, range(8)))
+    assert emulator.requests == {"get_statuses": 4000}
+    assert emulator.in_flight == 0
+
+
+def test_max_rps():
+    emulator = Emulator(max_rps=2)
+    with emulator.serve() as url:
+        api = TRApi(url, emulator.email, emulator.password, warn_ignore=True, rate_limit=False, exc_iterations=1)
+        api.statuses.get_statuses()
+        api.statuses.get_statuses()
+        with pytest.raises(StatusCodeError) as exc_info:
+            api.statuses.get_statuses()
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.response.headers["Retry-After"] == "1"
+
+
+def test_latency_async():
+    emulator = Emulator(latency=0.2)
+    emulator.add("projects", name="Project")
+
+    async def main() -> list:
+        async with AsyncTestRailAPI(url, emulator.email, emulator.password, warn_ignore=True) as api:
+            return await asyncio.gather(*(api.projects.get_project(1) for _ in range(10)))
+
+    with emulator.serve() as url:
+        started = time.perf_counter()
+        projects = asyncio.run(main())
+        elapsed = time.perf_counter() - started
+    assert [project["name"] for project in projects] == ["Project"] * 10
+    assert emulator.max_in_flight == 10
+    assert elapsed < 1
@@ -0,0 +1,138 @@
+import asyncio
+import json
+import socket
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from testrail_api import AsyncTestRailAPI, HttpxTransport
+from testrail_api import TestRailAPI as TRApi
+from testrail_api._exception import TestRailError as TRError
+
+httpx = pytest.importorskip("httpx")
+h2_config = pytest.importorskip("h2.config")
+h2_connection = pytest.importorskip("h2.connection")
+h2_events = pytest.importorskip("h2.events")
+
+REQUESTS = 8
+
+
+class H2Server:
+    """
+    HTTP/2 stand-in (cleartext, prior knowledge) answering every request with a JSON echo after ``delay``.
+
+    Counts the accepted connections and the most streams open at once.
+    """
+
+    def __init__(self, delay: float = 0.2) -> None:
+        self.delay = delay
+        self.sock = socket.create_server(("127.0.0.1", 0))
+        self.url = f"http://127.0.0.1:{self.sock.getsockname()[1]}"
+        self.connections = 0
+        self.open_streams = 0
+        self.max_streams = 0
+        self.lock = threading.Lock()
+
+    def serve(self) -> None:
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            with self.lock:
+                self.connections += 1
+            threading.Thread(target=self.handle, args=(conn,), daemon=True).start()
+
+    def handle(self, conn: socket.socket) -> None:
+        h2 = h2_connection.H2Connection(config=h2_config.H2Configuration(client_side=False))
+        lock = threading.Lock()
+        headers: dict[int, dict[str, str]] = {}
+
+        def respond(stream_id: int) -> None:
+            request = headers.pop(stream_id)
+            body = json.dumps({"path": request[":path"], "stream_id": stream_id}).encode()
+            with lock:
+                h2.send_headers(
+                    stream_id,
+                    [(":status", "200"), ("content-type", "application/json"), ("content-length", str(len(body)))],
+                )
+                h2.send_data(stream_id, body, end_stream=True)
+                conn.sendall(h2.data_to_send())
+            with self.lock:
+                self.open_streams -= 1
+
+        with conn:
+            with lock:
+                h2.initiate_connection()
+                conn.sendall(h2.data_to_send())
+            while True:
+                try:
+                    data = conn.recv(65535)
+                except OSError:
+                    return
+                if not data:
+                    return
+                with lock:
+                    for event in h2.receive_data(data):
+                        if isinstance(event, h2_events.RequestReceived):
+                            headers[event.stream_id] = {
+                                key.decode() if isinstance(key, bytes) else key: value.decode()
+                                if isinstance(value, bytes)
+                                else value
+                                for key, value in event.headers
+                            }
+                        elif isinstance(event, h2_events.DataReceived):
+                            h2.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                        elif isinstance(event, h2_events.StreamEnded):
+                            with self.lock:
+                                self.open_streams += 1
+                                self.max_streams = max(self.max_streams, self.open_streams)
+                            threading.Timer(self.delay, respond, (event.stream_id,)).start()
+                    conn.sendall(h2.data_to_send())
+
+
+@pytest.fixture
+def h2_server() -> Iterator[H2Server]:
+    server = H2Server()
+    threading.Thread(target=server.serve, daemon=True).start()
+    yield server
+    server.sock.close()
+
+
+def test_sync_multiplexed(h2_server):
+    transport = HttpxTransport(client=httpx.Client(http1=False, http2=True))
+    with (
+        TRApi(h2_server.url, "example@mail.com", "password", warn_ignore=True, transport=transport) as api,
+        ThreadPoolExecutor(REQUESTS) as pool,
+    ):
+        results = list(pool.map(api.cases.get_case, range(REQUESTS)))
+    assert [result["path"] for result in results] == [
+        f"/index.php?/api/v2/get_case/{case_id}" for case_id in range(REQUESTS)
+    ]
+    assert h2_server.connections == 1
+    assert h2_server.max_streams == REQUESTS
+
+
+def test_async_multiplexed(h2_server):
+    async def main() -> list[dict]:
+        client = httpx.AsyncClient(http1=False, http2=True)
+        async with AsyncTestRailAPI(
+            h2_server.url, "example@mail.com", "password", warn_ignore=True, client=client
+        ) as api:
+            return await asyncio.gather(*(api.cases.get_case(case_id) for case_id in range(REQUESTS)))
+
+    results = asyncio.run(main())
+    assert len({result["stream_id"] for result in results}) == REQUESTS
+    assert h2_server.connections == 1
+    assert h2_server.max_streams == REQUESTS
+
+
+@pytest.mark.parametrize(
+    "factory", (HttpxTransport, lambda: AsyncTestRailAPI("https://example.com", "a", "b", http2=True))
+)
+def test_h2_not_installed(monkeypatch, factory):
+    monkeypatch.setattr("importlib.util.find_spec", lambda *_: None)
+    with pytest.raises(TRError, match=r"pip install testrail-api\[http2\]"):
+        factory()
@@ -0,0 +1,61 @@
+import subprocess
+import sys
+
+import pytest
+
+import testrail_api
+
+IMPORT_BUDGET_US = 100_000
+IMPORT_RUNS = 5
+
+
+def run(code: str, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, *args, "-c", code], check=True, capture_output=True, text=True)  # noqa: S603
+
+
+def test_import_is_lazy():
+    code = "import sys, testrail_api; print(sorted(sys.modules))"
+    modules = run(code).stdout
+    for module in ("requests", "httpx", "asyncio", "testrail_api._session", "testrail_api._category"):
+        assert f"'{module}'" not in modules
+
+
+def test_client_import_is_lazy():
+    code = "import sys; from testrail_api import TestRailAPI; print(sorted(sys.modules))"
+    modules = run(code).stdout
+    for module in ("requests", "urllib3", "httpx", "asyncio", "testrail_api._transport"):
+        assert f"'{module}'" not in modules
+
+
+def test_categories_are_lazy():
+    code = (
+        "import sys; from testrail_api import TestRailAPI\n"
+        "api = TestRailAPI('https://example.testrail.com', 'example@mail.com', 'password')\n"
+        "print('testrail_api._category' in sys.modules, 'asyncio' in sys.modules)\n"
+        "api.cases\n"
+        "print('testrail_api._category' in sys.modules)"
+    )
+    assert run(code).stdout.split() == ["False", "False", "True"]
+
+
+def import_time(code: str) -> int:
+    timer = f"import time; start = time.perf_counter(); {code}; print(int((time.perf_counter() - start) * 1e6))"
+    # best of several runs, a single one is too noisy on a loaded machine
+    return min(int(run(timer).stdout) for _ in range(IMPORT_RUNS))
+
+
+@pytest.mark.parametrize("code", ("import testrail_api", "from testrail_api import TestRailAPI"))
+def test_import_time_budget(code):
+    elapsed = import_time(code)
+    assert elapsed < IMPORT_BUDGET_US, f"{code} took {elapsed} us"
+
+
+@pytest.mark.parametrize("name", testrail_api.__all__)
+def test_public_names(name):
+    assert getattr(testrail_api, name) is not None
+    assert name in dir(testrail_api)
+
+
+def test_unknown_name():
+    with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+        testrail_api.Unknown  # noqa: B018
@@ -0,0 +1,169 @@
+import json
+
+import pytest
+
+from testrail_api import Journal, ResultsReporter, ResultStatus, RetryPolicy, ServerError
+from testrail_api import TestRailAPI as TRApi
+from testrail_api._exception import TestRailError as TRError
+from testrail_api.testing import Fault
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "journal.jsonl"
+
+
+def api(url: str, journal) -> TRApi:
+    return TRApi(url, "example@mail.com", "password", warn_ignore=True, exc_iterations=1, journal=journal)
+
+
+def test_ack_and_truncate(path):
+    journal = Journal(path, fsync=False)
+    first = journal.append("add_result/1", json={"status_id": ResultStatus.PASSED})
+    second = journal.append("add_result/2", json={"status_id": 5})
+    assert [entry["json"] for entry in journal.pending] == [{"status_id": 1}, {"status_id": 5}]
+    journal.ack(first)
+    journal.close()
+    journal = Journal(path)
+    assert [entry["id"] for entry in journal.pending] == [second]
+    journal.ack(second)
+    assert journal.pending == []
+    assert path.read_text() == ""
+    journal.close()
+
+
+def test_corrupt_last_line(path):
+    journal = Journal(path)
+    entry = journal.append("add_result/1", json={"status_id": 1})
+    journal.close()
+    with path.open("a") as file:
+        file.write('{"id": "trunc')
+    journal = Journal(path)
+    assert [pending["id"] for pending in journal.pending] == [entry]
+    assert [json.loads(line)["id"] for line in path.read_text().splitlines()] == [entry]
+    journal.close()
+
+
+@pytest.mark.usefixtures("run")
+def test_acknowledged(served, path):
+    with api(served, path) as session:
+        session.results.add_result(1, status_id=ResultStatus.PASSED)
+        with pytest.raises(TRError):
+            session.results.add_result(999, status_id=ResultStatus.PASSED)
+        session.cases.get_case(1)
+        assert session.journal.pending == []
+    assert path.read_text() == ""
+
+
+@pytest.mark.usefixtures("run")
+def test_replay(emulator, served, path):
+    emulator.faults = [Fault(503, endpoints=("add_result_for_case", "add_results_for_cases"))]
+    with api(served, path) as session:
+        with pytest.raises(TRError):
+            session.results.add_result_for_case(1, 1, status_id=ResultStatus.FAILED, comment="first")
+        with pytest.raises(TRError):
+            session.results.add_results_for_cases(1, [{"case_id": 2, "status_id": ResultStatus.PASSED}])
+        assert [entry["endpoint"] for entry in session.journal.pending] == [
+            "add_result_for_case/1/1",
+            "add_results_for_cases/1",
+        ]
+    assert emulator.tables["results"] == {}
+    emulator.faults = []
+    emulator.requests.clear()
+    with api(served, path) as session:
+        assert session.journal.pending == []
+    assert emulator.requests == {"add_result_for_case/{id}/{id}": 1, "add_results_for_cases/{id}": 1}
+    results = sorted(emulator.tables["results"].values(), key=lambda result: result["id"])
+    assert [(result["test_id"], result.get("comment")) for result in results] == [(1, "first"), (2, None)]
+
+
+@pytest.mark.usefixtures("run")
+def test_chunk_retry_then_replay(emulator, served, path):
+    emulator.faults = [Fault(503, endpoints=("add_results_for_cases",), times=1)]
+    results = [{"case_id": case_id, "status_id": ResultStatus.PASSED} for case_id in (1, 2, 3, 1)]
+    policy = RetryPolicy(methods=("POST",), backoff=0)
+    with api(served, path) as session:
+        session.results.add_results_for_cases_chunked(1, results, chunk_size=2, retry_policy=policy)
+        assert session.journal.pending == []
+    emulator.requests.clear()
+    with api(served, path):
+        pass
+    assert emulator.requests == {}
+    assert len(emulator.tables["results"]) == 4
+
+
+@pytest.mark.usefixtures("run")
+def test_upload_retry_then_replay(emulator, served, path):
+    emulator.faults = [Fault(503, endpoints=("add_result_for_case",), times=1)]
+    with api(served, path) as session, session.journal.upload():
+        for _ in range(2):
+            try:
+                session.results.add_result_for_case(1, 1, status_id=ResultStatus.PASSED)
+                break
+            except ServerError:
+                continue
+        assert session.journal.pending == []
+    with api(served, path):
+        pass
+    assert len(emulator.tables["results"]) == 1
+
+
+@pytest.mark.usefixtures("run")
+def test_replay_stops(emulator, served, path):
+    journal = Journal(path)
+    journal.append("add_result/1", json={"status_id": 1})
+    journal.append("add_result/1", json={"status_id": 5})
+    journal.close()
+    emulator.faults = [Fault(500, endpoints=("add_result",))]
+    emulator.requests.clear()
+    with api(served, path) as session:
+        assert len(session.journal.pending) == 2
+    assert emulator.requests == {"add_result/{id}": 1}
+
+
+@pytest.mark.usefixtures("run")
+def test_attachment(emulator, served, path, tmp_path):
+    file = tmp_path / "screenshot.txt"
+    file.write_text("attachment")
+    emulator.faults = [Fault(502, endpoints=("add_attachment_to_run",))]
+    with api(served, path) as session, pytest.raises(TRError):
+        session.attachments.add_attachment_to_run(1, file)
+    assert [entry["file"] for entry in Journal(path).pending] == [str(file.absolute())]
+    emulator.faults = []
+    with api(served, path) as session:
+        assert session.journal.pending == []
+    assert len(emulator.tables["attachments"]) == 1
+
+
+@pytest.mark.usefixtures("run")
+def test_missing_attachment(emulator, served, path, tmp_path):
+    journal = Journal(path)
+    journal.append("add_attachment_to_run/1", file=tmp_path / "deleted.txt")
+    journal.close()
+    with api(served, path) as session:
+        assert session.journal.pending == []
+    assert emulator.tables["attachments"] == {}
+
+
+@pytest.mark.usefixtures("run")
+def test_reporter(emulator, served, path):
+    emulator.faults = [Fault(500, endpoints=("add_results_for_cases",))]
+    with api(served, path) as session:
+        with ResultsReporter(session, 1, retries=0) as reporter:
+            reporter.add(1, ResultStatus.PASSED)
+            reporter.add(2, ResultStatus.FAILED)
+        assert len(reporter.failed) == 2
+        assert [entry["json"]["results"] for entry in session.journal.pending] == [
+            [{"case_id": 1, "status_id": 1}],
+            [{"case_id": 2, "status_id": 5}],
+        ]
+    emulator.faults = []
+    emulator.requests.clear()
+    with api(served, path) as session:
+        assert session.journal.pending == []
+        with ResultsReporter(session, 1) as reporter:
+            reporter.add(3, ResultStatus.PASSED)
+        assert reporter.sent == 1
+        assert session.journal.pending == []
+    assert emulator.requests == {"add_results_for_cases/{id}": 2}
+    assert sorted(result["test_id"] for result in emulator.tables["results"].values()) == [1, 2, 3]
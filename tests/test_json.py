@@ -0,0 +1,96 @@
+import importlib.util
+import json
+import logging
+
+import pytest
+import requests
+import responses
+
+from testrail_api import JSONBackend
+from testrail_api import TestRailAPI as TRApi
+from testrail_api import TestRailError as TRError
+
+
+class CountingBackend:
+    """Standard library backend counting the calls."""
+
+    def __init__(self) -> None:
+        self.loads_calls = 0
+        self.dumps_calls = 0
+
+    def loads(self, content: bytes) -> object:
+        self.loads_calls += 1
+        return json.loads(content)
+
+    def dumps(self, obj: object) -> bytes:
+        self.dumps_calls += 1
+        return json.dumps(obj).encode()
+
+    def backend(self) -> JSONBackend:
+        return JSONBackend(name="counting", dumps=self.dumps, loads=self.loads)
+
+
+def test_single_decode(auth_data, mock, url, monkeypatch):
+    def fail(*_, **__) -> None:
+        raise AssertionError("response decoded twice")
+
+    monkeypatch.setattr(requests.Response, "json", fail)
+    monkeypatch.setattr(requests.Response, "text", property(fail))
+    counting = CountingBackend()
+    mock.add_callback(responses.GET, url("get_case/1"), lambda _: (200, {}, json.dumps({"id": 1})))
+    api = TRApi(*auth_data, json_backend=counting.backend())
+    assert api.cases.get_case(1) == {"id": 1}
+    assert counting.loads_calls == 1
+
+
+def test_request_body_encoded_by_backend(auth_data, mock, url):
+    counting = CountingBackend()
+
+    def callback(request) -> tuple:
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.body) == {"title": "case", "priority_id": 1}
+        return 200, {}, json.dumps({"id": 1})
+
+    mock.add_callback(responses.POST, url("add_case/1"), callback)
+    api = TRApi(*auth_data, json_backend=counting.backend())
+    api.cases.add_case(1, "case", priority_id=1)
+    assert counting.dumps_calls == 1
+
+
+@pytest.mark.parametrize("body", ("", "plain text"))
+def test_not_json_body(api, mock, url, body):
+    mock.add_callback(responses.GET, url("get_case/1"), lambda _: (200, {}, body))
+    assert api.cases.get_case(1) == (body or None)
+
+
+def test_body_logging_truncated(api, mock, url, caplog):
+    cases = [{"id": i, "title": "x" * 100} for i in range(100)]
+    mock.add_callback(responses.GET, url("get_case/1"), lambda _: (200, {}, json.dumps(cases)))
+    with caplog.at_level(logging.DEBUG, logger="testrail_api"):
+        api.cases.get_case(1)
+    [message] = [record.getMessage() for record in caplog.records if record.getMessage().startswith("Response body")]
+    assert len(message) < 1200
+    assert message.endswith("bytes)'")
+
+
+@pytest.mark.skipif(importlib.util.find_spec("orjson") is None, reason="orjson is not installed")
+@pytest.mark.parametrize("name", ("orjson", "auto"))
+def test_orjson_backend(auth_data, mock, url, name):
+    def callback(request) -> tuple:
+        assert request.body == b'{"results":[{"test_id":1,"status_id":1}]}'
+        return 200, {}, json.dumps([{"id": 1}])
+
+    mock.add_callback(responses.POST, url("add_results/1"), callback)
+    api = TRApi(*auth_data, json_backend=name)
+    assert api.results.add_results(1, [{"test_id": 1, "status_id": 1}]) == [{"id": 1}]
+
+
+def test_unknown_backend(auth_data):
+    with pytest.raises(TRError, match="Unknown JSON backend"):
+        TRApi(*auth_data, json_backend="yaml")
+
+
+@pytest.mark.skipif(importlib.util.find_spec("msgspec") is not None, reason="msgspec is installed")
+def test_backend_not_installed(auth_data):
+    with pytest.raises(TRError, match="pip install msgspec"):
+        TRApi(*auth_data, json_backend="msgspec")
@@ -0,0 +1,138 @@
+import asyncio
+import json
+from unittest import mock as umock
+
+import pytest
+import responses
+
+from testrail_api import AsyncTestRailAPI, Metrics, RetryPolicy
+from testrail_api import TestRailAPI as TRApi
+from testrail_api._metrics import endpoint_template
+
+
+class CustomError(Exception):
+    """Transient custom exception."""
+
+
+@pytest.fixture
+def metrics_api(auth_data) -> TRApi:
+    return TRApi(*auth_data, metrics=True, raise_on_error=False)
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "template"),
+    (
+        ("get_results_for_run/12", "get_results_for_run/{id}"),
+        ("get_results_for_case/1/22", "get_results_for_case/{id}/{id}"),
+        ("get_statuses", "get_statuses"),
+        ("add_attachment_to_plan_entry/1/a1b2", "add_attachment_to_plan_entry/{id}/a1b2"),
+    ),
+)
+def test_endpoint_template(endpoint, template):
+    assert endpoint_template(endpoint) == template
+
+
+def test_disabled_by_default(api, mock, url):
+    mock.add_callback(responses.GET, url("get_case/1"), lambda _: (200, {}, json.dumps({"id": 1})))
+    api.cases.get_case(1)
+    assert api.metrics is None
+    assert api.stats() == {}
+
+
+def test_requests_and_bytes(metrics_api, mock, url):
+    body = json.dumps({"id": 1})
+    mock.add_callback(responses.GET, url("get_case/1"), lambda _: (200, {}, body))
+    mock.add_callback(responses.GET, url("get_case/2"), lambda _: (200, {}, body))
+    mock.add_callback(responses.POST, url("add_result/3"), lambda _: (200, {}, body))
+    metrics_api.cases.get_case(1)
+    metrics_api.cases.get_case(2)
+    metrics_api.results.add_result(3, status_id=1)
+    stats = metrics_api.stats()
+    assert set(stats) == {"get_case/{id}", "add_result/{id}"}
+    assert stats["get_case/{id}"]["requests"] == 2
+    assert stats["get_case/{id}"]["bytes_received"] == 2 * len(body)
+    assert stats["get_case/{id}"]["bytes_sent"] == 0
+    assert stats["add_result/{id}"]["bytes_sent"] == len(b'{"status_id": 1}')
+    assert stats["get_case/{id}"]["latency_buckets"][30.0] == 2
+    assert stats["get_case/{id}"]["errors"] == {}
+
+
+def test_errors_and_retries(auth_data, mock, url):
+    calls = []
+
+    def callback(_) -> tuple:
+        calls.append(1)
+        if len(calls) == 1:
+            return 429, {"retry-after": "0"}, ""
+        if len(calls) == 2:
+            return 503, {}, ""
+        return 404, {}, ""
+
+    mock.add_callback(responses.GET, url("get_run/1"), callback)
+    api = TRApi(*auth_data, metrics=True, raise_on_error=False, retry_policy=RetryPolicy(backoff=0))
+    api.runs.get_run(1)
+    stats = api.stats()["get_run/{id}"]
+    assert stats["requests"] == 3
+    assert stats["retries"] == 2
+    assert stats["rate_limit_sleeps"] == 1
+    assert stats["errors"] == {"RateLimitError": 1, "ServerError": 1, "NotFoundError": 1}
+
+
+def test_exception_counted(auth_data, mock, url):
+    def callback(_) -> tuple:
+        raise CustomError
+
+    mock.add_callback(responses.GET, url("get_run/1"), callback)
+    api = TRApi(*auth_data, metrics=True, retry_exceptions=(CustomError,))
+    with umock.patch("testrail_api._session.time.sleep"), pytest.raises(CustomError):
+        api.runs.get_run(1)
+    stats = api.stats()["get_run/{id}"]
+    assert stats["errors"] == {"CustomError": 3}
+    assert stats["retries"] == 2
+
+
+def test_shared_collector(auth_data, mock, url):
+    mock.add_callback(responses.GET, url("get_case/1"), lambda _: (200, {}, "{}"))
+    metrics = Metrics()
+    for _ in range(2):
+        TRApi(*auth_data, metrics=metrics).cases.get_case(1)
+    assert metrics.stats()["get_case/{id}"]["requests"] == 2
+    metrics.reset()
+    assert metrics.stats() == {}
+
+
+def test_histogram():
+    metrics = Metrics(buckets=(0.1, 1))
+    for seconds in (0.05, 0.5, 0.7, 5):
+        metrics.observe("get_case/1", seconds)
+    stats = metrics.stats()["get_case/{id}"]
+    assert stats["latency_buckets"] == {0.1: 1, 1: 3}
+    assert stats["latency_sum"] == pytest.approx(6.25)
+    assert stats["latency_avg"] == pytest.approx(6.25 / 4)
+
+
+def test_prometheus():
+    metrics = Metrics(buckets=(0.5,))
+    metrics.observe("get_case/1", 0.25, received=10, error="NotFoundError")
+    metrics.retry("get_case/1", rate_limit_delay=2)
+    text = metrics.to_prometheus()
+    assert "# TYPE testrail_api_requests_total counter" in text
+    assert 'testrail_api_requests_total{endpoint="get_case/{id}"} 1' in text
+    assert 'testrail_api_request_duration_seconds_bucket{endpoint="get_case/{id}",le="0.5"} 1' in text
+    assert 'testrail_api_request_duration_seconds_bucket{endpoint="get_case/{id}",le="+Inf"} 1' in text
+    assert 'testrail_api_request_duration_seconds_sum{endpoint="get_case/{id}"} 0.25' in text
+    assert 'testrail_api_errors_total{endpoint="get_case/{id}",error="NotFoundError"} 1' in text
+    assert 'testrail_api_rate_limit_sleep_seconds_total{endpoint="get_case/{id}"} 2' in text
+    assert 'testrail_api_received_bytes_total{endpoint="get_case/{id}"} 10' in text
+    assert text.endswith("\n")
+
+
+def test_async_metrics(auth_data):
+    httpx = pytest.importorskip("httpx")
+    api = AsyncTestRailAPI(
+        *auth_data,
+        metrics=True,
+        client=httpx.AsyncClient(transport=httpx.MockTransport(lambda _: httpx.Response(200, json={"cases": []}))),
+    )
+    asyncio.run(api.cases.get_cases(1, suite_id=2))
+    assert api.stats()["get_cases/{id}"]["requests"] == 1
@@ -1,4 +1,6 @@
+import itertools
 import json
+import socket
 import time
 from datetime import datetime, timedelta, timezone
 from email.utils import format_datetime
@@ -23,6 +25,8 @@ from testrail_api import TestRailAPI as TRApi
 from testrail_api._category import _bulk_api_method
 from testrail_api._exception import TestRailAPIError as TRApiError
 from testrail_api._exception import TestRailError as TRError
+from testrail_api._pagination import _iter_api_method
+from testrail_api._session import _BaseSession
 
 
 class RateLimit:
@@ -271,6 +275,32 @@ def test_close_method(auth_data):
     close_mock.assert_called_once()
 
 
+def test_default_adapters_untouched(auth_data):
+    session = Session()
+    adapter = session.get_adapter("https://example.testrail.com/")
+    TRApi(*auth_data, session=session)
+    assert session.get_adapter("https://example.testrail.com/") is adapter
+
+
+def test_pool_options(auth_data):
+    session = Session()
+    TRApi(*auth_data, session=session, pool_maxsize=32, pool_block=True, max_retries=2)
+    for prefix in ("https://example.testrail.com/", "http://example.testrail.com/"):
+        adapter = session.get_adapter(prefix)
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 32
+        assert adapter.poolmanager.connection_pool_kw["block"] is True
+        assert adapter.max_retries.total == 2
+        assert "socket_options" not in adapter.poolmanager.connection_pool_kw
+
+
+def test_pool_tcp_keepalive(auth_data):
+    session = Session()
+    TRApi(*auth_data, session=session, tcp_keepalive=30)
+    options = session.get_adapter("https://example.testrail.com/").poolmanager.connection_pool_kw["socket_options"]
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+    assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in options  # urllib3 defaults are kept
+
+
 def test_request_return_none_with_zero_iterations():
     # Initialize session with 0 iterations so the request loop never runs
     api = TRApi("https://testrail.com", "user", "password", exc_iterations=0)
@@ -413,6 +443,155 @@ def test_bulk_null_page():
     assert _bulk_api_method(mock_func, "cases") == []
 
 
+class PagedEndpoint:
+    """Paginated endpoint stub returning ``total`` items, slower for the first pages."""
+
+    def __init__(self, total: int, key: str = "cases") -> None:
+        self.total = total
+        self.key = key
+        self.offsets = []
+
+    def __call__(self, *args, offset: int, limit: int, **kwargs) -> dict:
+        self.offsets.append(offset)
+        time.sleep(0.01 if offset < 500 else 0)
+        items = [{"id": i} for i in range(offset, min(offset + limit, self.total))]
+        return {"offset": offset, "limit": limit, "size": len(items), self.key: items}
+
+
+@pytest.mark.parametrize("total", (0, 1, 250, 251, 1999, 2000))
+def test_bulk_concurrency_keeps_order(total):
+    endpoint = PagedEndpoint(total)
+    resp = _bulk_api_method(endpoint, "cases", concurrency=4)
+    assert [item["id"] for item in resp] == list(range(total))
+
+
+def test_bulk_concurrency_stops_after_short_page():
+    endpoint = PagedEndpoint(1000)
+    _bulk_api_method(endpoint, "cases", concurrency=3)
+    # the last page (offset 1000) is empty, at most `concurrency - 1` speculative pages follow it
+    assert max(endpoint.offsets) <= 1000 + 2 * 250
+
+
+def test_bulk_concurrency_forwards_arguments(api, mock, url):
+    def callback(request) -> tuple[int, dict, str]:
+        query = parse_qs(urlparse(request.url).query)
+        assert query["suite_id"] == ["2"]
+        offset = int(query["offset"][0])
+        size = 250 if offset < 500 else 10
+        return 200, {}, json.dumps({"offset": offset, "cases": [{"id": offset + i} for i in range(size)]})
+
+    mock.add_callback(responses.GET, url("get_cases/1"), callback)
+    resp = api.cases.get_cases_bulk(1, suite_id=2, concurrency=4)
+    assert [case["id"] for case in resp] == list(range(510))
+
+
+def test_bulk_concurrency_error_propagates():
+    mock_func = mock.Mock(side_effect=ConnectionError("fail"))
+    with pytest.raises(ConnectionError):
+        _bulk_api_method(mock_func, "cases", concurrency=2)
+
+
+def test_bulk_invalid_concurrency(api):
+    with pytest.raises(ValueError, match="concurrency"):
+        api.cases.get_cases_bulk(1, concurrency=0)
+
+
+class LinkedEndpoint(PagedEndpoint):
+    """Paginated endpoint stub returning ``_links`` like TestRail 6.7+."""
+
+    def __call__(self, *args, offset: int, limit: int, **kwargs) -> dict:
+        resp = super().__call__(*args, offset=offset, limit=limit, **kwargs)
+        has_next = offset + limit < self.total
+        resp["_links"] = {"next": f"/api/v2/get_cases/1&limit={limit}&offset={offset + limit}" if has_next else None}
+        return resp
+
+
+@pytest.mark.parametrize("concurrency", (1, 4))
+def test_bulk_stops_on_links_next(concurrency):
+    endpoint = LinkedEndpoint(500)
+    resp = _bulk_api_method(endpoint, "cases", concurrency=concurrency)
+    assert [item["id"] for item in resp] == list(range(500))
+    if concurrency == 1:
+        # an exact multiple of the page size costs no trailing empty request
+        assert endpoint.offsets == [0, 250]
+
+
+def test_bulk_page_size_and_progress():
+    endpoint = LinkedEndpoint(230)
+    pages = []
+    resp = _bulk_api_method(endpoint, "cases", page_size=100, on_page=pages.append)
+    assert len(resp) == 230
+    assert endpoint.offsets == [0, 100, 200]
+    assert [(page.offset, page.limit, page.size, page.fetched) for page in pages] == [
+        (0, 100, 100, 100),
+        (100, 100, 100, 200),
+        (200, 100, 30, 230),
+    ]
+    assert [page.total for page in pages] == [None, None, 230]
+    assert pages[0].next == "/api/v2/get_cases/1&limit=100&offset=100"
+    assert pages[-1].is_last
+
+
+def test_bulk_page_size_sent_as_limit(api, mock, url):
+    def callback(request) -> tuple[int, dict, str]:
+        query = parse_qs(urlparse(request.url).query)
+        assert query["limit"] == ["50"]
+        return 200, {}, json.dumps({"offset": 0, "limit": 50, "size": 1, "_links": {"next": None}, "runs": [{}]})
+
+    mock.add_callback(responses.GET, url("get_runs/1"), callback)
+    assert api.runs.get_runs_bulk(1, page_size=50) == [{}]
+
+
+@pytest.mark.parametrize("page_size", (0, 251))
+def test_bulk_invalid_page_size(api, page_size):
+    with pytest.raises(ValueError, match="page_size"):
+        api.cases.get_cases_bulk(1, page_size=page_size)
+
+
+def test_iter_fetches_pages_lazily():
+    endpoint = PagedEndpoint(600)
+    items = _iter_api_method(endpoint, "cases")
+    assert endpoint.offsets == []
+    assert next(items) == {"id": 0}
+    assert endpoint.offsets == [0]
+    assert [item["id"] for item in itertools.islice(items, 249)] == list(range(1, 250))
+    assert endpoint.offsets == [0]
+    assert next(items) == {"id": 250}
+    assert endpoint.offsets == [0, 250]
+    assert len(list(items)) == 349
+
+
+def test_iter_prefetches_next_page():
+    endpoint = PagedEndpoint(600)
+    items = _iter_api_method(endpoint, "cases", prefetch=True)
+    assert next(items) == {"id": 0}
+    # the second page is requested in the background while the first one is being consumed
+    deadline = time.monotonic() + 5
+    while 250 not in endpoint.offsets and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert endpoint.offsets == [0, 250]
+    assert [item["id"] for item in items] == list(range(1, 600))
+    assert endpoint.offsets == [0, 250, 500]
+
+
+@pytest.mark.parametrize("concurrency", (1, 3))
+def test_iter_results_for_run(api, mock, url, concurrency):
+    def callback(request) -> tuple[int, dict, str]:
+        offset = int(parse_qs(urlparse(request.url).query)["offset"][0])
+        results = [{"id": i} for i in range(offset, min(offset + 250, 700))]
+        return 200, {}, json.dumps({"offset": offset, "results": results})
+
+    mock.add_callback(responses.GET, url("get_results_for_run/1"), callback)
+    results = api.results.iter_results_for_run(1, concurrency=concurrency)
+    assert not isinstance(results, list)
+    assert [result["id"] for result in results] == list(range(700))
+
+
+def test_iter_rejects_limit_eagerly(api):
+    with pytest.raises(TypeError, match="managed automatically"):
+        api.cases.iter_cases(1, limit=10)
+
+
 def test_get_attachment_error_uses_custom_handler(auth_data, mock, url, tmp_path):
     api = TRApi(*auth_data, response_handler=lambda _: "custom error")
     mock.add_callback(responses.GET, url("get_attachment/1"), lambda _: (400, {}, ""))
@@ -472,3 +651,12 @@ def test_enum_in_post_body(api, mock, url):
 
     mock.add_callback(responses.POST, url("add_results/1"), callback)
     api.results.add_results(1, [{"test_id": 1, "status_id": ResultStatus.PASSED}])
+
+
+def test_incomplete_session(auth_data):
+    class Incomplete(_BaseSession):
+        def request(self, method, endpoint, *, raw=False, **kwargs) -> None:
+            return None
+
+    with pytest.raises(TypeError, match="attachment_request"):
+        Incomplete(*auth_data)
@@ -0,0 +1,176 @@
+import subprocess
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from testrail_api import ChunkedUploadError, Journal, ResultsReporter, ResultStatus, ServerError, StatusCodeError
+from testrail_api._exception import TestRailError as TRError
+from testrail_api.testing import Fault
+
+CASES = 100
+
+
+@pytest.fixture
+def cases() -> int:
+    return CASES
+
+
+def test_batches_from_threads(emulated_api, emulator, run):
+    emulator.requests.clear()
+    with ResultsReporter(emulated_api, run["id"], batch_size=30, flush_interval=60) as reporter:
+
+        def report(first: int) -> None:
+            for case_id in range(first, first + 25):
+                reporter.add(case_id, ResultStatus.PASSED, comment=f"case {case_id}")
+
+        threads = [threading.Thread(target=report, args=(first,)) for first in range(1, CASES, 25)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert reporter.sent == CASES
+    assert emulator.requests == {"add_results_for_cases/{id}": 4}
+    results = emulated_api.results.get_results_for_run_bulk(run["id"])
+    assert sorted(result["comment"] for result in results) == sorted(f"case {i}" for i in range(1, CASES + 1))
+
+
+def test_flush_interval(emulated_api, emulator, run):
+    reporter = ResultsReporter(emulated_api, run["id"], flush_interval=0.1)
+    emulator.requests.clear()
+    reporter.add(1, ResultStatus.FAILED)
+    reporter.add(2, ResultStatus.PASSED)
+    deadline = time.monotonic() + 5
+    while reporter.sent < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert reporter.sent == 2
+    assert emulator.requests == {"add_results_for_cases/{id}": 1}
+    reporter.close()
+
+
+def test_flush(emulated_api, run):
+    with ResultsReporter(emulated_api, run["id"], flush_interval=60) as reporter:
+        reporter.add(1, ResultStatus.PASSED)
+        assert reporter.flush(timeout=5)
+        assert reporter.sent == 1
+        assert len(emulated_api.results.get_results_for_run(run["id"])["results"]) == 1
+
+
+def test_backpressure(emulated_api, emulator, run):
+    emulator.latency = 0.2
+    with ResultsReporter(emulated_api, run["id"], batch_size=1, max_buffered=1, block_timeout=0.05) as reporter:
+        reporter.add(1, ResultStatus.PASSED)
+        reporter.add(2, ResultStatus.PASSED)
+        with pytest.raises(TRError, match="buffer is still full"):
+            reporter.add(3, ResultStatus.PASSED)
+    assert reporter.sent == 2
+
+
+def test_failed_results(emulated_api, emulator, run):
+    emulator.faults = [Fault(500, endpoints=("add_results_for_cases",))]
+    with ResultsReporter(emulated_api, run["id"], retries=1) as reporter:
+        reporter.add(1, ResultStatus.PASSED)
+    assert reporter.sent == 0
+    assert reporter.failed == [{"case_id": 1, "status_id": ResultStatus.PASSED}]
+    assert len(reporter.errors) == 1
+    with pytest.raises(TRError, match="closed"):
+        reporter.add(2, ResultStatus.PASSED)
+
+
+def test_flush_at_exit(emulator, served, run):
+    code = (
+        "import sys\n"
+        "from testrail_api import ResultsReporter, TestRailAPI\n"
+        "api = TestRailAPI(sys.argv[1], 'example@mail.com', 'password', warn_ignore=True)\n"
+        "reporter = ResultsReporter(api, int(sys.argv[2]), flush_interval=60)\n"
+        "reporter.add(1, 1, comment='at exit')\n"
+    )
+    subprocess.run([sys.executable, "-c", code, served, str(run["id"])], check=True, timeout=30)  # noqa: S603
+    assert [result["comment"] for result in emulator.tables["results"].values()] == ["at exit"]
+
+
+def test_journal_settled_by_chunk(tmp_path):
+    def add_results_for_cases_chunked(_, results, **__) -> list:
+        errors = {0: StatusCodeError(400, "Bad Request", "", b""), 2: ServerError(503, "Unavailable", "", b"")}
+        raise ChunkedUploadError("2 of 3 chunks failed", [None, None, None, None, results[4]], errors, {0: 2, 2: 2})
+
+    journal = Journal(tmp_path / "journal.jsonl")
+    api = SimpleNamespace(
+        results=SimpleNamespace(add_results_for_cases_chunked=add_results_for_cases_chunked), journal=journal
+    )
+    with ResultsReporter(api, 1, flush_interval=60) as reporter:
+        for case_id in range(1, 6):
+            reporter.add(case_id, ResultStatus.PASSED)
+    assert reporter.sent == 1
+    # the rejected chunk and the added result are settled, the chunk failed with a 503 stays pending
+    assert [entry["json"]["results"][0]["case_id"] for entry in journal.pending] == [3, 4]
+    journal.close()
+
+
+def test_add_while_closing():
+    sent = []
+
+    def add_results_for_cases_chunked(_, results, **__) -> list:
+        sent.extend(results)
+        return results
+
+    api = SimpleNamespace(
+        results=SimpleNamespace(add_results_for_cases_chunked=add_results_for_cases_chunked), journal=None
+    )
+    reporter = ResultsReporter(api, 1, batch_size=10, flush_interval=60)
+    rejected = []
+
+    def report(first: int) -> None:
+        for case_id in range(first, first + 500):
+            try:
+                reporter.add(case_id)
+            except TRError:  # noqa: PERF203
+                rejected.append(case_id)
+
+    threads = [threading.Thread(target=report, args=(first,)) for first in range(0, 2000, 500)]
+    for thread in threads:
+        thread.start()
+    reporter.close()
+    for thread in threads:
+        thread.join()
+    assert len(sent) + len(rejected) == 2000
+    assert reporter.sent == len(sent)
+
+
+def test_full_buffer_does_not_serialize_callers():
+    sending = threading.Event()
+    release = threading.Event()
+
+    def add_results_for_cases_chunked(_, results, **__) -> list:
+        sending.set()
+        release.wait(5)
+        return results
+
+    api = SimpleNamespace(
+        results=SimpleNamespace(add_results_for_cases_chunked=add_results_for_cases_chunked), journal=None
+    )
+    reporter = ResultsReporter(api, 1, batch_size=1, max_buffered=1, block_timeout=0.2)
+    reporter.add(1)
+    sending.wait(5)
+    reporter.add(2)
+    errors = []
+
+    def add(case_id: int) -> None:
+        with pytest.raises(TRError, match="buffer is still full"):
+            reporter.add(case_id)
+        errors.append(case_id)
+
+    threads = [threading.Thread(target=add, args=(case_id,)) for case_id in range(3, 8)]
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # the callers wait for room together, not one after the other under the lock
+    assert time.monotonic() - start < 0.6
+    assert len(errors) == 5
+    release.set()
+    reporter.close()
+    assert reporter.sent == 2
@@ -1,11 +1,15 @@
+import collections
 import functools
 import json
 import re
 from datetime import datetime
 
 import pytest
+import requests
 import responses
 
+from testrail_api import ChunkedUploadError, RetryPolicy, StatusCodeError
+
 
 def get_results(r, limit="3"):
     assert r.params["limit"] == limit
@@ -104,6 +108,103 @@ def test_add_results_for_cases(api, mock, url):
     assert resp == results
 
 
+def test_add_results_for_cases_chunked(api, mock, url):
+    sizes = []
+
+    def callback(r) -> tuple[int, dict, str]:
+        sizes.append(len(json.loads(r.body)["results"]))
+        return add_results(r)
+
+    mock.add_callback(responses.POST, url("add_results_for_cases/18"), callback)
+    results = [{"case_id": case_id, "status_id": 1} for case_id in range(1, 2501)]
+    resp = api.results.add_results_for_cases_chunked(18, results, chunk_size=1000, concurrency=3)
+    assert resp == results
+    assert sorted(sizes) == [500, 1000, 1000]
+
+
+def test_add_results_chunked_by_size(api, mock, url):
+    bodies = []
+
+    def callback(r) -> tuple[int, dict, str]:
+        bodies.append(len(r.body))
+        return add_results(r)
+
+    mock.add_callback(responses.POST, url("add_results/15"), callback)
+    results = [{"test_id": test_id, "status_id": 1, "comment": "x" * 1000} for test_id in range(1, 11)]
+    resp = api.results.add_results_chunked(15, results, max_bytes=4096)
+    assert resp == results
+    assert len(bodies) == 4
+    assert max(bodies) <= 4096
+
+
+def test_add_results_chunked_retries_failed_chunks(api, mock, url):
+    attempts = collections.Counter()
+
+    def callback(r) -> tuple[int, dict, str]:
+        first = json.loads(r.body)["results"][0]["test_id"]
+        attempts[first] += 1
+        if first == 3 and attempts[first] == 1:
+            return 503, {}, ""
+        return add_results(r)
+
+    mock.add_callback(responses.POST, url("add_results/15"), callback)
+    results = [{"test_id": test_id, "status_id": 1} for test_id in range(1, 7)]
+    # a 503 chunk may have been added: retried only when the policy allows POST
+    with pytest.raises(ChunkedUploadError):
+        api.results.add_results_chunked(15, results, chunk_size=2, concurrency=2)
+    assert attempts == {1: 1, 3: 1, 5: 1}
+    attempts.clear()
+    policy = RetryPolicy(methods=("POST",), backoff=0)
+    assert api.results.add_results_chunked(15, results, chunk_size=2, concurrency=2, retry_policy=policy) == results
+    assert attempts == {1: 1, 3: 2, 5: 1}
+    assert policy.balance == policy.min_retries - 1
+
+
+@pytest.mark.parametrize(
+    ("error", "sent"),
+    (
+        (requests.ConnectTimeout("connect timeout"), 3),
+        (requests.ReadTimeout("read timeout"), 1),
+    ),
+)
+def test_add_results_chunked_retries_connect_errors(api, mock, url, error, sent):
+    calls = []
+
+    def callback(r) -> tuple[int, dict, str]:
+        calls.append(r)
+        raise error
+
+    mock.add_callback(responses.POST, url("add_results/15"), callback)
+    with pytest.raises(ChunkedUploadError) as exc_info:
+        api.results.add_results_chunked(15, [{"test_id": 1, "status_id": 1}], retry_policy=RetryPolicy(backoff=0))
+    assert exc_info.value.errors[0] is error
+    assert len(calls) == sent
+
+
+def test_add_results_chunked_error(api, mock, url):
+    def callback(r) -> tuple[int, dict, str]:
+        if json.loads(r.body)["results"][0]["test_id"] == 3:
+            return 400, {}, json.dumps({"error": "Field :results cannot be empty"})
+        return add_results(r)
+
+    mock.add_callback(responses.POST, url("add_results/15"), callback)
+    results = [{"test_id": test_id, "status_id": 1} for test_id in range(1, 6)]
+    with pytest.raises(ChunkedUploadError, match="1 of 3 chunks") as exc_info:
+        api.results.add_results_chunked(15, results, chunk_size=2)
+    assert exc_info.value.results == [results[0], results[1], None, None, results[4]]
+    assert list(exc_info.value.errors) == [2]
+    assert isinstance(exc_info.value.errors[2], StatusCodeError)
+    # rejected chunks are not sent again
+    assert len(mock.calls) == 3
+
+
+def test_add_results_chunked_options(api):
+    with pytest.raises(ValueError, match="chunk_size must be a positive number"):
+        api.results.add_results_chunked(15, [], chunk_size=0)
+    with pytest.raises(TypeError, match="Unexpected keyword arguments: limit"):
+        api.results.add_results_chunked(15, [], limit=1)
+
+
 def edit_result(r):
     data = json.loads(r.body.decode())
     return 200, {}, json.dumps({"id": 9, "status_id": data["status_id"], "comment": data["comment"]})
@@ -0,0 +1,144 @@
+import json
+from unittest import mock as umock
+
+import pytest
+import responses
+
+from testrail_api import RetryPolicy, ServerError
+from testrail_api import TestRailAPI as TRApi
+
+
+class CustomError(Exception):
+    """Transient custom exception."""
+
+
+@pytest.fixture
+def sleep():
+    with umock.patch("testrail_api._session.time.sleep") as patched:
+        yield patched
+
+
+def test_backoff_without_jitter():
+    policy = RetryPolicy(backoff=1, max_backoff=5, jitter=False)
+    assert [policy.delay(count) for count in range(5)] == [1, 2, 4, 5, 5]
+
+
+def test_backoff_full_jitter():
+    policy = RetryPolicy(backoff=1, max_backoff=8)
+    delays = [policy.delay(3) for _ in range(100)]
+    assert all(0 <= delay <= 8 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_idempotent_methods_only():
+    policy = RetryPolicy(jitter=False)
+    assert policy.retry("POST", 0) is None
+    assert policy.retry("get", 0) == 0.5
+    assert RetryPolicy(methods=("GET", "POST")).retry("POST", 0) is not None
+
+
+def test_retry_budget():
+    policy = RetryPolicy(budget=0.5, min_retries=2, jitter=False)
+    assert policy.retry("GET", 0) is not None
+    assert policy.retry("GET", 0) is not None
+    assert policy.retry("GET", 0) is None
+    policy.record_request()
+    assert policy.retry("GET", 0) is None
+    policy.record_request()
+    assert policy.retry("GET", 0) is not None
+    for _ in range(10):
+        policy.record_request()
+    assert policy.balance == 2
+
+
+def test_retry_after_replaces_backoff():
+    assert RetryPolicy(jitter=False).retry("GET", 3, retry_after=1.5) == 1.5
+
+
+@pytest.mark.parametrize("kwargs", ({"backoff": -1}, {"max_backoff": -1}, {"budget": -0.1}))
+def test_invalid_policy(kwargs):
+    with pytest.raises(ValueError):  # noqa: PT011
+        RetryPolicy(**kwargs)
+
+
+@pytest.mark.parametrize("status", (502, 503, 504))
+def test_transient_status_retried(auth_data, mock, url, sleep, status):
+    calls = []
+
+    def callback(_) -> tuple:
+        calls.append(1)
+        if len(calls) < 3:
+            return status, {}, ""
+        return 200, {}, json.dumps({"id": 1})
+
+    mock.add_callback(responses.GET, url("get_case/1"), callback)
+    api = TRApi(*auth_data, retry_policy=RetryPolicy(backoff=1, jitter=False))
+    assert api.cases.get_case(1) == {"id": 1}
+    assert [call.args[0] for call in sleep.call_args_list] == [1, 2]
+
+
+def test_transient_status_retry_after(auth_data, mock, url, sleep):
+    calls = []
+
+    def callback(_) -> tuple:
+        calls.append(1)
+        if len(calls) == 1:
+            return 503, {"retry-after": "7"}, ""
+        return 200, {}, json.dumps({"id": 1})
+
+    mock.add_callback(responses.GET, url("get_case/1"), callback)
+    api = TRApi(*auth_data, retry_policy=RetryPolicy())
+    assert api.cases.get_case(1) == {"id": 1}
+    sleep.assert_called_once_with(7.0)
+
+
+def test_transient_status_exhausted(auth_data, mock, url, sleep):
+    mock.add_callback(responses.GET, url("get_case/1"), lambda _: (503, {}, ""))
+    api = TRApi(*auth_data, exc_iterations=4, retry_policy=RetryPolicy())
+    with pytest.raises(ServerError):
+        api.cases.get_case(1)
+    assert sleep.call_count == 3
+    assert len(mock.calls) == 4
+
+
+def test_transient_status_without_policy(api, mock, url, sleep):
+    mock.add_callback(responses.GET, url("get_case/1"), lambda _: (503, {}, ""))
+    with pytest.raises(ServerError):
+        api.cases.get_case(1)
+    sleep.assert_not_called()
+    assert len(mock.calls) == 1
+
+
+def test_post_not_retried(auth_data, mock, url, sleep):
+    mock.add_callback(responses.POST, url("add_result/1"), lambda _: (503, {}, ""))
+    api = TRApi(*auth_data, retry_policy=RetryPolicy())
+    with pytest.raises(ServerError):
+        api.results.add_result(1, status_id=1)
+    sleep.assert_not_called()
+    assert len(mock.calls) == 1
+
+
+def test_exception_backoff(auth_data, mock, url, sleep):
+    calls = []
+
+    def callback(_) -> tuple:
+        calls.append(1)
+        if len(calls) < 3:
+            raise CustomError
+        return 200, {}, json.dumps({"id": 1})
+
+    mock.add_callback(responses.GET, url("get_case/1"), callback)
+    api = TRApi(*auth_data, retry_exceptions=(CustomError,), retry_policy=RetryPolicy(backoff=2, jitter=False))
+    assert api.cases.get_case(1) == {"id": 1}
+    assert [call.args[0] for call in sleep.call_args_list] == [2, 4]
+
+
+def test_budget_shared_between_sessions(auth_data, mock, url, sleep):
+    mock.add_callback(responses.GET, url("get_case/1"), lambda _: (503, {}, ""))
+    policy = RetryPolicy(budget=0, min_retries=3)
+    apis = [TRApi(*auth_data, raise_on_error=False, exc_iterations=3, retry_policy=policy) for _ in range(3)]
+    for api in apis:
+        api.cases.get_case(1)
+    # the budget ran out during the second call: 3 retries in total instead of 6
+    assert sleep.call_count == 3
+    assert len(mock.calls) == 6
@@ -0,0 +1,194 @@
+import asyncio
+import json
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+import responses
+
+from testrail_api import ConcurrencyLimiter, FileRateLimiter, RateLimiter, _throttle
+from testrail_api import TestRailAPI as TRApi
+
+
+class FakeTime:
+    """Replacement of the ``time`` module with a manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeTime:
+    fake = FakeTime()
+    monkeypatch.setattr(_throttle, "time", fake)
+    return fake
+
+
+@pytest.mark.usefixtures("clock")
+def test_rate_limiter_burst_then_spacing():
+    limiter = RateLimiter(per_minute=60, burst=2)
+    assert limiter.reserve() == 0
+    assert limiter.reserve() == 0
+    # reservations queue up: each next caller waits one more interval
+    assert limiter.reserve() == pytest.approx(1)
+    assert limiter.reserve() == pytest.approx(2)
+
+
+def test_rate_limiter_refills(clock):
+    limiter = RateLimiter(per_minute=120, burst=3)
+    for _ in range(3):
+        limiter.reserve()
+    clock.now += 60  # idle period refills the bucket up to the burst only
+    assert [limiter.reserve() for _ in range(4)] == [0, 0, 0, pytest.approx(0.5)]
+
+
+@pytest.mark.parametrize(("per_minute", "burst"), ((0, 1), (-1, 1), (60, 0)))
+def test_rate_limiter_invalid(per_minute, burst):
+    with pytest.raises(ValueError):  # noqa: PT011
+        RateLimiter(per_minute=per_minute, burst=burst)
+
+
+@pytest.mark.usefixtures("clock")
+def test_rate_limiter_threads():
+    limiter = RateLimiter(per_minute=60)
+    delays = []
+    threads = [threading.Thread(target=lambda: delays.append(limiter.reserve())) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(delays) == [pytest.approx(i) for i in range(10)]
+
+
+@pytest.mark.usefixtures("clock")
+def test_file_rate_limiter_shared_state(tmp_path):
+    path = tmp_path / "bucket"
+    first = FileRateLimiter(path, per_minute=60)
+    second = FileRateLimiter(path, per_minute=60)
+    assert first.reserve() == 0
+    assert second.reserve() == pytest.approx(1)
+    assert first.reserve() == pytest.approx(2)
+
+
+def test_file_rate_limiter_across_processes(tmp_path):
+    path = tmp_path / "bucket"
+    code = (
+        "import sys; from testrail_api import FileRateLimiter; "
+        "print(FileRateLimiter(sys.argv[1], per_minute=600).reserve())"
+    )
+    processes = [
+        subprocess.Popen([sys.executable, "-c", code, str(path)], stdout=subprocess.PIPE, text=True)  # noqa: S603
+        for _ in range(4)
+    ]
+    delays = sorted(float(process.communicate()[0]) for process in processes)
+    # one process got the token, the others queued 0.1 sec apart
+    assert delays[0] == 0
+    assert delays[-1] == pytest.approx(0.3, abs=0.1)
+
+
+def test_session_applies_rate_limiter(auth_data, mock, url):
+    mock.add_callback(responses.GET, url("get_case/1"), lambda _: (200, {}, json.dumps({"id": 1})))
+    api = TRApi(*auth_data, rate_limiter=RateLimiter(per_minute=600))
+    start = time.monotonic()
+    for _ in range(3):
+        api.cases.get_case(1)
+    assert time.monotonic() - start >= 0.2
+
+
+def test_rate_limiter_shared_between_sessions(auth_data, mock, url):
+    mock.add_callback(responses.GET, url("get_case/1"), lambda _: (200, {}, json.dumps({"id": 1})))
+    limiter = RateLimiter(per_minute=600)
+    apis = [TRApi(*auth_data, rate_limiter=limiter) for _ in range(3)]
+    start = time.monotonic()
+    for api in apis:
+        api.cases.get_case(1)
+    assert time.monotonic() - start >= 0.2
+
+
+def test_concurrency_limiter_aimd():
+    limiter = ConcurrencyLimiter(maximum=8, initial=4)
+    for _ in range(4):
+        limiter.release(limiter.acquire(), throttled=False)
+    assert limiter.limit == 5
+    tickets = [limiter.acquire() for _ in range(5)]
+    assert limiter.in_flight == 5
+    # the whole window was throttled, the limit is halved once
+    for ticket in tickets:
+        limiter.release(ticket, throttled=True)
+    assert limiter.limit == 2
+    limiter.release(limiter.acquire(), throttled=True)
+    assert limiter.limit == 1
+    limiter.release(limiter.acquire(), throttled=None)
+    assert (limiter.limit, limiter.in_flight) == (1, 0)
+
+
+@pytest.mark.parametrize("kwargs", ({"minimum": 0}, {"maximum": 2, "minimum": 3}, {"maximum": 4, "initial": 5}))
+def test_concurrency_limiter_invalid(kwargs):
+    with pytest.raises(ValueError):  # noqa: PT011
+        ConcurrencyLimiter(**kwargs)
+
+
+def test_concurrency_limiter_blocks():
+    limiter = ConcurrencyLimiter(maximum=1)
+    ticket = limiter.acquire()
+    acquired = threading.Event()
+    thread = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+    thread.start()
+    assert not acquired.wait(0.05)
+    limiter.release(ticket, throttled=False)
+    assert acquired.wait(1)
+    thread.join()
+
+
+def test_concurrency_limiter_async():
+    limiter = ConcurrencyLimiter(maximum=2)
+    running = []
+
+    async def worker() -> None:
+        ticket = await limiter.acquire_async()
+        running.append(limiter.in_flight)
+        await asyncio.sleep(0.01)
+        limiter.release(ticket, throttled=False)
+
+    async def main() -> None:
+        await asyncio.gather(*(worker() for _ in range(6)))
+
+    asyncio.run(main())
+    assert len(running) == 6
+    assert max(running) == 2
+
+
+def test_session_concurrency_limiter(auth_data, mock, url):
+    mock.add_callback(responses.GET, url("get_case/1"), lambda _: (429, {"retry-after": "0"}, ""))
+    limiter = ConcurrencyLimiter(maximum=4)
+    api = TRApi(*auth_data, concurrency_limiter=limiter, raise_on_error=False)
+    api.cases.get_case(1)
+    assert limiter.limit == 1
+    assert limiter.in_flight == 0
+
+
+def test_rate_limit_cooldown_shared(auth_data, mock, url):
+    calls = []
+
+    def callback(_) -> tuple:
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            return 429, {"retry-after": "0.3"}, ""
+        return 200, {}, json.dumps({"id": 1})
+
+    mock.add_callback(responses.GET, url("get_case/1"), callback)
+    api = TRApi(*auth_data)
+    start = time.monotonic()
+    api.cases.get_case(1)
+    # another caller of the session waits for the end of the cooldown as well
+    results = []
+    thread = threading.Thread(target=lambda: results.append(api.cases.get_case(1)))
+    thread.start()
+    thread.join()
+    assert results == [{"id": 1}]
+    assert all(call - start >= 0.3 for call in calls[1:])
@@ -0,0 +1,116 @@
+import asyncio
+import json
+from unittest import mock as umock
+
+import pytest
+import responses
+
+from testrail_api import AsyncTestRailAPI, RetryPolicy, SpanRecorder
+from testrail_api import TestRailAPI as TRApi
+
+
+@pytest.fixture
+def tracer() -> SpanRecorder:
+    return SpanRecorder()
+
+
+def names(spans) -> list:
+    return [span.name for span in spans]
+
+
+def test_request_spans(auth_data, mock, url, tracer):
+    mock.add_callback(responses.GET, url("get_case/1"), lambda _: (200, {}, json.dumps({"id": 1})))
+    api = TRApi(*auth_data, tracer=tracer)
+    api.cases.get_case(1)
+    assert names(tracer.spans) == [
+        "testrail_api.prepare",
+        "testrail_api.send",
+        "testrail_api.decode",
+        "testrail_api.request",
+    ]
+    request = tracer.spans[-1]
+    assert request.attributes == {"http.request.method": "GET", "testrail.endpoint": "get_case/{id}"}
+    assert all(span.parent is request for span in tracer.spans[:-1])
+    assert tracer.spans[1].attributes == {"testrail.attempt": 1, "http.response.status_code": 200}
+    assert all(span.duration >= 0 for span in tracer.spans)
+    assert request.duration >= sum(span.duration for span in tracer.spans[:-1])
+
+
+def test_retry_sleep_spans(auth_data, mock, url, tracer):
+    calls = []
+
+    def callback(_) -> tuple:
+        calls.append(1)
+        if len(calls) == 1:
+            return 503, {"retry-after": "0.01"}, ""
+        return 200, {}, json.dumps({"id": 1})
+
+    mock.add_callback(responses.GET, url("get_case/1"), callback)
+    api = TRApi(*auth_data, tracer=tracer, retry_policy=RetryPolicy())
+    api.cases.get_case(1)
+    assert names(tracer.spans) == [
+        "testrail_api.prepare",
+        "testrail_api.send",
+        "testrail_api.sleep",
+        "testrail_api.send",
+        "testrail_api.decode",
+        "testrail_api.request",
+    ]
+    assert tracer.spans[2].attributes == {"testrail.sleep.reason": "retry", "testrail.sleep.seconds": 0.01}
+    assert tracer.spans[3].attributes["testrail.attempt"] == 2
+
+
+def test_exception_span(auth_data, mock, url, tracer):
+    def callback(_) -> tuple:
+        raise ConnectionError
+
+    mock.add_callback(responses.GET, url("get_case/1"), callback)
+    api = TRApi(*auth_data, tracer=tracer)
+    with pytest.raises(ConnectionError):
+        api.cases.get_case(1)
+    assert [span.attributes.get("exception.type") for span in tracer.spans] == [
+        None,
+        "ConnectionError",
+        "ConnectionError",
+    ]
+
+
+def test_bulk_spans_keep_parent(auth_data, mock, url, tracer):
+    def callback(request) -> tuple:
+        offset = int(request.params["offset"])
+        cases = [{"id": i} for i in range(offset, min(offset + 250, 600))]
+        return 200, {}, json.dumps({"offset": offset, "size": len(cases), "cases": cases})
+
+    mock.add_callback(responses.GET, url("get_cases/1"), callback)
+    api = TRApi(*auth_data, tracer=tracer)
+    with tracer.start_as_current_span("ci-step") as step:
+        api.cases.get_cases_bulk(1, concurrency=3)
+    requests = [span for span in tracer.spans if span.name == "testrail_api.request"]
+    assert len(requests) >= 3
+    assert all(span.parent is step for span in requests)
+
+
+def test_no_tracer(api, mock, url):
+    mock.add_callback(responses.GET, url("get_case/1"), lambda _: (200, {}, json.dumps({"id": 1})))
+    with umock.patch("testrail_api._session.endpoint_template") as template:
+        api.cases.get_case(1)
+    template.assert_not_called()
+
+
+def test_async_spans(auth_data, tracer):
+    httpx = pytest.importorskip("httpx")
+    api = AsyncTestRailAPI(
+        *auth_data,
+        tracer=tracer,
+        client=httpx.AsyncClient(transport=httpx.MockTransport(lambda _: httpx.Response(200, json={"id": 1}))),
+    )
+
+    async def main() -> None:
+        await asyncio.gather(api.cases.get_case(1), api.cases.get_case(2))
+
+    asyncio.run(main())
+    requests = [span for span in tracer.spans if span.name == "testrail_api.request"]
+    assert len(requests) == 2
+    for span in tracer.spans:
+        if span.name != "testrail_api.request":
+            assert span.parent in requests
@@ -0,0 +1,174 @@
+import json
+import socket
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+import pytest
+import requests
+
+from testrail_api import HttpxTransport, NotFoundError, RequestsTransport, Transport, Urllib3Transport
+from testrail_api import TestRailAPI as TRApi
+from testrail_api._exception import TestRailError as TRError
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Answers ``GET get_attachment/*`` with the test image, 404 for ``*/404`` and echoes everything else."""
+
+    def log_message(self, *_) -> None:
+        pass
+
+    def _reply(self, status: int, body: bytes, content_type: str = "application/json") -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _handle(self) -> None:
+        query = urlsplit(self.path).query
+        endpoint, _, params = query.partition("&")
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.requests.append(self)
+        if endpoint.endswith("/404"):
+            self._reply(404, b'{"error": "not found"}')
+        elif endpoint.startswith("/api/v2/get_attachment/"):
+            self._reply(200, self.server.attachment, "image/jpeg")
+        else:
+            echo = {
+                "method": self.command,
+                "endpoint": endpoint,
+                "params": dict(parse_qsl(params)),
+                "headers": {key.lower(): value for key, value in self.headers.items()},
+                "body": body.decode("latin-1"),
+            }
+            self._reply(200, json.dumps(echo).encode())
+
+    do_GET = do_POST = _handle  # noqa: N815
+
+
+@pytest.fixture(scope="module")
+def server(base_path) -> Iterator[ThreadingHTTPServer]:
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.requests = []
+    httpd.attachment = Path(base_path, "attach.jpg").read_bytes()
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+
+
+TRANSPORTS = {"requests": RequestsTransport, "urllib3": Urllib3Transport, "httpx": HttpxTransport}
+
+
+@pytest.fixture(params=TRANSPORTS)
+def transport(request) -> Transport:
+    return TRANSPORTS[request.param]()
+
+
+@pytest.fixture
+def local_api(server, transport) -> TRApi:
+    host, port = server.server_address
+    return TRApi(f"http://{host}:{port}", "example@mail.com", "password", warn_ignore=True, transport=transport)
+
+
+def test_get(local_api):
+    echo = local_api.tests.get_tests(1, status_id=[1, 5], with_data=None)
+    assert echo["method"] == "GET"
+    assert echo["endpoint"] == "/api/v2/get_tests/1"
+    assert echo["params"]["status_id"] == "1,5"
+    assert "with_data" not in echo["params"]
+    assert echo["headers"]["authorization"] == "Basic ZXhhbXBsZUBtYWlsLmNvbTpwYXNzd29yZA=="
+    assert echo["headers"]["user-agent"].startswith("Python TestRail API v:")
+    assert echo["headers"]["content-type"] == "application/json"
+
+
+def test_post(local_api):
+    echo = local_api.results.add_result(1, status_id=1, comment="ok")
+    assert echo["method"] == "POST"
+    assert json.loads(echo["body"]) == {"status_id": 1, "comment": "ok"}
+
+
+def test_not_found(local_api):
+    with pytest.raises(NotFoundError) as exc_info:
+        local_api.runs.get_run(404)
+    assert exc_info.value.content == b'{"error": "not found"}'
+
+
+def test_add_attachment(local_api, base_path):
+    echo = local_api.attachments.add_attachment_to_run(1, Path(base_path, "attach.jpg"))
+    assert echo["headers"]["content-type"].startswith("multipart/form-data; boundary=")
+    assert 'name="attachment"; filename="attach.jpg"' in echo["body"]
+
+
+def test_get_attachment(local_api, server, tmp_path):
+    path = local_api.attachments.get_attachment(1, tmp_path / "attach.jpg")
+    assert path.read_bytes() == server.attachment
+
+
+def test_connection_error_translated(transport):
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    api = TRApi(
+        f"http://127.0.0.1:{port}",
+        "example@mail.com",
+        "password",
+        warn_ignore=True,
+        transport=transport,
+        retry_exceptions=(requests.ConnectionError,),
+    )
+    with pytest.raises(requests.ConnectionError):
+        api.cases.get_case(1)
+
+
+def test_custom_transport(auth_data):
+    class StaticTransport(Transport):
+        """Answers every request with the same body."""
+
+        def setup(self, **settings) -> None:
+            self.settings = settings
+
+        def request(self, method, url, **_) -> requests.Response:
+            response = requests.Response()
+            response.status_code = 200
+            response._content = json.dumps({"method": method, "url": url}).encode()  # noqa: SLF001
+            response.request = requests.Request(method, url).prepare()
+            return response
+
+        def close(self) -> None:
+            pass
+
+    transport = StaticTransport()
+    with TRApi(*auth_data, transport=transport) as api:
+        assert api.cases.get_case(1) == {"method": "GET", "url": f"{auth_data[0]}index.php?/api/v2/get_case/1"}
+    assert transport.settings["auth"] == ("example@mail.com", "password")
+
+
+def test_incomplete_transport():
+    class NoClose(Transport):
+        def setup(self, **settings) -> None:
+            pass
+
+        def request(self, method, url, **_) -> requests.Response:
+            return requests.Response()
+
+    with pytest.raises(TypeError, match="close"):
+        NoClose()
+
+
+def test_session_and_transport(auth_data):
+    with pytest.raises(TRError, match="either session or transport"):
+        TRApi(*auth_data, session=requests.Session(), transport=Urllib3Transport())
+
+
+def test_pool_options_and_transport(auth_data):
+    with pytest.raises(TRError, match="pool options"):
+        TRApi(*auth_data, transport=Urllib3Transport(), pool_maxsize=32)
+
+
+def test_urllib3_transport_not_setup():
+    with pytest.raises(RuntimeError):
+        Urllib3Transport().request("GET", "http://127.0.0.1/", timeout=1)